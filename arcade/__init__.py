@@ -110,16 +110,25 @@ def configure_logging(level: int = None):
 
 from .texture import Matrix3x3
 from .texture import Texture
+from .texture import TextureCache
+from .texture import TexturePreload
 from .texture import cleanup_texture_cache
 from .texture import load_spritesheet
 from .texture import load_texture
+from .texture import load_texture_async
 from .texture import load_texture_pair
 from .texture import load_textures
 from .texture import make_circle_texture
 from .texture import make_soft_circle_texture
 from .texture import make_soft_square_texture
+from .texture import preload_textures
+from .texture import set_hit_box_cache_dir
 from .texture import trim_image
 
+from .asset_bundle import AssetBundle
+from .asset_bundle import load_asset_bundle
+from .asset_bundle import pack_asset_bundle
+
 from .buffered_draw_commands import TShape
 from .buffered_draw_commands import Shape
 from .buffered_draw_commands import ShapeElementList
@@ -174,6 +183,7 @@ def configure_logging(level: int = None):
 
 from .geometry import are_polygons_intersecting
 from .geometry import get_distance
+from .geometry import get_polygon_penetration
 from .geometry import is_point_in_polygon
 
 from .isometric import create_isometric_grid_lines
@@ -224,9 +234,15 @@ def configure_logging(level: int = None):
 from .sprite_list import check_for_collision
 from .sprite_list import check_for_collision_with_list
 from .sprite_list import get_closest_sprite
+from .sprite_list import get_k_nearest_sprites
+from .sprite_list import get_sprites_in_radius
 from .sprite_list import get_sprites_at_exact_point
 from .sprite_list import get_sprites_at_point
+from .sprite_list import get_sprites_at_points
+
+from .occupancy_grid import OccupancyGrid
 
+from .physics_engines import PhysicsEngineKinematic
 from .physics_engines import PhysicsEnginePlatformer
 from .physics_engines import PhysicsEngineSimple
 
@@ -239,6 +255,9 @@ def configure_logging(level: int = None):
 from .text import get_text_image
 from .text import render_text
 
+from .tilemap import StreamingTileLayer
+from .tilemap import TileLayerRenderer
+from .tilemap import create_occupancy_grid
 from .tilemap import get_tilemap_layer
 from .tilemap import process_layer
 from .tilemap import read_tmx
@@ -249,8 +268,21 @@ def configure_logging(level: int = None):
 from .version import VERSION
 
 from .paths import AStarBarrierList
+from .paths import FlowField
+from .paths import HierarchicalPathfinder
+from .paths import PathRequest
+from .paths import PathRequestQueue
 from .paths import astar_calculate_path
+from .paths import astar_grid_path
+from .paths import flow_field_calculate
+from .paths import cast_ray
 from .paths import has_line_of_sight
+from .paths import has_line_of_sight_many
+
+from .navmesh import NavMesh
+from .navmesh import create_navmesh
+from .navmesh import create_navmesh_from_occupancy_grid
+from .navmesh import create_navmesh_from_outline
 
 from .context import ArcadeContext
 
@@ -267,6 +299,7 @@ def configure_logging(level: int = None):
            'AnimatedWalkingSprite',
            'AnimationKeyframe',
            'ArcadeContext',
+           'AssetBundle',
            'Color',
            'CreateText',
            'DEFAULT_FONT_NAMES',
@@ -284,6 +317,8 @@ def configure_logging(level: int = None):
            'FACE_UP',
            'FadeParticle',
            'FilenameOrTexture',
+           'FlowField',
+           'HierarchicalPathfinder',
            'LifetimeParticle',
            'MOUSE_BUTTON_LEFT',
            'MOUSE_BUTTON_MIDDLE',
@@ -291,7 +326,12 @@ def configure_logging(level: int = None):
            'Matrix3x3',
            'NamedPoint',
            'NoOpenGLException',
+           'NavMesh',
+           'OccupancyGrid',
            'Particle',
+           'PathRequest',
+           'PathRequestQueue',
+           'PhysicsEngineKinematic',
            'PhysicsEnginePlatformer',
            'PhysicsEngineSimple',
            'Point',
@@ -309,18 +349,24 @@ def configure_logging(level: int = None):
            'Sprite',
            'SpriteCircle',
            'SpriteList',
+           'StreamingTileLayer',
            'SpriteSolidColor',
            'TShape',
            'Text',
            'Texture',
+           'TextureCache',
+           'TexturePreload',
+           'TileLayerRenderer',
            'VERSION',
            'Vector',
            'View',
            'Window',
            'are_polygons_intersecting',
            'astar_calculate_path',
+           'astar_grid_path',
            'calculate_hit_box_points_detailed',
            'calculate_hit_box_points_simple',
+           'cast_ray',
            'check_for_collision',
            'check_for_collision_with_list',
            'clamp',
@@ -338,6 +384,10 @@ def configure_logging(level: int = None):
            'create_line_strip',
            'create_lines',
            'create_lines_with_colors',
+           'create_navmesh',
+           'create_navmesh_from_occupancy_grid',
+           'create_navmesh_from_outline',
+           'create_occupancy_grid',
            'create_orthogonal_projection',
            'create_polygon',
            'create_rectangle',
@@ -377,6 +427,7 @@ def configure_logging(level: int = None):
            'draw_xywh_rectangle_outline',
            'earclip',
            'finish_render',
+           'flow_field_calculate',
            'get_closest_sprite',
            'get_display_size',
            'get_distance',
@@ -386,26 +437,33 @@ def configure_logging(level: int = None):
            'get_game_controllers',
            'get_image',
            'get_joysticks',
+           'get_k_nearest_sprites',
            'get_pixel',
            'get_points_for_thick_line',
+           'get_polygon_penetration',
            'get_projection',
            'get_rectangle_points',
            'get_scaling_factor',
            'get_screens',
            'get_sprites_at_exact_point',
            'get_sprites_at_point',
+           'get_sprites_at_points',
+           'get_sprites_in_radius',
            'get_text_image',
            'get_tilemap_layer',
            'get_viewport',
            'get_window',
            'has_line_of_sight',
+           'has_line_of_sight_many',
            'is_point_in_polygon',
            'isometric_grid_to_screen',
            'lerp',
            'lerp_vec',
+           'load_asset_bundle',
            'load_sound',
            'load_spritesheet',
            'load_texture',
+           'load_texture_async',
            'load_texture_pair',
            'load_textures',
            'make_burst_emitter',
@@ -415,8 +473,10 @@ def configure_logging(level: int = None):
            'make_soft_square_texture',
            'make_transparent_color',
            'open_window',
+           'pack_asset_bundle',
            'pause',
            'play_sound',
+           'preload_textures',
            'process_layer',
            'quick_run',
            'rand_angle_360_deg',
@@ -434,6 +494,7 @@ def configure_logging(level: int = None):
            'schedule',
            'screen_to_isometric_grid',
            'set_background_color',
+           'set_hit_box_cache_dir',
            'set_viewport',
            'set_window',
            'start_render',
@@ -0,0 +1,252 @@
+"""
+Asset bundles: many textures packed offline into one file, so a game can load
+them at startup without opening, decoding and measuring hundreds of images.
+
+A bundle holds one or more atlas pages of raw RGBA pixels, plus an index with
+the name, location, texture coordinates and precalculated hit box of every
+texture. Create one with :func:`pack_asset_bundle` as part of the build, then
+open it in the game with :func:`load_asset_bundle`.
+
+File layout::
+
+    magic (4 bytes) | version (uint32) | index size (uint32) | index (JSON) | pages (raw RGBA)
+"""
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+import PIL.Image
+
+from arcade.texture import Texture
+from arcade.texture import load_texture
+
+_MAGIC = b"ARCB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sII")
+_PAGE_ALIGNMENT = 16
+
+
+def _pack_rectangles(sizes: List[Tuple[int, int]],
+                     page_size: int,
+                     padding: int) -> List[Tuple[int, int, int]]:
+    """
+    Shelf-pack rectangles onto pages, tallest first.
+
+    :returns: (page, x, y) for each size, in the order given.
+    """
+    positions: List[Tuple[int, int, int]] = [(0, 0, 0)] * len(sizes)
+    page = x = y = shelf_height = 0
+    for index in sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True):
+        width, height = sizes[index]
+        if width > page_size or height > page_size:
+            raise ValueError(f"Texture of {width}x{height} does not fit on a page of {page_size}x{page_size}.")
+        if x + width > page_size:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + height > page_size:
+            page += 1
+            x = y = shelf_height = 0
+        positions[index] = page, x, y
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return positions
+
+
+def pack_asset_bundle(textures: Iterable[Union[str, Path, Texture]],
+                      bundle_path: Union[str, Path],
+                      page_size: int = 2048,
+                      padding: int = 1,
+                      hit_box_algorithm: str = "Simple",
+                      hit_box_detail: float = 4.5):
+    """
+    Pack textures into an asset bundle file. This is meant to run offline, for
+    example from a build script, since it does all the work the game then skips.
+
+    Textures can be given as file names, which are loaded with
+    :func:`load_texture`, or as :class:`Texture` objects, for example the ones
+    returned by :func:`load_spritesheet`. A texture is found in the bundle
+    under its file name, or the name of the texture object.
+
+    :param textures: Image files and textures to pack.
+    :param bundle_path: File to write the bundle to.
+    :param int page_size: Width and height limit of an atlas page in pixels.
+    :param int padding: Pixels to leave empty between textures on a page.
+    :param str hit_box_algorithm: Hit box algorithm for textures loaded from file names.
+    :param float hit_box_detail: Used with 'Detailed' to hit box.
+    """
+    names = []
+    texture_list = []
+    for texture in textures:
+        if isinstance(texture, Texture):
+            names.append(texture.name)
+        else:
+            names.append(str(texture))
+            texture = load_texture(texture,
+                                   hit_box_algorithm=hit_box_algorithm,
+                                   hit_box_detail=hit_box_detail)
+        texture_list.append(texture)
+
+    images = [texture.image.convert("RGBA") for texture in texture_list]
+    positions = _pack_rectangles([image.size for image in images], page_size, padding)
+
+    # Make every page just big enough for what's on it
+    page_count = max((page for page, _, _ in positions), default=-1) + 1
+    page_sizes = [[0, 0] for _ in range(page_count)]
+    for image, (page, x, y) in zip(images, positions):
+        page_sizes[page][0] = max(page_sizes[page][0], x + image.width)
+        page_sizes[page][1] = max(page_sizes[page][1], y + image.height)
+
+    pages = [PIL.Image.new("RGBA", tuple(size)) for size in page_sizes]
+    entries = []
+    for name, texture, image, (page, x, y) in zip(names, texture_list, images, positions):
+        pages[page].paste(image, (x, y))
+        page_width, page_height = page_sizes[page]
+        entries.append({
+            "name": name,
+            "page": page,
+            "rect": [x, y, image.width, image.height],
+            "uv": [x / page_width, y / page_height, image.width / page_width, image.height / page_height],
+            "hit_box_algorithm": texture._hit_box_algorithm,
+            "hit_box_points": [list(point) for point in texture.hit_box_points],
+        })
+
+    # Pixel data starts aligned after the index, each page follows the previous one
+    page_entries = []
+    offset = 0
+    for page in pages:
+        page_entries.append({"size": list(page.size), "offset": offset})
+        offset += page.width * page.height * 4
+
+    index = json.dumps({"pages": page_entries, "textures": entries}).encode()
+    data_start = _HEADER.size + len(index)
+    data_start += -data_start % _PAGE_ALIGNMENT
+
+    with open(bundle_path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, len(index)))
+        file.write(index)
+        file.write(b"\0" * (data_start - _HEADER.size - len(index)))
+        for page in pages:
+            file.write(page.tobytes())
+
+
+class AssetBundle:
+    """
+    An asset bundle opened with :func:`load_asset_bundle`.
+
+    The pixel data stays memory-mapped; pages and textures are created from it
+    without decoding any image files. Call :meth:`close` when done with the
+    bundle.
+
+    :param bundle_path: Bundle file to open.
+    """
+    def __init__(self, bundle_path: Union[str, Path]):
+        # Copy-on-write, so the pixels can be handed to GL as a writable buffer without copying
+        with open(bundle_path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, index_size = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{bundle_path} is not an asset bundle.")
+        if version != _VERSION:
+            raise ValueError(f"Asset bundle {bundle_path} has version {version}, expected {_VERSION}.")
+
+        index = json.loads(self._mmap[_HEADER.size:_HEADER.size + index_size])
+        data_start = _HEADER.size + index_size
+        data_start += -data_start % _PAGE_ALIGNMENT
+
+        self._page_data: List[memoryview] = []
+        self.pages: List[PIL.Image.Image] = []
+        for page in index["pages"]:
+            width, height = page["size"]
+            start = data_start + page["offset"]
+            data = memoryview(self._mmap)[start:start + width * height * 4]
+            self._page_data.append(data)
+            # Shares the memory of the mapping, no copy or decode
+            self.pages.append(PIL.Image.frombuffer("RGBA", (width, height), data, "raw", "RGBA", 0, 1))
+
+        self._entries = {entry["name"]: entry for entry in index["textures"]}
+        self._textures: Dict[str, Texture] = {}
+
+    @property
+    def names(self) -> List[str]:
+        """ Names of the textures in the bundle. """
+        return list(self._entries)
+
+    def get_region(self, name: str) -> Tuple[int, int, int, int, int]:
+        """
+        Where a texture is in the bundle.
+
+        :param str name: Name of the texture.
+        :returns: (page, x, y, width, height) in pixels.
+        """
+        entry = self._entries[name]
+        return (entry["page"], *entry["rect"])
+
+    def get_uv(self, name: str) -> Tuple[float, float, float, float]:
+        """
+        Texture coordinates of a texture on its page.
+
+        :param str name: Name of the texture.
+        :returns: (x, y, width, height), from 0.0 to 1.0. y is measured from the top.
+        """
+        return tuple(self._entries[name]["uv"])  # type: ignore
+
+    def get_texture(self, name: str) -> Texture:
+        """
+        Get a texture from the bundle. Its hit box comes precalculated.
+
+        :param str name: Name of the texture, as given when packing.
+        """
+        texture = self._textures.get(name)
+        if texture is None:
+            entry = self._entries[name]
+            x, y, width, height = entry["rect"]
+            image = self.pages[entry["page"]].crop((x, y, x + width, y + height))
+            texture = Texture(name, image, hit_box_algorithm=entry["hit_box_algorithm"])
+            texture._hit_box_points = tuple(tuple(point) for point in entry["hit_box_points"])
+            self._textures[name] = texture
+        return texture
+
+    def get_textures(self) -> List[Texture]:
+        """ Get all textures in the bundle, in packing order. """
+        return [self.get_texture(name) for name in self._entries]
+
+    def create_gl_texture(self, ctx, page: int):
+        """
+        Upload an atlas page straight from the mapped file to a GL texture.
+
+        :param ctx: The :class:`arcade.gl.Context` to create the texture in.
+        :param int page: Page number.
+        :rtype: arcade.gl.Texture
+        """
+        return ctx.texture(self.pages[page].size, components=4, data=self._page_data[page])
+
+    def close(self):
+        """
+        Release the memory-mapped file. Textures already taken from the
+        bundle stay usable; pages do not.
+        """
+        self.pages = []
+        for data in self._page_data:
+            data.release()
+        self._page_data = []
+        self._mmap.close()
+
+
+def load_asset_bundle(bundle_path: Union[str, Path]) -> AssetBundle:
+    """
+    Open an asset bundle made with :func:`pack_asset_bundle`.
+
+    .. code-block:: python
+
+        bundle = arcade.load_asset_bundle("sprites.bundle")
+        player = arcade.Sprite()
+        player.texture = bundle.get_texture(":resources:images/animated_characters/robot/robot_idle.png")
+
+    :param bundle_path: Bundle file to open.
+    :returns: :class:`AssetBundle`
+    """
+    return AssetBundle(bundle_path)
@@ -4,6 +4,8 @@
 
 import math
 
+import numpy as np
+
 import pymunkoptions
 pymunkoptions.options["debug"] = False
 import pymunk
@@ -133,90 +135,33 @@ def calculate_hit_box_points_simple(image):
     :Returns: List of points
 
     """
-    left_border = 0
-    good = True
-    while good and left_border < image.width:
-        for row in range(image.height):
-            pos = (left_border, row)
-            pixel = image.getpixel(pos)
-            if type(pixel) is int or len(pixel) != 4:
-                raise TypeError("Error, calculate_points called on image not in RGBA format")
-            else:
-                if pixel[3] != 0:
-                    good = False
-                    break
-        if good:
-            left_border += 1
-
-    right_border = image.width - 1
-    good = True
-    while good and right_border > 0:
-        for row in range(image.height):
-            pos = (right_border, row)
-            pixel = image.getpixel(pos)
-            if pixel[3] != 0:
-                good = False
-                break
-        if good:
-            right_border -= 1
-
-    top_border = 0
-    good = True
-    while good and top_border < image.height:
-        for column in range(image.width):
-            pos = (column, top_border)
-            pixel = image.getpixel(pos)
-            if pixel[3] != 0:
-                good = False
-                break
-        if good:
-            top_border += 1
-
-    bottom_border = image.height - 1
-    good = True
-    while good and bottom_border > 0:
-        for column in range(image.width):
-            pos = (column, bottom_border)
-            pixel = image.getpixel(pos)
-            if pixel[3] != 0:
-                good = False
-                break
-        if good:
-            bottom_border -= 1
+    if len(image.getbands()) != 4:
+        raise TypeError("Error, calculate_points called on image not in RGBA format")
+
+    alpha = np.asarray(image)[:, :, 3]
+    rows, columns = np.nonzero(alpha)
 
     # If the image is empty, return an empty set
+    if len(rows) == 0:
+        return []
+
+    left_border = int(columns.min())
+    right_border = int(columns.max())
+    top_border = int(rows.min())
+    bottom_border = int(rows.max())
+
     if bottom_border == 0:
         return []
 
-    def _check_corner_offset(start_x, start_y, x_direction, y_direction):
-
-        bad = False
-        offset = 0
-        while not bad:
-            y = start_y + (offset * y_direction)
-            x = start_x
-            for count in range(offset + 1):
-                my_pixel = image.getpixel((x, y))
-                # print(f"({x}, {y}) = {pixel} | ", end="")
-                if my_pixel[3] != 0:
-                    bad = True
-                    break
-                y -= y_direction
-                x += x_direction
-            # print(f" - {bad}")
-            if not bad:
-                offset += 1
-        # print(f"offset: {offset}")
-        return offset
+    # How far in a corner can be cut diagonally before hitting a solid pixel
+    top_left_corner_offset = int(((columns - left_border) + (rows - top_border)).min())
+    top_right_corner_offset = int(((right_border - columns) + (rows - top_border)).min())
+    bottom_left_corner_offset = int(((columns - left_border) + (bottom_border - rows)).min())
+    bottom_right_corner_offset = int(((right_border - columns) + (bottom_border - rows)).min())
 
     def _r(point, height, width):
         return point[0] - width / 2, (height - point[1]) - height / 2
 
-    top_left_corner_offset = _check_corner_offset(left_border, top_border, 1, 1)
-    top_right_corner_offset = _check_corner_offset(right_border, top_border, -1, 1)
-    bottom_left_corner_offset = _check_corner_offset(left_border, bottom_border, 1, -1)
-    bottom_right_corner_offset = _check_corner_offset(right_border, bottom_border, -1, -1)
-
     p1 = left_border + top_left_corner_offset, top_border
     p2 = (right_border + 1) - top_right_corner_offset, top_border
     p3 = (right_border + 1), top_border + top_right_corner_offset
@@ -265,6 +210,8 @@ def calculate_hit_box_points_detailed(image: Image, hit_box_detail: float = 4.5)
 
     """
 
+    alpha = np.asarray(image)[:, :, 3]
+
     def sample_func(sample_point):
         """ Method used to sample image. """
         if sample_point[0] < 0 \
@@ -273,9 +220,7 @@ def sample_func(sample_point):
                 or sample_point[1] >= image.height:
             return 0
 
-        point_tuple = sample_point[0], sample_point[1]
-        color = image.getpixel(point_tuple)
-        if color[3] > 0:
+        if alpha[int(sample_point[1]), int(sample_point[0])] > 0:
             return 255
         else:
             return 0
@@ -0,0 +1,73 @@
+"""
+A* Path Finding Stress Test
+
+Times astar_calculate_path against astar_grid_path, with and without Jump
+Point Search, on ever bigger grids with randomly placed walls.
+
+If Python and Arcade are installed, this example can be run from the command line with:
+python -m arcade.examples.perf_test.stress_test_astar
+"""
+
+import csv
+import random
+import timeit
+
+import arcade
+
+GRID_SIZE = 32
+WALL_CHANCE = 0.2
+SEARCHES = 5
+
+START_SIZE = 10
+STOP_SIZE = 70
+SIZE_INCREMENT = 20
+
+RESULTS_FILE = "stress_test_astar.csv"
+
+
+def make_barrier_list(size: int) -> arcade.AStarBarrierList:
+    """ Square playing field of `size` cells with random walls, open at the corners. """
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for x in range(size):
+        for y in range(size):
+            if random.random() < WALL_CHANCE and 1 < x + y < 2 * size - 3:
+                wall = arcade.SpriteSolidColor(GRID_SIZE, GRID_SIZE, arcade.color.BLACK)
+                wall.position = x * GRID_SIZE, y * GRID_SIZE
+                wall_list.append(wall)
+
+    mover = arcade.SpriteSolidColor(GRID_SIZE - 2, GRID_SIZE - 2, arcade.color.RED)
+    return arcade.AStarBarrierList(mover, wall_list, GRID_SIZE,
+                                   0, (size - 1) * GRID_SIZE, 0, (size - 1) * GRID_SIZE)
+
+
+def time_searches(search) -> float:
+    """ Average time of a search, in milliseconds. """
+    return timeit.timeit(search, number=SEARCHES) / SEARCHES * 1000
+
+
+def main():
+    random.seed(1)
+    results = [("cells", "astar_calculate_path ms", "astar_grid_path ms", "jump point search ms", "old found path")]
+    for size in range(START_SIZE, STOP_SIZE + 1, SIZE_INCREMENT):
+        barrier_list = make_barrier_list(size)
+        cost_grid = barrier_list.get_cost_grid()
+        end_point = (size - 1) * GRID_SIZE, (size - 1) * GRID_SIZE
+        end_cell = size - 1, size - 1
+
+        found = arcade.astar_calculate_path((0, 0), end_point, barrier_list) is not None
+        old_time = time_searches(lambda: arcade.astar_calculate_path((0, 0), end_point, barrier_list))
+        new_time = time_searches(lambda: arcade.astar_grid_path((0, 0), end_cell, cost_grid))
+        jps_time = time_searches(lambda: arcade.astar_grid_path((0, 0), end_cell, cost_grid,
+                                                                jump_point_search=True))
+
+        print(f"{size:4}x{size:<4} old: {old_time:8.2f}ms  heap: {new_time:8.2f}ms  "
+              f"jps: {jps_time:8.2f}ms  old found path: {found}")
+        results.append((size * size, old_time, new_time, jps_time, found))
+
+    with open(RESULTS_FILE, "w", newline="") as results_file:
+        writer = csv.writer(results_file)
+        writer.writerows(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Kinematic Physics Stress Test
+
+Times moving ever more sprites around a maze of walls, with a
+PhysicsEngineSimple for each sprite against one PhysicsEngineKinematic
+for all of them.
+
+If Python and Arcade are installed, this example can be run from the command line with:
+python -m arcade.examples.perf_test.stress_test_kinematic
+"""
+
+import random
+import timeit
+
+import arcade
+
+GRID_SIZE = 32
+MAP_SIZE = 100
+WALL_CHANCE = 0.1
+MAX_SPEED = 6
+FRAMES = 20
+
+START_COUNT = 100
+STOP_COUNT = 1000
+COUNT_INCREMENT = 300
+
+
+def make_walls() -> arcade.SpriteList:
+    """ Border around the map, and walls scattered inside it. """
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for x in range(MAP_SIZE):
+        for y in range(MAP_SIZE):
+            if x in (0, MAP_SIZE - 1) or y in (0, MAP_SIZE - 1) or random.random() < WALL_CHANCE:
+                wall = arcade.SpriteSolidColor(GRID_SIZE, GRID_SIZE, arcade.color.BLACK)
+                wall.position = x * GRID_SIZE, y * GRID_SIZE
+                wall_list.append(wall)
+    return wall_list
+
+
+def make_movers(wall_list: arcade.SpriteList, count: int) -> arcade.SpriteList:
+    """ Sprites in the open, each going its own way. """
+    sprite_list = arcade.SpriteList()
+    while len(sprite_list) < count:
+        sprite = arcade.SpriteSolidColor(GRID_SIZE // 2, GRID_SIZE // 2, arcade.color.RED)
+        sprite.position = (random.uniform(GRID_SIZE, (MAP_SIZE - 2) * GRID_SIZE),
+                           random.uniform(GRID_SIZE, (MAP_SIZE - 2) * GRID_SIZE))
+        if not arcade.check_for_collision_with_list(sprite, wall_list):
+            sprite.change_x = random.uniform(-MAX_SPEED, MAX_SPEED)
+            sprite.change_y = random.uniform(-MAX_SPEED, MAX_SPEED)
+            sprite_list.append(sprite)
+    return sprite_list
+
+
+def main():
+    random.seed(1)
+    wall_list = make_walls()
+    for count in range(START_COUNT, STOP_COUNT + 1, COUNT_INCREMENT):
+        random.seed(count)
+        sprite_list = make_movers(wall_list, count)
+        engines = [arcade.PhysicsEngineSimple(sprite, wall_list) for sprite in sprite_list]
+        single_time = timeit.timeit(lambda: [engine.update() for engine in engines], number=FRAMES) / FRAMES
+
+        random.seed(count)
+        sprite_list = make_movers(wall_list, count)
+        engine = arcade.PhysicsEngineKinematic(sprite_list, wall_list)
+        batch_time = timeit.timeit(engine.update, number=FRAMES) / FRAMES
+
+        print(f"{count:5} sprites  engine per sprite: {single_time * 1000:8.2f}ms  "
+              f"kinematic engine: {batch_time * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Tile Layer Loading Stress Test
+
+Times how long it takes to turn ever bigger tile layers into sprites. The
+layers are made by repeating the platforms layer of one of the example maps.
+
+If Python and Arcade are installed, this example can be run from the command line with:
+python -m arcade.examples.perf_test.stress_test_tilemap_arcade
+"""
+
+import csv
+import timeit
+
+import arcade
+
+MAP_NAME = ":resources:tmx_maps/map_with_ladders.tmx"
+LAYER_NAME = "Platforms"
+
+# Width and height of the layer, in copies of the original layer
+START_REPEAT = 1
+STOP_REPEAT = 16
+REPEAT_INCREMENT = 3
+
+RESULTS_FILE = "stress_test_tilemap_arcade.csv"
+
+
+def repeat_layer(tile_map, layer_name, repeat):
+    """ Make the layer `repeat` times as wide and as high. """
+    layer = arcade.get_tilemap_layer(tile_map, layer_name)
+    layer.layer_data = [row * repeat for row in layer.layer_data] * repeat
+    tile_map.map_size = arcade.tilemap.pytiled_parser.objects.Size(len(layer.layer_data[0]),
+                                                                   len(layer.layer_data))
+
+
+def main():
+    results = []
+    for repeat in range(START_REPEAT, STOP_REPEAT + 1, REPEAT_INCREMENT):
+        tile_map = arcade.read_tmx(MAP_NAME)
+        repeat_layer(tile_map, LAYER_NAME, repeat)
+
+        start_time = timeit.default_timer()
+        sprite_list = arcade.process_layer(tile_map, LAYER_NAME)
+        load_time = timeit.default_timer() - start_time
+
+        tile_count = len(sprite_list)
+        print(f"{tile_count:8} tiles: {load_time:.3f}s, {load_time / tile_count * 1_000_000:.1f}us per tile")
+        results.append((repeat, tile_count, load_time))
+
+    with open(RESULTS_FILE, "w", newline="") as results_file:
+        writer = csv.writer(results_file)
+        writer.writerows(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 Functions for calculating geometry.
 """
 
-from typing import cast
+from typing import Optional, Tuple, cast
 from arcade import PointList
 import math
 
@@ -55,6 +55,50 @@ def are_polygons_intersecting(poly_a: PointList,
     return True
 
 
+def get_polygon_penetration(poly_a: PointList,
+                            poly_b: PointList) -> Optional[Tuple[float, float]]:
+    """
+    Find the minimum translation vector of two overlapping convex polygons:
+    the shortest move that takes the first polygon out of the second.
+    Like :func:`are_polygons_intersecting`, polygons that only touch don't overlap.
+
+    :param PointList poly_a: List of points that define the polygon to move.
+    :param PointList poly_b: List of points that define the other polygon.
+    :Returns: (x, y) to move the first polygon by, or None if they don't overlap.
+    """
+    shortest = None
+    result = None
+    for polygon in (poly_a, poly_b):
+        for i1 in range(len(polygon)):
+            i2 = (i1 + 1) % len(polygon)
+            normal_x = polygon[i2][1] - polygon[i1][1]
+            normal_y = polygon[i1][0] - polygon[i2][0]
+            length = math.hypot(normal_x, normal_y)
+            if length == 0:
+                continue
+            normal_x /= length
+            normal_y /= length
+
+            projected_a = [normal_x * point[0] + normal_y * point[1] for point in poly_a]
+            projected_b = [normal_x * point[0] + normal_y * point[1] for point in poly_b]
+            min_a, max_a = min(projected_a), max(projected_a)
+            min_b, max_b = min(projected_b), max(projected_b)
+            if max_a <= min_b or max_b <= min_a:
+                return None
+
+            # Push back along the normal, or forward, whichever is shorter
+            if max_a - min_b < max_b - min_a:
+                depth = max_a - min_b
+                normal_x, normal_y = -normal_x, -normal_y
+            else:
+                depth = max_b - min_a
+            if shortest is None or depth < shortest:
+                shortest = depth
+                result = normal_x * depth, normal_y * depth
+
+    return result
+
+
 def is_point_in_polygon(x, y, polygon_point_list):
     """
     Use ray-tracing to see if point is inside a polygon
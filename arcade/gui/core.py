@@ -145,6 +145,13 @@ def render(self):
         """
         raise NotImplementedError()
 
+    def on_draw(self):
+        """
+        Callback after the :py:class:`arcade.gui.UIManager` has drawn all elements,
+        can be used to draw additional content on top of the element.
+        """
+        pass
+
     def on_ui_event(self, event: UIEvent):
         """
         Callback for a :py:class:`arcade.gui.UIEvent`, triggered through pyglet.EventDispatcher
@@ -1,11 +1,10 @@
 from typing import Optional
-from uuid import uuid4
 
 import arcade
 
 from arcade.gui import UIClickable
 from arcade.gui.ui_style import UIStyle
-from arcade.gui.utils import render_text_image
+from arcade.gui.utils import render_text_image, get_cached_texture, freeze_value
 
 
 class UIAbstractFlatButton(UIClickable):
@@ -84,59 +83,36 @@ def render(self):
 
         vmargin = self.style_attr('vmargin', 0)
         height = self.height if self.height else font_size + vmargin
-
-        text_image_normal = render_text_image(
-            self.text,
-            font_size=font_size,
-            font_name=font_name,
-            align=self.align,
-            valign='middle',
-            bg_image=None,
-            width=int(self.width),
-            height=height,
-            indent=0,
-
-            font_color=font_color,
-            border_width=border_width,
-            border_color=border_color,
-            bg_color=bg_color,
-        )
-        text_image_hover = render_text_image(
-            self.text,
-            font_size=font_size,
-            font_name=font_name,
-            align=self.align,
-            valign='middle',
-            bg_image=None,
-            width=int(self.width),
-            height=height,
-            indent=0,
-
-            font_color=font_color_hover,
-            border_width=border_width,
-            border_color=border_color_hover,
-            bg_color=bg_color_hover,
-        )
-        text_image_press = render_text_image(
-            self.text,
-            font_size=font_size,
-            font_name=font_name,
-            align=self.align,
-            valign='middle',
-            bg_image=None,
-            width=int(self.width),
-            height=height,
-            indent=0,
-
-            font_color=font_color_press,
-            border_width=border_width,
-            border_color=border_color_press,
-            bg_color=bg_color_press,
-        )
-
-        self.normal_texture = arcade.Texture(image=text_image_normal, name=str(uuid4()))
-        self.hover_texture = arcade.Texture(image=text_image_hover, name=str(uuid4()))
-        self.press_texture = arcade.Texture(image=text_image_press, name=str(uuid4()))
+        width = int(self.width)
+
+        def texture(font_color, border_color, bg_color):
+            key = ('flatbutton', self.text, self.align, width, height,
+                   freeze_value(font_name), font_size, border_width,
+                   freeze_value(font_color), freeze_value(border_color), freeze_value(bg_color))
+
+            def render():
+                return render_text_image(
+                    self.text,
+                    font_size=font_size,
+                    font_name=font_name,
+                    align=self.align,
+                    valign='middle',
+                    bg_image=None,
+                    width=width,
+                    height=height,
+                    indent=0,
+
+                    font_color=font_color,
+                    border_width=border_width,
+                    border_color=border_color,
+                    bg_color=bg_color,
+                )
+
+            return get_cached_texture(key, render)
+
+        self.normal_texture = texture(font_color, border_color, bg_color)
+        self.hover_texture = texture(font_color_hover, border_color_hover, bg_color_hover)
+        self.press_texture = texture(font_color_press, border_color_press, bg_color_press)
 
 
 class UIFlatButton(UIAbstractFlatButton):
@@ -1,5 +1,4 @@
 from typing import Optional
-from uuid import uuid4
 
 import arcade
 from arcade import Texture
@@ -74,31 +73,25 @@ def render_with_text(self, text: str):
         if not font_color_press:
             font_color_press = font_color_hover
 
-        normal_image = utils.get_image_with_text(text,
-                                                 background_image=self._normal_texture.image,
+        def texture(background: Texture, font_color):
+            key = ('imagebutton', text, background.name, background.width, background.height,
+                   font_size, utils.freeze_value(font_color))
+
+            def render():
+                return utils.get_image_with_text(text,
+                                                 background_image=background.image,
                                                  font_color=font_color,
                                                  font_size=font_size,
                                                  align='center',
                                                  valign='middle'
                                                  )
-        self.normal_texture = Texture(str(uuid4()), image=normal_image)
+
+            return utils.get_cached_texture(key, render)
+
+        self.normal_texture = texture(self._normal_texture, font_color)
 
         if self._hover_texture:
-            hover_image = utils.get_image_with_text(text,
-                                                    background_image=self._hover_texture.image,
-                                                    font_color=font_color_hover,
-                                                    font_size=font_size,
-                                                    align='center',
-                                                    valign='middle'
-                                                    )
-            self.hover_texture = Texture(str(uuid4()), image=hover_image)
+            self.hover_texture = texture(self._hover_texture, font_color_hover)
 
         if self._press_texture:
-            press_image = utils.get_image_with_text(text,
-                                                    background_image=self._press_texture.image,
-                                                    font_color=font_color_press,
-                                                    font_size=font_size,
-                                                    align='center',
-                                                    valign='middle'
-                                                    )
-            self.press_texture = Texture(str(uuid4()), image=press_image)
+            self.press_texture = texture(self._press_texture, font_color_press)
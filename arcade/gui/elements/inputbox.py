@@ -1,12 +1,14 @@
-from typing import Optional
-from uuid import uuid4
+from os.path import commonprefix
+from typing import Optional, List, Dict, Tuple
 
+import PIL.Image
 from PIL import ImageDraw
 
 import arcade
+from arcade import Color, SpriteList, Texture
 from arcade.gui import UIEvent, TEXT_INPUT, TEXT_MOTION, UIClickable
 from arcade.gui.ui_style import UIStyle
-from arcade.gui.utils import get_text_image
+from arcade.gui.utils import get_cached_texture, freeze_value, render_glyph_image
 from arcade.key import (
     MOTION_UP,
     MOTION_RIGHT,
@@ -108,6 +110,13 @@ class UIInputBox(UIClickable):
     Provides an input field for the user. If it gets focus, user clicks on it,
     it will show a cursor and will react to keystrokes, changing the text and cursor position.
 
+    The text is drawn from cached glyph textures, a keystroke only updates the glyphs
+    from the cursor position to the end of the text and the blinking cursor is a separate sprite.
+    The glyphs are drawn by :py:meth:`on_draw`, after the :py:class:`arcade.gui.UIManager` has
+    drawn all elements, so the text shows on top of elements overlapping the input box.
+
+    Without a width, the box is as wide as its text and grows and shrinks with it.
+
     Style attributes:
     * font_name
     * font_size
@@ -126,6 +135,8 @@ class UIInputBox(UIClickable):
     """
 
     ENTER = 'ENTER'
+    #: Seconds between cursor blinks
+    CURSOR_BLINK_INTERVAL = 0.5
 
     def __init__(self,
                  center_x=0,
@@ -139,7 +150,7 @@ def __init__(self,
         """
         :param center_x: center X of element
         :param center_y: center y of element
-        :param width: width of element
+        :param width: width of element, 0 to fit the box to the text
         :param height: height of element
         :param text: text
         :param id: id of :py:class:`arcade.gui.UIElement`
@@ -158,10 +169,28 @@ def __init__(self,
 
         self.width = width if width is not None else 200
         self.height = height
+        self._fit_width = not self.width
 
         self.symbol = '|'
         self.text_adapter = _KeyAdapter(text)
 
+        # glyph sprites, index 0 is the cursor, followed by one sprite per character
+        self._glyphs: SpriteList = SpriteList(use_spatial_hash=False)
+        self._cursor = arcade.Sprite()
+        self._glyphs.append(self._cursor)
+        # x offset of each character relative to the start of the text, one more entry than characters
+        self._glyph_offsets: List[float] = [0]
+        self._glyph_count = 0
+        self._glyph_origin: Optional[Tuple[float, float, float]] = None
+        self._font_name = None
+        self._font_size = 0
+        self._font_colors: Dict[str, Color] = {}
+        self._margin_left = 0
+        self._border_width = 0
+
+        self._cursor_on = True
+        self._blink_time = 0.0
+
         self.normal_texture = None
         self.hover_texture = None
         self.focus_texture = None
@@ -189,68 +218,166 @@ def render(self):
         bg_color_hover = self.style_attr('bg_color_hover', arcade.color.GRAY)
         bg_color_focus = self.style_attr('bg_color_focus', arcade.color.GRAY)
 
+        self._font_name = font_name
+        self._font_size = font_size
+        self._margin_left = self.style_attr('margin_left', 10)
+        self._border_width = border_width
+        if self._fit_width:
+            self.width = self._get_text_box_width()
+
         width = int(self.width)
         vmargin = self.style_attr('vmargin', 0)
-        height = self.height if self.height else font_size + vmargin
-
-        align = "left"
-        margin_left = self.style_attr('margin_left', 10)
-
-        # text
-        text_image_normal = get_text_image(text=self.text,
-                                           font_color=font_color,
-                                           font_size=font_size,
-                                           font_name=font_name,
-                                           align=align,
-                                           width=width,
-                                           height=height,
-                                           valign='middle',
-                                           indent=margin_left,
-                                           background_color=bg_color
-                                           )
-        text_image_hover = get_text_image(text=self.text,
-                                          font_color=font_color_hover,
-                                          font_size=font_size,
-                                          font_name=font_name,
-                                          align=align,
-                                          width=width,
-                                          height=height,
-                                          valign='middle',
-                                          indent=margin_left,
-                                          background_color=bg_color_hover
-                                          )
-
-        text_to_show = self.text[:self.cursor_index] + self.symbol + self.text[self.cursor_index:]
-        text_image_focus = get_text_image(text=text_to_show,
-                                          font_color=font_color_focus,
-                                          font_size=font_size,
-                                          font_name=font_name,
-                                          align=align,
-                                          width=width,
-                                          height=height,
-                                          valign='middle',
-                                          indent=margin_left,
-                                          background_color=bg_color_focus
-                                          )
-
-        # draw outline
-        rect = [0, 0, text_image_normal.width - border_width / 2, text_image_normal.height - border_width / 2]
-
-        if border_color and border_width:
-            d = ImageDraw.Draw(text_image_normal)
-            d.rectangle(rect, fill=None, outline=border_color, width=border_width)
-
-        if border_color_hover:
-            d = ImageDraw.Draw(text_image_hover)
-            d.rectangle(rect, fill=None, outline=border_color_hover, width=border_width)
-
-        if border_color_focus:
-            d = ImageDraw.Draw(text_image_focus)
-            d.rectangle(rect, fill=None, outline=border_color_focus, width=border_width)
-
-        self.normal_texture = arcade.Texture(image=text_image_normal, name=str(uuid4()))
-        self.hover_texture = arcade.Texture(image=text_image_hover, name=str(uuid4()))
-        self.focus_texture = arcade.Texture(image=text_image_focus, name=str(uuid4()))
+        height = int(self.height if self.height else font_size + vmargin)
+
+        def texture(border_color, bg_color):
+            key = ('inputbox', width, height, border_width, freeze_value(border_color), freeze_value(bg_color))
+
+            def render():
+                image = PIL.Image.new('RGBA', (width, height), bg_color)
+
+                # draw outline
+                if border_color and border_width:
+                    rect = [0, 0, image.width - border_width / 2, image.height - border_width / 2]
+                    d = ImageDraw.Draw(image)
+                    d.rectangle(rect, fill=None, outline=border_color, width=border_width)
+
+                return image
+
+            return get_cached_texture(key, render)
+
+        # only rgb, alpha of the glyph sprites is used to hide them
+        self._font_colors = {
+            'normal': tuple(font_color[:3]),
+            'hover': tuple(font_color_hover[:3]),
+            'focus': tuple(font_color_focus[:3]),
+        }
+
+        self.normal_texture = texture(border_color, bg_color)
+        self.hover_texture = texture(border_color_hover, bg_color_hover)
+        self.focus_texture = texture(border_color_focus, bg_color_focus)
+
+        self._update_glyphs(0)
+
+    def _get_text_box_width(self) -> int:
+        """
+        Width of a box that fits the text, with the left margin on both sides
+        and room for the cursor.
+        """
+        text_width = sum(self._glyph_texture(char).width for char in self.text + self.symbol)
+        return int(text_width + self._margin_left + 2 * self._border_width)
+
+    def _fit_to_text(self) -> bool:
+        """
+        Renders the box again if it has no width of its own and the text got wider or narrower.
+
+        :return: True if the box was rendered again
+        """
+        if self._fit_width and self._get_text_box_width() != int(self.width):
+            self.render()
+            self.set_proper_texture()
+            return True
+        return False
+
+    def _glyph_texture(self, char: str) -> Texture:
+        key = ('glyph', char, freeze_value(self._font_name), self._font_size)
+        return get_cached_texture(key,
+                                  lambda: render_glyph_image(char, self._font_size, self._font_name),
+                                  hit_box_algorithm="None")
+
+    def _font_color(self) -> Color:
+        if self.focused:
+            return self._font_colors['focus']
+        elif self.hovered:
+            return self._font_colors['hover']
+        else:
+            return self._font_colors['normal']
+
+    def _update_glyphs(self, start: int):
+        """
+        Updates the glyph sprites of all characters from `start` to the end of the text.
+        """
+        text = self.text
+        start = max(0, min(start, len(text), len(self._glyph_offsets) - 1))
+
+        origin = (self.center_x, self.center_y, self.width)
+        if origin != self._glyph_origin:
+            # element was moved or resized, everything has to be placed again
+            self._glyph_origin = origin
+            start = 0
+
+        left = self.center_x - self.width / 2 + self._margin_left / 2
+        max_width = self.width - self._margin_left / 2
+        color = self._font_color()
+
+        offsets = self._glyph_offsets
+        del offsets[start + 1:]
+
+        glyphs = self._glyphs
+        for index in range(start, len(text)):
+            texture = self._glyph_texture(text[index])
+            offset = offsets[index]
+            offsets.append(offset + texture.width)
+
+            if index + 1 < len(glyphs):
+                sprite = glyphs[index + 1]
+            else:
+                sprite = arcade.Sprite()
+                glyphs.append(sprite)
+
+            sprite.texture = texture
+            sprite.set_position(left + offset + texture.width / 2, self.center_y)
+            sprite.color = color
+            # hide glyphs outside of the box
+            sprite.alpha = 255 if offset + texture.width <= max_width else 0
+
+        # hide glyphs no longer used, they are kept for the next keystrokes
+        for index in range(len(text), self._glyph_count):
+            glyphs[index + 1].alpha = 0
+        self._glyph_count = len(text)
+
+        self._update_cursor()
+
+    def _update_cursor(self):
+        """
+        Places the cursor sprite, no text is rendered.
+        """
+        texture = self._glyph_texture(self.symbol)
+        offset = self._glyph_offsets[min(self.cursor_index, len(self._glyph_offsets) - 1)]
+
+        left = self.center_x - self.width / 2 + self._margin_left / 2
+        cursor = self._cursor
+        cursor.texture = texture
+        cursor.set_position(left + offset, self.center_y)
+        cursor.color = self._font_colors['focus']
+
+        visible = self.focused and self._cursor_on and offset <= self.width - self._margin_left / 2
+        cursor.alpha = 255 if visible else 0
+
+    def set_proper_texture(self):
+        super().set_proper_texture()
+
+        # retint the glyphs, the glyph textures stay the same
+        if self._font_colors:
+            color = self._font_color()
+            for sprite in self._glyphs[1:self._glyph_count + 1]:
+                sprite.color = color
+            self._update_cursor()
+
+    def on_update(self, delta_time: float = 1 / 60):
+        if not self.focused:
+            return
+
+        self._blink_time += delta_time
+        if self._blink_time >= self.CURSOR_BLINK_INTERVAL:
+            self._blink_time = 0.0
+            self._cursor_on = not self._cursor_on
+            self._update_cursor()
+
+    def on_draw(self):
+        if self._glyph_origin != (self.center_x, self.center_y, self.width):
+            self._update_glyphs(0)
+
+        self._glyphs.draw()
 
     @property
     def cursor_index(self):
@@ -262,6 +389,7 @@ def cursor_index(self):
     @cursor_index.setter
     def cursor_index(self, value):
         self.text_adapter.cursor_index = value
+        self._update_cursor()
 
     @property
     def text(self):
@@ -272,12 +400,17 @@ def text(self):
 
     @text.setter
     def text(self, value):
+        old_text = self.text_adapter.text
         self.text_adapter.text = value
-        self.render()
+        if not self._fit_to_text():
+            self._update_glyphs(len(commonprefix([old_text, value])))
 
     def on_ui_event(self, event: UIEvent):
         super().on_ui_event(event)
 
+        old_text = self.text
+        old_cursor_index = self.cursor_index
+
         if self.focused:
             if event.type == TEXT_INPUT and event.get('text') == '\r':
                 self.dispatch_event('on_enter')
@@ -289,4 +422,13 @@ def on_ui_event(self, event: UIEvent):
 
         if self.text_adapter.state_changed:
             self.text_adapter.reset_state_changed()
-            self.render()
+
+            # show the cursor while typing
+            self._cursor_on = True
+            self._blink_time = 0.0
+
+            if self.text != old_text:
+                if not self._fit_to_text():
+                    self._update_glyphs(min(old_cursor_index, self.cursor_index))
+            else:
+                self._update_cursor()
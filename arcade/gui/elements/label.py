@@ -1,10 +1,9 @@
 from typing import Optional
-from uuid import uuid4
 
 import arcade
 from arcade.gui.elements import UIClickable
 from arcade.gui.ui_style import UIStyle
-from arcade.gui.utils import get_text_image
+from arcade.gui.utils import get_text_image, get_cached_texture, freeze_value
 
 
 class UILabel(UIClickable):
@@ -70,28 +69,23 @@ def render(self):
         if font_color_press is None:
             font_color_press = font_color_hover
 
-        text_image_normal = get_text_image(text=self.text,
-                                           font_color=font_color,
-                                           font_size=font_size,
-                                           font_name=font_name,
-                                           align=self.align,
-                                           width=int(self._target_width),
-                                           )
-        text_image_mouse_over = get_text_image(text=self.text,
-                                               font_color=font_color_hover,
-                                               font_size=font_size,
-                                               font_name=font_name,
-                                               align=self.align,
-                                               width=int(self._target_width),
-                                               )
-        text_image_mouse_press = get_text_image(text=self.text,
-                                                font_color=font_color_press,
-                                                font_size=font_size,
-                                                font_name=font_name,
-                                                align=self.align,
-                                                width=int(self._target_width),
-                                                )
+        width = int(self._target_width)
 
-        self.normal_texture = arcade.Texture(image=text_image_normal, name=str(uuid4()), hit_box_algorithm="None")
-        self.press_texture = arcade.Texture(image=text_image_mouse_press, name=str(uuid4()), hit_box_algorithm="None")
-        self.hover_texture = arcade.Texture(image=text_image_mouse_over, name=str(uuid4()), hit_box_algorithm="None")
+        def texture(font_color):
+            key = ('label', self.text, self.align, width, freeze_value(font_name), font_size,
+                   freeze_value(font_color))
+
+            def render():
+                return get_text_image(text=self.text,
+                                      font_color=font_color,
+                                      font_size=font_size,
+                                      font_name=font_name,
+                                      align=self.align,
+                                      width=width,
+                                      )
+
+            return get_cached_texture(key, render, hit_box_algorithm="None")
+
+        self.normal_texture = texture(font_color)
+        self.press_texture = texture(font_color_press)
+        self.hover_texture = texture(font_color_hover)
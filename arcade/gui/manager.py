@@ -179,14 +179,22 @@ def on_resize(self, width, height):
     def on_draw(self):
         """
         Draws all added :py:class:`arcade.gui.UIElement`.
+
+        The elements are drawn in one batch, then :py:meth:`arcade.gui.UIElement.on_draw`
+        is called for each of them. Whatever an element draws there, like the text of
+        a :py:class:`arcade.gui.UIInputBox`, is on top of all elements, including ones
+        added after it.
         """
         self._ui_elements.draw()
 
+        for ui_element in self._ui_elements:
+            cast(UIElement, ui_element).on_draw()
+
     def on_update(self, dt):
         """
-        Callback triggered on update
+        Callback triggered on update, forwarded to all added :py:class:`arcade.gui.UIElement`
         """
-        pass
+        self._ui_elements.on_update(dt)
 
     def dispatch_ui_event(self, event: UIEvent):
         """
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, Any, Sequence, Set, Union
+from typing import Dict, Any, Sequence, Set, Union, Tuple
 
 import yaml
 from pyglet.event import EventDispatcher
@@ -13,6 +13,10 @@ class UIStyle(EventDispatcher):
     Used as singleton in the UIView, style changes are applied by changing the values of the singleton.
 
     Use `.load()` to update UIStyle instance from YAML-file
+
+    Resolved attributes are memoized per set of style classes. Changes done through
+    :py:meth:`set_class_attrs`, :py:meth:`load` or by assigning :py:attr:`data` invalidate the memo,
+    if you modify nested values of :py:attr:`data` directly, call :py:meth:`clear_cache` afterwards.
     """
     __default_style = None
 
@@ -21,11 +25,30 @@ def __init__(self, data: Dict[str, Any]=None, **kwargs):
         :param data: Data of the UIStyle
         :param kwargs: Data of UIStyle as named parameters
         """
+        self._resolved: Dict[Tuple[str, ...], Dict[str, Any]] = {}
         self.data = data if data else {}
         self.data.update(kwargs)
 
         self.register_event_type('on_style_change')
 
+    @property
+    def data(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Raw style data, structured like Dict[style class, Dict[attribute, value]]
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data: Dict[str, Dict[str, Any]]):
+        self._data = data
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Drops all memoized attribute resolutions.
+        """
+        self._resolved.clear()
+
     @staticmethod
     def from_file(path: Union[str, Path]):
         """
@@ -93,8 +116,30 @@ def set_class_attrs(self, style_class: str, **kwargs):
             else:
                 style_data[key] = value
 
+        self.clear_cache()
         self.dispatch_event('on_style_change', {style_class})
 
+    def resolve(self, style_classes: Sequence[str]) -> Dict[str, Any]:
+        """
+        Resolves all attributes for the given style classes, the result is memoized
+        until the style changes. Do not modify the returned dict.
+
+        :param style_classes: List of style classes, resolving from right to left
+        :return: Dict of all attributes set for the style classes
+        """
+        key = tuple(style_classes)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = {}
+            for style_class in style_classes:
+                style_data = self.data.get(style_class, {})
+                for attr, attr_value in style_data.items():
+                    if attr_value:
+                        resolved[attr] = attr_value
+            self._resolved[key] = resolved
+
+        return resolved
+
     def get_attr(self, style_classes: Sequence[str], attr: str):
         """
         Retrieves an attribute, resolved from style by style_classes
@@ -103,10 +148,4 @@ def get_attr(self, style_classes: Sequence[str], attr: str):
         :param attr: attribute name to get value for
         :return: value of the attribute, first found
         """
-        for style_class in reversed(style_classes):
-            style_data = self.data.get(style_class, {})
-            attr_value = style_data.get(attr)
-            if attr_value:
-                return attr_value
-        else:
-            return None
+        return self.resolve(style_classes).get(attr)
@@ -1,7 +1,10 @@
 import os
+from collections import OrderedDict
+from functools import lru_cache
 from itertools import chain
 from pathlib import Path
-from typing import Union, cast, Tuple, Optional, Any
+from typing import Union, cast, Tuple, Optional, Any, Callable, Hashable
+from uuid import uuid4
 from warnings import warn
 
 import PIL
@@ -64,6 +67,60 @@ def parse_value(value: Any):
     return value
 
 
+#: Max number of textures kept by :py:func:`get_cached_texture`
+UI_TEXTURE_CACHE_SIZE = 512
+
+_ui_texture_cache: 'OrderedDict[Hashable, arcade.Texture]' = OrderedDict()
+
+
+def freeze_value(value: Any) -> Hashable:
+    """
+    Converts style values (like lists of font names or colors) into something hashable,
+    so they can be used as part of a cache key.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze_value(v)) for k, v in value.items()))
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+def get_cached_texture(key: Hashable,
+                       render: Callable[[], Image],
+                       hit_box_algorithm: str = "Simple") -> 'arcade.Texture':
+    """
+    Returns the texture rendered for the given key, `render` is only called if no
+    texture for the key is cached yet. UIElements with the same text, resolved style attributes
+    and size share the same texture this way.
+
+    :param key: Hashable key, has to contain everything the rendered image depends on
+    :param render: Function creating the image
+    :param hit_box_algorithm: Hit box algorithm of the created texture
+    :return: cached or newly created texture
+    """
+    key = (key, hit_box_algorithm)
+    texture = _ui_texture_cache.get(key)
+    if texture is not None:
+        _ui_texture_cache.move_to_end(key)
+        return texture
+
+    texture = arcade.Texture(image=render(), name=f'ui-{uuid4()}', hit_box_algorithm=hit_box_algorithm)
+    _ui_texture_cache[key] = texture
+    while len(_ui_texture_cache) > UI_TEXTURE_CACHE_SIZE:
+        _ui_texture_cache.popitem(last=False)
+
+    return texture
+
+
+def cleanup_ui_texture_cache():
+    """
+    Removes all textures cached by :py:func:`get_cached_texture`
+    """
+    _ui_texture_cache.clear()
+
+
 def add_margin(pil_img, top, right, bottom, left, color=None):
     width, height = pil_img.size
     new_width = width + right + left
@@ -73,6 +130,89 @@ def add_margin(pil_img, top, right, bottom, left, color=None):
     return result
 
 
+@lru_cache(maxsize=32)
+def _find_font(font_names: Tuple[str, ...], font_size: int):
+    font_names = chain(*[
+        [font_string_name, f"{font_string_name}.ttf"]
+        for font_string_name in font_names
+    ], DEFAULT_FONT_NAMES)
+
+    for font_string_name in font_names:
+        try:
+            return PIL.ImageFont.truetype(font_string_name, font_size)
+        except OSError:
+            continue
+
+    try:
+        import pyglet.font
+        font_config = pyglet.font.fontconfig.get_fontconfig()
+        result = font_config.find_font('Arial')
+        return PIL.ImageFont.truetype(result.name, font_size)
+    except Exception:
+        # NOTE: Will catch OSError from loading font and missing fontconfig in pyglet
+        pass
+
+    # Final fallback just getting PIL's default font if possible
+    try:
+        return PIL.ImageFont.load_default()
+    except Exception:
+        pass
+
+    raise RuntimeError("Unable to find a default font on this system. Please specify an available font.")
+
+
+def get_font(font_name: Union[str, Tuple[str, ...]], font_size: int):
+    """
+    Finds the first available font, loaded fonts are cached.
+
+    :param font_name: Font name or sequence of font names to try
+    :param font_size: Size of the font in pixels
+    :return: :py:class:`PIL.ImageFont.FreeTypeFont`
+    """
+    # Font was specified with a string
+    if isinstance(font_name, str):
+        font_name = font_name,
+
+    return _find_font(tuple(font_name), font_size)
+
+
+def render_glyph_image(char: str,
+                       font_size: float = 12,
+                       font_name: Union[str, Tuple[str, ...]] = ('calibri', 'arial')) -> Image:
+    """
+    Renders a single white character, scaled like :py:func:`get_text_image`.
+    All glyphs of one font share the same height and baseline, so they can be placed next to each other,
+    the width of the image is the advance of the character. Tint the glyph by setting the sprite color.
+
+    :param char: Character to render
+    :param font_size: Font size
+    :param font_name: Font name or sequence of font names to try
+    :return: Image of the glyph
+    """
+    # same scaling as get_text_image
+    scale = 2
+    font_size = font_size * 1.25 * scale
+    font = get_font(font_name, int(font_size))
+
+    if hasattr(font, 'getmetrics'):
+        ascent, _ = font.getmetrics()
+    else:
+        # bitmap fonts do not provide metrics
+        ascent = font.getsize('A')[1]
+
+    # like get_text_image, add some extra pixels at the bottom for letters that drop below the baseline
+    height = ascent + int(font_size * 0.25)
+    width = font.getsize(char)[0]
+
+    # transparent white background, so scaling down does not darken the edges
+    image = PIL.Image.new("RGBA", (max(scale, width), height), (255, 255, 255, 0))
+    draw = PIL.ImageDraw.Draw(image)
+    draw.text((0, 0), char, arcade.color.WHITE, font=font)
+
+    return image.resize((max(1, image.width // scale), max(1, image.height // scale)),
+                        resample=PIL.Image.LANCZOS)
+
+
 def get_image_with_text(text: str,
                         font_color: Color,
                         background_image: Image,
@@ -92,50 +232,7 @@ def get_image_with_text(text: str,
 
     font_size *= scale_up
 
-    # Figure out the font to use
-    font = None
-
-    # Font was specified with a string
-    if isinstance(font_name, str):
-        font_name = font_name,
-
-    font_names = chain(*[
-        [font_string_name, f"{font_string_name}.ttf"]
-        for font_string_name in font_name
-    ], DEFAULT_FONT_NAMES)
-
-    font_found = False
-    for font_string_name in font_names:
-        try:
-            font = PIL.ImageFont.truetype(font_string_name, int(font_size))
-        except OSError:
-            continue
-        else:
-            font_found = True
-            break
-
-    if not font_found:
-        try:
-            import pyglet.font
-            font_config = pyglet.font.fontconfig.get_fontconfig()
-            result = font_config.find_font('Arial')
-            font = PIL.ImageFont.truetype(result.name, int(font_size))
-        except Exception:
-            # NOTE: Will catch OSError from loading font and missing fontconfig in pyglet
-            pass
-        else:
-            font_found = True
-
-    # Final fallback just getting PIL's default font if possible
-    if not font_found:
-        try:
-            font = PIL.ImageFont.load_default()
-            font_found = True
-        except Exception:
-            pass
-
-    if not font_found:
-        raise RuntimeError("Unable to find a default font on this system. Please specify an available font.")
+    font = get_font(font_name, int(font_size))
 
     # This is stupid. We have to have an image to figure out what size
     # the text will be when we draw it. Of course, we don't know how big
@@ -211,50 +308,7 @@ def get_text_image(text: str,
 
     font_size *= scale_up
 
-    # Figure out the font to use
-    font = None
-
-    # Font was specified with a string
-    if isinstance(font_name, str):
-        font_name = font_name,
-
-    font_names = chain(*[
-        [font_string_name, f"{font_string_name}.ttf"]
-        for font_string_name in font_name
-    ], DEFAULT_FONT_NAMES)
-
-    font_found = False
-    for font_string_name in font_names:
-        try:
-            font = PIL.ImageFont.truetype(font_string_name, int(font_size))
-        except OSError:
-            continue
-        else:
-            font_found = True
-            break
-
-    if not font_found:
-        try:
-            import pyglet.font
-            font_config = pyglet.font.fontconfig.get_fontconfig()
-            result = font_config.find_font('Arial')
-            font = PIL.ImageFont.truetype(result.name, int(font_size))
-        except Exception:
-            # NOTE: Will catch OSError from loading font and missing fontconfig in pyglet
-            pass
-        else:
-            font_found = True
-
-    # Final fallback just getting PIL's default font if possible
-    if not font_found:
-        try:
-            font = PIL.ImageFont.load_default()
-            font_found = True
-        except Exception:
-            pass
-
-    if not font_found:
-        raise RuntimeError("Unable to find a default font on this system. Please specify an available font.")
+    font = get_font(font_name, int(font_size))
 
     # This is stupid. We have to have an image to figure out what size
     # the text will be when we draw it. Of course, we don't know how big
@@ -0,0 +1,402 @@
+"""
+Navigation meshes: the walkable part of a level as convex polygons.
+
+Grid path finding searches every cell, so big open areas make for big
+searches and staircase paths. A :class:`NavMesh` covers each open area with
+a few convex polygons instead. A path is found with A* from polygon to
+polygon, then pulled tight through the edges between them with the funnel
+algorithm, so it only bends around corners.
+
+Build one from wall sprites with :func:`create_navmesh`, from a tile layer
+with :func:`create_navmesh_from_occupancy_grid`, or from the outline of the
+walkable area with :func:`create_navmesh_from_outline`.
+"""
+
+import heapq
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from arcade.arcade_types import Point, PointList
+from arcade.earclip_module import earclip
+from arcade.occupancy_grid import OccupancyGrid
+from arcade.occupancy_grid import _merge_cells
+from arcade.paths import AStarBarrierList
+from arcade.sprite import Sprite
+from arcade.sprite_list import SpriteList
+
+# Points this close to the outside of a polygon still count as inside it
+_INSIDE_TOLERANCE = 1e-6
+
+# Edges have to share at least this much length to be connected
+_MIN_PORTAL_LENGTH = 1e-6
+
+
+def _cross(ax: float, ay: float, bx: float, by: float) -> float:
+    return ax * by - ay * bx
+
+
+def _get_entry_point(position: Point, end_point: Point, portal_start: Point, portal_end: Point) -> Point:
+    """
+    Where a path at `position` heading for `end_point` goes through a portal:
+    straight through if the line to the end point crosses it, else past the
+    end of the portal that makes for the shorter detour.
+    """
+    delta_x = end_point[0] - position[0]
+    delta_y = end_point[1] - position[1]
+    edge_x = portal_end[0] - portal_start[0]
+    edge_y = portal_end[1] - portal_start[1]
+    denominator = _cross(delta_x, delta_y, edge_x, edge_y)
+    if denominator:
+        offset_x = portal_start[0] - position[0]
+        offset_y = portal_start[1] - position[1]
+        along_line = _cross(offset_x, offset_y, edge_x, edge_y) / denominator
+        along_portal = _cross(offset_x, offset_y, delta_x, delta_y) / denominator
+        if along_line >= 0 and 0 <= along_portal <= 1:
+            return portal_start[0] + edge_x * along_portal, portal_start[1] + edge_y * along_portal
+
+    def detour(point: Point) -> float:
+        return math.hypot(point[0] - position[0], point[1] - position[1]) + \
+            math.hypot(end_point[0] - point[0], end_point[1] - point[1])
+    return portal_start if detour(portal_start) <= detour(portal_end) else portal_end
+
+
+def _point_along(start: Point, end: Point, start_position: float, end_position: float, position: float) -> Point:
+    """ Point of a segment at a position along it, keeping the end points exact. """
+    if position <= start_position:
+        return start
+    if position >= end_position:
+        return end
+    fraction = (position - start_position) / (end_position - start_position)
+    return start[0] + (end[0] - start[0]) * fraction, start[1] + (end[1] - start[1]) * fraction
+
+
+def _pull_string(portals: List[Tuple[Point, Point]]) -> List[Point]:
+    """
+    Funnel algorithm: the shortest path through a row of portals. Each portal
+    is a (left, right) pair as seen when walking through it. The first and
+    last portals are the start and end point.
+    """
+    apex = left = right = portals[0][0]
+    apex_index = left_index = right_index = 0
+    path = [apex]
+
+    i = 1
+    while i < len(portals):
+        new_left, new_right = portals[i]
+
+        # Narrow the funnel from the right, unless that crosses over the left side
+        if _cross(right[0] - apex[0], right[1] - apex[1], new_right[0] - apex[0], new_right[1] - apex[1]) >= 0:
+            if apex == right or _cross(new_right[0] - apex[0], new_right[1] - apex[1],
+                                       left[0] - apex[0], left[1] - apex[1]) > 0:
+                right = new_right
+                right_index = i
+            else:
+                # The path bends around the left corner
+                apex = left
+                apex_index = left_index
+                path.append(apex)
+                left = right = apex
+                right_index = apex_index
+                i = apex_index + 1
+                continue
+
+        # Same from the left
+        if _cross(new_left[0] - apex[0], new_left[1] - apex[1], left[0] - apex[0], left[1] - apex[1]) >= 0:
+            if apex == left or _cross(right[0] - apex[0], right[1] - apex[1],
+                                      new_left[0] - apex[0], new_left[1] - apex[1]) > 0:
+                left = new_left
+                left_index = i
+            else:
+                # The path bends around the right corner
+                apex = right
+                apex_index = right_index
+                path.append(apex)
+                left = right = apex
+                left_index = apex_index
+                i = apex_index + 1
+                continue
+
+        i += 1
+
+    end = portals[-1][0]
+    if path[-1] != end:
+        path.append(end)
+    return path
+
+
+class NavMesh:
+    """
+    Convex polygons covering where a sprite can walk, and the edges joining
+    them. Polygons are joined where their edges overlap, even if the edges
+    don't start and end at the same points.
+
+    .. code-block:: python
+
+        self.navmesh = arcade.create_navmesh(self.wall_list, 0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
+                                             grid_size=16, agent_radius=self.player.width / 2)
+        path = self.navmesh.find_path(enemy.position, self.player.position)
+
+    :param polygons: Convex polygons, each a list of points in either winding order.
+    """
+    def __init__(self, polygons: Iterable[PointList]):
+        self.polygons: List[List[Tuple[float, float]]] = []
+        for polygon in polygons:
+            points = [(float(x), float(y)) for x, y in polygon]
+            area = sum(_cross(x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]))
+            if area < 0:
+                points.reverse()
+            self.polygons.append(points)
+
+        if self.polygons:
+            self._min = np.array([np.min(polygon, axis=0) for polygon in self.polygons])
+            self._max = np.array([np.max(polygon, axis=0) for polygon in self.polygons])
+        else:
+            self._min = self._max = np.empty((0, 2))
+
+        # For each polygon: (neighbour, portal start, portal end), the portal in counter-clockwise order
+        self.neighbours: List[List[Tuple[int, Point, Point]]] = [[] for _ in self.polygons]
+        self._connect()
+
+    def __len__(self) -> int:
+        return len(self.polygons)
+
+    def _connect(self):
+        """ Find the overlapping edges of neighbouring polygons. """
+        # Group the edges by the line they are on
+        lines: Dict[Tuple[float, float, float], List[Tuple[float, float, int, int, Point, Point]]] = {}
+        for index, polygon in enumerate(self.polygons):
+            for start, end in zip(polygon, polygon[1:] + polygon[:1]):
+                delta_x = end[0] - start[0]
+                delta_y = end[1] - start[1]
+                length = math.hypot(delta_x, delta_y)
+                if length == 0:
+                    continue
+                direction_x = delta_x / length
+                direction_y = delta_y / length
+                # Same direction for both sides of a line, remember which way this edge runs
+                sign = 1
+                if direction_x < 0 or (direction_x == 0 and direction_y < 0):
+                    direction_x, direction_y, sign = -direction_x, -direction_y, -1
+                direction_x = round(direction_x, 9) + 0.0
+                direction_y = round(direction_y, 9) + 0.0
+                offset = round(_cross(direction_x, direction_y, start[0], start[1]), 6) + 0.0
+                position_1 = start[0] * direction_x + start[1] * direction_y
+                position_2 = end[0] * direction_x + end[1] * direction_y
+                if sign < 0:
+                    start, end, position_1, position_2 = end, start, position_2, position_1
+                lines.setdefault((direction_x, direction_y, offset), []).append(
+                    (position_1, position_2, sign, index, start, end))
+
+        for edges in lines.values():
+            if len(edges) < 2:
+                continue
+            edges.sort()
+            for i, (low_1, high_1, sign_1, polygon_1, start, end) in enumerate(edges):
+                for low_2, high_2, sign_2, polygon_2, _, _ in edges[i + 1:]:
+                    if low_2 >= high_1 - _MIN_PORTAL_LENGTH:
+                        break
+                    # Facing edges of two polygons
+                    if sign_1 == sign_2 or polygon_1 == polygon_2:
+                        continue
+                    low = _point_along(start, end, low_1, high_1, max(low_1, low_2))
+                    high = _point_along(start, end, low_1, high_1, min(high_1, high_2))
+                    if sign_1 > 0:
+                        self.neighbours[polygon_1].append((polygon_2, low, high))
+                        self.neighbours[polygon_2].append((polygon_1, high, low))
+                    else:
+                        self.neighbours[polygon_1].append((polygon_2, high, low))
+                        self.neighbours[polygon_2].append((polygon_1, low, high))
+
+    def get_polygon_at(self, point: Point) -> Optional[int]:
+        """
+        Find the polygon a point is in.
+
+        :param Point point: Point to look up.
+        :returns: Index of the polygon, or None if the point is outside the mesh.
+        """
+        x, y = point
+        candidates = np.nonzero((self._min[:, 0] <= x) & (self._min[:, 1] <= y)
+                                & (self._max[:, 0] >= x) & (self._max[:, 1] >= y))[0]
+        for index in candidates.tolist():
+            polygon = self.polygons[index]
+            for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]):
+                length = math.hypot(x2 - x1, y2 - y1)
+                if _cross(x2 - x1, y2 - y1, x - x1, y - y1) < -_INSIDE_TOLERANCE * length:
+                    break
+            else:
+                return index
+        return None
+
+    def _search(self, start_point: Point, end_point: Point) -> Optional[List[Tuple[int, Point, Point]]]:
+        """
+        A* over the polygons. Each polygon is entered at the point of the edge
+        the path so far would cross heading for the end point.
+
+        :returns: (polygon, portal start, portal end) for each polygon passed
+                  through, with the portal it was entered by.
+        """
+        start = self.get_polygon_at(start_point)
+        goal = self.get_polygon_at(end_point)
+        if start is None or goal is None:
+            return None
+
+        came_from: Dict[int, Tuple[Optional[int], Point, Point]] = {start: (None, start_point, start_point)}
+        positions: Dict[int, Point] = {start: start_point}
+        costs: Dict[int, float] = {start: 0.0}
+        open_heap = [(0.0, 0, start)]
+        counter = 1
+        while open_heap:
+            _, _, current = heapq.heappop(open_heap)
+            if current == goal:
+                path = []
+                polygon: Optional[int] = current
+                while polygon is not None:
+                    parent, portal_start, portal_end = came_from[polygon]
+                    path.append((polygon, portal_start, portal_end))
+                    polygon = parent
+                return path[::-1]
+
+            position = positions[current]
+            cost = costs[current]
+            for neighbour, portal_start, portal_end in self.neighbours[current]:
+                entry = _get_entry_point(position, end_point, portal_start, portal_end)
+                new_cost = cost + math.hypot(entry[0] - position[0], entry[1] - position[1])
+                if new_cost < costs.get(neighbour, math.inf):
+                    costs[neighbour] = new_cost
+                    positions[neighbour] = entry
+                    came_from[neighbour] = current, portal_start, portal_end
+                    estimate = math.hypot(end_point[0] - entry[0], end_point[1] - entry[1])
+                    heapq.heappush(open_heap, (new_cost + estimate, counter, neighbour))
+                    counter += 1
+        return None
+
+    def find_polygon_path(self, start_point: Point, end_point: Point) -> Optional[List[int]]:
+        """
+        Find which polygons a path between two points goes through.
+
+        :param Point start_point: Where the path starts.
+        :param Point end_point: Where the path goes.
+        :returns: Indices of the polygons, or None if there is no path.
+        """
+        path = self._search(start_point, end_point)
+        if path is None:
+            return None
+        return [polygon for polygon, _, _ in path]
+
+    def find_path(self, start_point: Point, end_point: Point) -> Optional[List[Point]]:
+        """
+        Find a path between two points on the mesh. It goes straight from
+        corner to corner.
+
+        :param Point start_point: Where the path starts.
+        :param Point end_point: Where the path goes.
+        :returns: List of points from the start to the end point, or None if
+                  either point is off the mesh or they aren't connected.
+        """
+        path = self._search(start_point, end_point)
+        if path is None:
+            return None
+
+        # Walking out of a counter-clockwise polygon, its edge runs from right to left
+        portals = [(start_point, start_point)]
+        portals += [(portal_end, portal_start) for _, portal_start, portal_end in path[1:]]
+        portals.append((end_point, end_point))
+        return _pull_string(portals)
+
+
+def _rectangles_to_polygons(rectangles: List[Tuple[int, int, int, int]],
+                            left: float, bottom: float,
+                            cell_width: float, cell_height: float) -> List[PointList]:
+    polygons = []
+    for column, row, end_column, end_row in rectangles:
+        x1 = left + column * cell_width
+        y1 = bottom + row * cell_height
+        x2 = left + end_column * cell_width
+        y2 = bottom + end_row * cell_height
+        polygons.append([(x1, y1), (x2, y1), (x2, y2), (x1, y2)])
+    return polygons
+
+
+def create_navmesh(wall_list: SpriteList,
+                   left: int,
+                   right: int,
+                   bottom: int,
+                   top: int,
+                   grid_size: int,
+                   agent_radius: float = 0) -> NavMesh:
+    """
+    Build a navigation mesh around wall sprites.
+
+    The playing field is split into a grid, and every cell a sprite of
+    `agent_radius` could touch a wall from is left out. The open cells are
+    merged into as few rectangles as possible, so open areas end up as one
+    polygon each. The mesh says where the center of a sprite can go.
+
+    :param SpriteList wall_list: Sprites that block movement.
+    :param int left: Left border of playing field
+    :param int right: Right border of playing field
+    :param int bottom: Bottom of playing field
+    :param int top: Top of playing field
+    :param int grid_size: Size of the grid cells walls are rounded out to, in pixels.
+    :param float agent_radius: Half the width of the sprites that will use the mesh.
+    :returns: NavMesh
+    """
+    # A cell is open if an agent anywhere in it clears the walls, so test with a box covering all of that
+    half_size = grid_size / 2 + agent_radius
+    probe = Sprite()
+    probe.set_hit_box([(-half_size, -half_size), (half_size, -half_size),
+                       (half_size, half_size), (-half_size, half_size)])
+    barrier_list = AStarBarrierList(probe, wall_list, grid_size, left, right, bottom, top)
+
+    rectangles = _merge_cells(~barrier_list.barrier_mask)
+    # Cells are centered on multiples of the grid size
+    polygons = _rectangles_to_polygons(rectangles,
+                                       (barrier_list.left - 0.5) * grid_size,
+                                       (barrier_list.bottom - 0.5) * grid_size,
+                                       grid_size, grid_size)
+    return NavMesh(polygons)
+
+
+def create_navmesh_from_occupancy_grid(grid: OccupancyGrid, agent_radius: float = 0) -> NavMesh:
+    """
+    Build a navigation mesh from the empty cells of an occupancy grid, such as
+    one made with :func:`arcade.tilemap.create_occupancy_grid`. Cells with any
+    hit box count as blocked, and the area outside the grid is blocked too.
+
+    .. code-block:: python
+
+        my_map = arcade.tilemap.read_tmx(":resources:tmx_maps/map.tmx")
+        wall_grid = arcade.tilemap.create_occupancy_grid(my_map, "Walls")
+        self.navmesh = arcade.create_navmesh_from_occupancy_grid(wall_grid, agent_radius=20)
+
+    :param OccupancyGrid grid: Grid of walls.
+    :param float agent_radius: Half the width of the sprites that will use the
+                               mesh. Walls are grown by whole cells to keep this
+                               far away from them.
+    :returns: NavMesh
+    """
+    blocked = grid.solid.copy()
+    # Grow the walls by whole cells, along both axes at once so corners are covered
+    grow_columns = math.ceil(agent_radius / grid.tile_width - _INSIDE_TOLERANCE)
+    grow_rows = math.ceil(agent_radius / grid.tile_height - _INSIDE_TOLERANCE)
+    padded = np.pad(blocked, ((grow_rows, grow_rows), (grow_columns, grow_columns)), constant_values=True)
+    for row_offset in range(2 * grow_rows + 1):
+        for column_offset in range(2 * grow_columns + 1):
+            blocked |= padded[row_offset:row_offset + grid.height, column_offset:column_offset + grid.width]
+
+    rectangles = _merge_cells(~blocked)
+    return NavMesh(_rectangles_to_polygons(rectangles, grid.origin[0], grid.origin[1],
+                                           grid.tile_width, grid.tile_height))
+
+
+def create_navmesh_from_outline(outline: PointList) -> NavMesh:
+    """
+    Build a navigation mesh from the outline of the walkable area, by cutting
+    it into triangles with :func:`arcade.earclip`. The outline can't have holes.
+
+    :param PointList outline: Points around the walkable area.
+    :returns: NavMesh
+    """
+    return NavMesh(earclip(outline))
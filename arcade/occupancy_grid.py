@@ -0,0 +1,373 @@
+"""
+Occupancy grids: collision and queries for walls made of tiles on a regular grid.
+
+Walls from a tile layer are usually loaded into a :class:`SpriteList` and
+checked with polygon tests against every nearby sprite. An
+:class:`OccupancyGrid` instead stores the GID of each cell in an array, plus
+the hit box of each GID, so finding what is at a point or inside a box is just
+indexing into the array.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from arcade.arcade_types import Point, PointList
+from arcade.geometry import are_polygons_intersecting
+from arcade.geometry import is_point_in_polygon
+from arcade.sprite import Sprite
+from arcade.sprite_list import SpriteList
+
+# Hit boxes within this distance of the cell outline count as filling the cell
+_FULL_CELL_TOLERANCE = 0.01
+
+
+def _segment_polygon_entry(start_x: float, start_y: float,
+                           delta_x: float, delta_y: float,
+                           polygon: PointList) -> Optional[float]:
+    """
+    Where a segment first enters a polygon.
+
+    :returns: Fraction along the segment from 0.0 to 1.0, or None if it misses.
+    """
+    if is_point_in_polygon(start_x, start_y, polygon):
+        return 0.0
+
+    entry = None
+    for i in range(len(polygon)):
+        x1, y1 = polygon[i]
+        x2, y2 = polygon[(i + 1) % len(polygon)]
+        edge_x = x2 - x1
+        edge_y = y2 - y1
+        denominator = delta_x * edge_y - delta_y * edge_x
+        if denominator == 0:
+            continue
+        t = ((x1 - start_x) * edge_y - (y1 - start_y) * edge_x) / denominator
+        u = ((x1 - start_x) * delta_y - (y1 - start_y) * delta_x) / denominator
+        if 0 <= t <= 1 and 0 <= u <= 1 and (entry is None or t < entry):
+            entry = t
+    return entry
+
+
+def _rectangle_points(width: float, height: float) -> PointList:
+    """ Hit box of a rectangle around its center. """
+    return ((-width / 2, -height / 2), (width / 2, -height / 2),
+            (width / 2, height / 2), (-width / 2, height / 2))
+
+
+def _create_collision_sprite(center_x: float, center_y: float, points: PointList) -> Sprite:
+    """ A sprite with just a hit box, for collision checks. It has no texture to draw. """
+    sprite = Sprite(center_x=center_x, center_y=center_y)
+    sprite.set_hit_box(points)
+    sprite.collision_radius = max(math.hypot(x, y) for x, y in points)
+    return sprite
+
+
+def _merge_cells(mask: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """
+    Cover the set cells of a 2D mask with as few rectangles as possible. Each
+    rectangle is grown greedily, first along its row and then up as long as
+    the whole width stays set.
+
+    :returns: (column, row, end column, end row) of each rectangle, the ends exclusive.
+    """
+    height, width = mask.shape
+    remaining = mask.copy()
+    rectangles = []
+    for row, column in zip(*np.nonzero(remaining)):
+        if not remaining[row, column]:
+            continue
+        # Widen until the row runs out of cells, then raise while the rows above are full too
+        end_column = column + 1
+        while end_column < width and remaining[row, end_column]:
+            end_column += 1
+        end_row = row + 1
+        while end_row < height and remaining[end_row, column:end_column].all():
+            end_row += 1
+        remaining[row:end_row, column:end_column] = False
+        rectangles.append((int(column), int(row), int(end_column), int(end_row)))
+    return rectangles
+
+
+class OccupancyGrid:
+    """
+    The solid cells of a grid of tiles, usually a wall layer of a tile map.
+    Create one from a map with :func:`arcade.tilemap.create_occupancy_grid`.
+
+    Point and box queries look up the cells directly. Cells whose hit box
+    doesn't fill the tile, such as slopes, are then tested against the hit box.
+
+    The grid can be passed to :class:`PhysicsEngineSimple` and
+    :class:`PhysicsEnginePlatformer` in place of a :class:`SpriteList` of walls.
+    The hit lists they return then hold one stand-in sprite per solid cell
+    touched, with the GID in ``properties["gid"]``.
+
+    .. code-block:: python
+
+        my_map = arcade.tilemap.read_tmx(":resources:tmx_maps/map.tmx")
+        self.wall_list = arcade.tilemap.process_layer(my_map, "Platforms")
+        self.wall_grid = arcade.tilemap.create_occupancy_grid(my_map, "Platforms")
+        self.physics_engine = arcade.PhysicsEnginePlatformer(self.player, self.wall_grid)
+
+    :param gids: 2D array of GIDs, indexed by [row, column]. Row 0 is the bottom
+                 row. 0 is an empty cell.
+    :param float tile_width: Width of a cell.
+    :param float tile_height: Height of a cell.
+    :param dict hit_boxes: Hit box of each GID, relative to the center of its cell.
+                           GIDs without one fill their cell.
+    :param Point origin: Position of the bottom left corner of the grid.
+    """
+    def __init__(self,
+                 gids,
+                 tile_width: float,
+                 tile_height: float,
+                 hit_boxes: Optional[Dict[int, PointList]] = None,
+                 origin: Point = (0, 0)):
+        self.gids = np.array(gids, dtype=np.uint32)
+        if self.gids.ndim != 2:
+            raise ValueError("GIDs have to be a 2D array of rows and columns.")
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.origin = origin
+
+        self._hit_boxes: Dict[int, PointList] = {}
+        self._full_gids = set()
+        # Cells a hit box reaches outside of its own cell, in each direction
+        self._margin = 0
+        half_width = tile_width / 2
+        half_height = tile_height / 2
+        for gid, points in (hit_boxes or {}).items():
+            points = tuple(tuple(point) for point in points)
+            self._hit_boxes[gid] = points
+            xs = [point[0] for point in points]
+            ys = [point[1] for point in points]
+            self._margin = max(self._margin,
+                               math.ceil(max(max(xs) - half_width, -half_width - min(xs), 0) / tile_width),
+                               math.ceil(max(max(ys) - half_height, -half_height - min(ys), 0) / tile_height))
+            if len(points) == 4 \
+                    and abs(min(xs) + half_width) < _FULL_CELL_TOLERANCE \
+                    and abs(max(xs) - half_width) < _FULL_CELL_TOLERANCE \
+                    and abs(min(ys) + half_height) < _FULL_CELL_TOLERANCE \
+                    and abs(max(ys) - half_height) < _FULL_CELL_TOLERANCE:
+                self._full_gids.add(gid)
+
+        self._cell_sprites: Dict[Tuple[int, int], Sprite] = {}
+        self._update_masks()
+
+    def _update_masks(self):
+        """ Recalculate which cells are solid, and which of those need a hit box test. """
+        self.solid = self.gids != 0
+        partial_gids = [gid for gid in self._hit_boxes if gid not in self._full_gids]
+        self._partial = self.solid & np.isin(self.gids, partial_gids)
+        self._full = self.solid & ~self._partial
+
+    @property
+    def width(self) -> int:
+        """ Number of columns. """
+        return self.gids.shape[1]
+
+    @property
+    def height(self) -> int:
+        """ Number of rows. """
+        return self.gids.shape[0]
+
+    def get_cell(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Get the cell a point is in. The cell may be outside the grid.
+
+        :returns: (column, row)
+        """
+        return (math.floor((x - self.origin[0]) / self.tile_width),
+                math.floor((y - self.origin[1]) / self.tile_height))
+
+    def get_gid(self, column: int, row: int) -> int:
+        """ Get the GID of a cell. Cells outside the grid are empty. """
+        if 0 <= column < self.width and 0 <= row < self.height:
+            return int(self.gids[row, column])
+        return 0
+
+    def set_gid(self, column: int, row: int, gid: int):
+        """
+        Change the GID of a cell, for example to open a door. Use 0 to empty it.
+        GIDs not in the hit boxes given at creation fill their cell.
+        """
+        self.gids[row, column] = gid
+        self._cell_sprites.pop((column, row), None)
+        self.solid[row, column] = gid != 0
+        self._partial[row, column] = gid != 0 and gid in self._hit_boxes and gid not in self._full_gids
+        self._full[row, column] = gid != 0 and not self._partial[row, column]
+
+    def _cell_center(self, column: int, row: int) -> Point:
+        return (self.origin[0] + (column + 0.5) * self.tile_width,
+                self.origin[1] + (row + 0.5) * self.tile_height)
+
+    def _get_cell_hit_box(self, column: int, row: int) -> PointList:
+        """ Hit box of a partially filled cell, in world coordinates. """
+        center_x, center_y = self._cell_center(column, row)
+        return [(center_x + x, center_y + y) for x, y in self._hit_boxes[int(self.gids[row, column])]]
+
+    def _get_cell_range(self, left: float, bottom: float, right: float, top: float,
+                        margin: int = 0) -> Tuple[int, int, int, int]:
+        """ First and last column and row overlapping a box, clipped to the grid. """
+        first_column = max(math.floor((left - self.origin[0]) / self.tile_width) - margin, 0)
+        last_column = min(math.ceil((right - self.origin[0]) / self.tile_width) - 1 + margin, self.width - 1)
+        first_row = max(math.floor((bottom - self.origin[1]) / self.tile_height) - margin, 0)
+        last_row = min(math.ceil((top - self.origin[1]) / self.tile_height) - 1 + margin, self.height - 1)
+        return first_column, last_column, first_row, last_row
+
+    def is_solid_at(self, x: float, y: float) -> bool:
+        """ Return True if a point is inside a solid cell's hit box. """
+        column, row = self.get_cell(x, y)
+        if not (0 <= column < self.width and 0 <= row < self.height) or not self.solid[row, column]:
+            return False
+        if self._full[row, column]:
+            return True
+        return is_point_in_polygon(x, y, self._get_cell_hit_box(column, row))
+
+    def overlaps_box(self, left: float, bottom: float, right: float, top: float) -> bool:
+        """ Return True if any solid cell's hit box overlaps an axis-aligned box. """
+        first_column, last_column, first_row, last_row = self._get_cell_range(left, bottom, right, top)
+        if first_column > last_column or first_row > last_row:
+            return False
+        if self._full[first_row:last_row + 1, first_column:last_column + 1].any():
+            return True
+
+        box = [(left, bottom), (right, bottom), (right, top), (left, top)]
+        partial = self._partial[first_row:last_row + 1, first_column:last_column + 1]
+        for row, column in zip(*np.nonzero(partial)):
+            if are_polygons_intersecting(box, self._get_cell_hit_box(column + first_column, row + first_row)):
+                return True
+        return False
+
+    def cast_ray(self, start_x: float, start_y: float, end_x: float, end_y: float) -> Optional[Point]:
+        """
+        Follow a line from start to end through the grid, one cell at a time,
+        and find the first solid hit box on it.
+
+        Hit boxes reaching outside their own cell are only found within it.
+
+        :returns: The point where the line hits, or None if it gets to the end.
+        """
+        delta_x = end_x - start_x
+        delta_y = end_y - start_y
+        grid_x = (start_x - self.origin[0]) / self.tile_width
+        grid_y = (start_y - self.origin[1]) / self.tile_height
+        column = math.floor(grid_x)
+        row = math.floor(grid_y)
+        end_column, end_row = self.get_cell(end_x, end_y)
+
+        # Fraction of the line between crossing one column or row and the next, and to the first crossing
+        if delta_x:
+            step_column = 1 if delta_x > 0 else -1
+            t_delta_x = self.tile_width / abs(delta_x)
+            t_max_x = ((column + 1 - grid_x) if delta_x > 0 else (grid_x - column)) * t_delta_x
+        else:
+            step_column, t_delta_x, t_max_x = 0, math.inf, math.inf
+        if delta_y:
+            step_row = 1 if delta_y > 0 else -1
+            t_delta_y = self.tile_height / abs(delta_y)
+            t_max_y = ((row + 1 - grid_y) if delta_y > 0 else (grid_y - row)) * t_delta_y
+        else:
+            step_row, t_delta_y, t_max_y = 0, math.inf, math.inf
+
+        t = 0.0
+        for _ in range(abs(end_column - column) + abs(end_row - row) + 1):
+            if 0 <= column < self.width and 0 <= row < self.height and self.solid[row, column]:
+                if self._full[row, column]:
+                    return start_x + delta_x * t, start_y + delta_y * t
+                entry = _segment_polygon_entry(start_x, start_y, delta_x, delta_y,
+                                               self._get_cell_hit_box(column, row))
+                if entry is not None:
+                    return start_x + delta_x * entry, start_y + delta_y * entry
+
+            if t_max_x < t_max_y:
+                t = t_max_x
+                t_max_x += t_delta_x
+                column += step_column
+            else:
+                t = t_max_y
+                t_max_y += t_delta_y
+                row += step_row
+            if t > 1:
+                break
+        return None
+
+    def _get_cell_sprite(self, column: int, row: int) -> Sprite:
+        """ Stand-in sprite for a solid cell, made on first use. """
+        sprite = self._cell_sprites.get((column, row))
+        if sprite is None:
+            gid = int(self.gids[row, column])
+            center_x, center_y = self._cell_center(column, row)
+            points = self._hit_boxes.get(gid) or _rectangle_points(self.tile_width, self.tile_height)
+            sprite = _create_collision_sprite(center_x, center_y, points)
+            sprite.properties["gid"] = gid
+            self._cell_sprites[column, row] = sprite
+        return sprite
+
+    def get_colliding_sprites(self, sprite: Sprite) -> List[Sprite]:
+        """
+        Check a sprite against the cells its hit box overlaps. Works like
+        :func:`check_for_collision_with_list`, but only looks at those cells.
+
+        :param Sprite sprite: Sprite to check.
+        :returns: Stand-in sprites of the solid cells hit, or an empty list.
+        """
+        hit_box = sprite.get_adjusted_hit_box()
+        xs = [point[0] for point in hit_box]
+        ys = [point[1] for point in hit_box]
+        return [cell_sprite for cell_sprite in self.get_sprites_in_box(min(xs), min(ys), max(xs), max(ys))
+                if are_polygons_intersecting(hit_box, cell_sprite.get_adjusted_hit_box())]
+
+    def get_sprites_in_box(self, left: float, bottom: float, right: float, top: float) -> List[Sprite]:
+        """
+        Stand-in sprites of the solid cells whose hit box may reach into an
+        axis-aligned box. Hit boxes are not checked, this is a broad phase.
+
+        :returns: Stand-in sprites, or an empty list.
+        """
+        first_column, last_column, first_row, last_row = self._get_cell_range(left, bottom, right, top,
+                                                                              self._margin)
+        if first_column > last_column or first_row > last_row:
+            return []
+
+        solid = self.solid[first_row:last_row + 1, first_column:last_column + 1]
+        return [self._get_cell_sprite(int(column) + first_column, int(row) + first_row)
+                for row, column in zip(*np.nonzero(solid))]
+
+    def get_merged_rectangles(self) -> np.ndarray:
+        """
+        Merge the cells that are filled by their hit box into as few rectangles
+        as possible. Each rectangle is grown greedily, first along its row and
+        then up as long as the whole width stays solid. Cells with other hit
+        boxes, such as slopes, are left out.
+
+        :returns: Array with a row of (left, bottom, width, height) for each rectangle.
+        """
+        rectangles = []
+        for column, row, end_column, end_row in _merge_cells(self._full):
+            rectangles.append((self.origin[0] + column * self.tile_width,
+                               self.origin[1] + row * self.tile_height,
+                               (end_column - column) * self.tile_width,
+                               (end_row - row) * self.tile_height))
+        return np.array(rectangles, dtype=np.float64).reshape(-1, 4)
+
+    def create_collision_list(self) -> SpriteList:
+        """
+        Make a sprite list for collisions only, with one sprite per rectangle
+        from :meth:`get_merged_rectangles` and one per cell that doesn't fill
+        its tile. It has far fewer sprites to check than a list with a sprite
+        per tile. The sprites have no textures, keep drawing the tile sprites.
+
+        :returns: A SpriteList using a spatial hash.
+        """
+        sprite_list = SpriteList(use_spatial_hash=True)
+        for left, bottom, width, height in self.get_merged_rectangles():
+            sprite_list.append(_create_collision_sprite(left + width / 2, bottom + height / 2,
+                                                        _rectangle_points(width, height)))
+        for row, column in zip(*np.nonzero(self._partial)):
+            center_x, center_y = self._cell_center(column, row)
+            sprite = _create_collision_sprite(center_x, center_y, self._hit_boxes[int(self.gids[row, column])])
+            sprite.properties["gid"] = int(self.gids[row, column])
+            sprite_list.append(sprite)
+        return sprite_list
@@ -2,17 +2,94 @@
 Path-related functions.
 
 """
+import heapq
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python before 3.8
+    shared_memory = None  # type: ignore
+
 from arcade import Point
+from arcade import PointList
+from arcade import Rect
 from arcade import get_distance
-from arcade import lerp_vec
-from arcade import get_sprites_at_point
+from arcade import rotate_point
 from arcade import check_for_collision_with_list
 from arcade import Sprite
 from arcade import SpriteList
+from arcade.occupancy_grid import OccupancyGrid
+from arcade.occupancy_grid import _segment_polygon_entry
+
+
+def _get_ray_hit(start_point: Point, end_point: Point, walls: SpriteList, any_hit: bool = False) -> Optional[float]:
+    """
+    Fraction along a segment where it first hits a hit box in the list, or
+    None if it doesn't. With a spatial hash only the sprites in the cells
+    along the segment are tested, nearest cell first. With `any_hit` the
+    first hit box found is good enough, even if it isn't the nearest.
+    """
+    start_x, start_y = start_point
+    delta_x = end_point[0] - start_x
+    delta_y = end_point[1] - start_y
+
+    if walls.spatial_hash is None:
+        cells = [(walls.sprite_list, 1.0)]
+    else:
+        cells = walls.spatial_hash.get_objects_for_segment(start_point, end_point)
+
+    tested = set()
+    closest = None
+    for sprites, t_exit in cells:
+        for sprite in sprites:
+            if sprite in tested:
+                continue
+            tested.add(sprite)
+            entry = _segment_polygon_entry(start_x, start_y, delta_x, delta_y, sprite.get_adjusted_hit_box())
+            if entry is not None and (closest is None or entry < closest):
+                if any_hit:
+                    return entry
+                closest = entry
+        # Nothing in later cells can be nearer
+        if closest is not None and closest <= t_exit:
+            break
+    return closest
+
+
+def cast_ray(start_point: Point,
+             end_point: Point,
+             walls: Union[SpriteList, OccupancyGrid]) -> Optional[Point]:
+    """
+    Find where a line from one point to another first hits a wall. The line
+    is tested exactly against the hit boxes, so thin walls aren't missed.
+    If the walls use a spatial hash, only the sprites in the hash cells along
+    the line are tested, starting at the near end.
+
+    :param Point start_point: Where the line starts
+    :param Point end_point: Where the line ends
+    :param walls: Sprites that block the line, or an :class:`OccupancyGrid`
+    :returns: The point where the line hits, or None if it gets to the end.
+    """
+    if isinstance(walls, OccupancyGrid):
+        return walls.cast_ray(start_point[0], start_point[1], end_point[0], end_point[1])
+
+    entry = _get_ray_hit(start_point, end_point, walls)
+    if entry is None:
+        return None
+    return (start_point[0] + (end_point[0] - start_point[0]) * entry,
+            start_point[1] + (end_point[1] - start_point[1]) * entry)
+
 
 def has_line_of_sight(point_1: Point,
                       point_2: Point,
-                      walls: SpriteList,
+                      walls: Union[SpriteList, OccupancyGrid],
                       max_distance: int = -1,
                       check_resolution: int = 2):
     """
@@ -22,25 +99,100 @@ def has_line_of_sight(point_1: Point,
 
     :param Point point_1: Start position
     :param Point point_2: End position position
-    :param SpriteList walls: List of all blocking sprites
+    :param walls: List of all blocking sprites, or an :class:`OccupancyGrid`
     :param int max_distance: Max distance point 1 can see
-    :param int check_resolution: Check every x pixels for a sprite. Trade-off
-                                 between accuracy and speed.
+    :param int check_resolution: No longer used, the line is tested exactly
+                                 with :func:`cast_ray`.
     """
-    distance = get_distance(point_1[0], point_1[1],
-                            point_2[0], point_2[1])
-    steps = int(distance // check_resolution)
-    for step in range(steps + 1):
-        step_distance = step * check_resolution
-        u = step_distance / distance
-        midpoint = lerp_vec(point_1, point_2, u)
-        if max_distance != -1 and step_distance > max_distance:
-            return False
-        # print(point_1, point_2, step, u, step_distance, midpoint)
-        sprite_list = get_sprites_at_point(midpoint, walls)
-        if len(sprite_list) > 0:
-            return False
-    return True
+    if max_distance != -1 and get_distance(point_1[0], point_1[1], point_2[0], point_2[1]) > max_distance:
+        return False
+    if isinstance(walls, OccupancyGrid):
+        return walls.cast_ray(point_1[0], point_1[1], point_2[0], point_2[1]) is None
+    return _get_ray_hit(point_1, point_2, walls, any_hit=True) is None
+
+
+def has_line_of_sight_many(pairs: Iterable[Tuple[Point, Point]],
+                           walls: SpriteList,
+                           max_distance: float = -1) -> List[bool]:
+    """
+    Check line of sight between many pairs of points at once, such as every
+    guard and the player.
+
+    If the walls use a spatial hash, each line walks the hash cells it
+    passes through like :func:`has_line_of_sight`. Otherwise the bounding
+    boxes of all walls are checked against all lines together with NumPy,
+    and the lines are then tested exactly against the walls they overlap,
+    all at once, instead of every line testing every wall.
+
+    :param pairs: (start, end) point pairs.
+    :param SpriteList walls: List of all blocking sprites
+    :param float max_distance: Max distance the start point can see
+    :returns: For each pair, whether the points can see each other.
+    """
+    segments = np.array([(start[0], start[1], end[0], end[1]) for start, end in pairs],
+                        dtype=np.float64).reshape(-1, 4)
+    starts = segments[:, :2]
+    deltas = segments[:, 2:] - starts
+    visible = np.ones(len(segments), dtype=bool)
+    if max_distance != -1:
+        visible &= np.hypot(deltas[:, 0], deltas[:, 1]) <= max_distance
+
+    wall_sprites = walls.sprite_list
+    if not wall_sprites or not visible.any():
+        return visible.tolist()
+
+    if walls.spatial_hash is not None:
+        results = visible.tolist()
+        for index, (start_x, start_y, end_x, end_y) in enumerate(segments.tolist()):
+            if results[index]:
+                results[index] = _get_ray_hit((start_x, start_y), (end_x, end_y), walls, any_hit=True) is None
+        return results
+
+    # Which wall could block which segment
+    bounds = np.array([(sprite.left, sprite.bottom, sprite.right, sprite.top) for sprite in wall_sprites])
+    low = np.minimum(segments[:, :2], segments[:, 2:])
+    high = np.maximum(segments[:, :2], segments[:, 2:])
+    overlaps = (bounds[None, :, 0] <= high[:, None, 0]) & (bounds[None, :, 2] >= low[:, None, 0]) \
+        & (bounds[None, :, 1] <= high[:, None, 1]) & (bounds[None, :, 3] >= low[:, None, 1])
+    overlaps &= visible[:, None]
+    segment_index, wall_index = np.nonzero(overlaps)
+    if len(segment_index) == 0:
+        return visible.tolist()
+    used_walls, wall_index = np.unique(wall_index, return_inverse=True)
+
+    # Hit boxes padded to the same number of points by repeating the last one
+    hit_boxes = [wall_sprites[index].get_adjusted_hit_box() for index in used_walls.tolist()]
+    point_count = max(len(points) for points in hit_boxes)
+    padded = [list(points) + [points[-1]] * (point_count - len(points)) for points in hit_boxes]
+    polygons = np.array(padded, dtype=np.float64).reshape(len(hit_boxes), point_count, 2)[wall_index]
+
+    start = starts[segment_index][:, None, :]
+    delta = deltas[segment_index][:, None, :]
+    edge_start = polygons
+    edge = np.roll(polygons, -1, axis=1) - polygons
+
+    # Segment crosses an edge
+    offset = edge_start - start
+    denominator = delta[..., 0] * edge[..., 1] - delta[..., 1] * edge[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        along_segment = (offset[..., 0] * edge[..., 1] - offset[..., 1] * edge[..., 0]) / denominator
+        along_edge = (offset[..., 0] * delta[..., 1] - offset[..., 1] * delta[..., 0]) / denominator
+    crosses = (denominator != 0) & (along_segment >= 0) & (along_segment <= 1) \
+        & (along_edge >= 0) & (along_edge <= 1)
+    hit = crosses.any(axis=1)
+
+    # Or starts inside, by counting edge crossings of a ray to the right
+    point_y = start[..., 1]
+    y1 = edge_start[..., 1]
+    y2 = y1 + edge[..., 1]
+    straddles = (y1 > point_y) != (y2 > point_y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing_x = edge_start[..., 0] + (point_y - y1) / edge[..., 1] * edge[..., 0]
+    inside = (np.count_nonzero(straddles & (start[..., 0] < crossing_x), axis=1) % 2) == 1
+    hit |= inside
+
+    visible[segment_index[hit]] = False
+    return visible.tolist()
 
 
 """
@@ -187,6 +339,21 @@ def _expand(pos, grid_size):
     return int(pos[0] * grid_size),  int(pos[1] * grid_size)
 
 
+_TOUCH_TOLERANCE = 1e-6
+
+
+def _relative_hit_box(sprite: Sprite) -> PointList:
+    """ A sprite's hit box scaled and rotated like get_adjusted_hit_box, but around (0, 0). """
+    points = []
+    for x, y in sprite.get_hit_box():
+        x *= sprite.scale
+        y *= sprite.scale
+        if sprite.angle:
+            x, y = rotate_point(x, y, 0, 0, sprite.angle)
+        points.append((x, y))
+    return points
+
+
 class AStarBarrierList:
     """
     Class that manages a list of barriers that can be encountered during
@@ -218,35 +385,116 @@ def __init__(self,
         self.moving_sprite = moving_sprite
         self.blocking_sprites = blocking_sprites
         self.barrier_list = None
+        self.barrier_mask = None
+        # Flow fields by goal cells, most recently used last
+        self._flow_fields: "OrderedDict[Tuple, FlowField]" = OrderedDict()
 
         self.recalculate()
 
+    def _rasterize(self, first_cx: int, last_cx: int, first_cy: int, last_cy: int):
+        """
+        Work out which cells in a range of the grid are blocked, and store them
+        in the barrier mask.
+
+        Rather than moving the sprite to every cell to check for collisions,
+        each blocking sprite's hit box is tested against the moving sprite's
+        hit box at all cells near it at once. This is the same separating axis
+        test :func:`check_for_collision` does, with the moving sprite's
+        position as an offset along each axis.
+        """
+        region = self.barrier_mask[first_cy - self.bottom:last_cy - self.bottom + 1,
+                                   first_cx - self.left:last_cx - self.left + 1]
+        region[:] = False
+
+        # Hit box of the moving sprite around its center, and how far it reaches
+        mover = np.array(_relative_hit_box(self.moving_sprite), dtype=np.float64)
+        if len(mover) == 0:
+            return
+        mover_min = mover.min(axis=0)
+        mover_max = mover.max(axis=0)
+
+        for sprite in self.blocking_sprites:
+            if sprite is self.moving_sprite:
+                continue
+            wall = np.array(sprite.get_adjusted_hit_box(), dtype=np.float64)
+            if len(wall) == 0:
+                continue
+
+            # Cells where the hit box bounds overlap, plus one to be safe about rounding
+            low = wall.min(axis=0) - mover_max
+            high = wall.max(axis=0) - mover_min
+            cx_start = max(math.floor(low[0] / self.grid_size) - 1, first_cx)
+            cx_end = min(math.ceil(high[0] / self.grid_size) + 1, last_cx)
+            cy_start = max(math.floor(low[1] / self.grid_size) - 1, first_cy)
+            cy_end = min(math.ceil(high[1] / self.grid_size) + 1, last_cy)
+            if cx_start > cx_end or cy_start > cy_end:
+                continue
+
+            # Positions the moving sprite is put at for each cell, as _expand does
+            xs = np.trunc(np.arange(cx_start, cx_end + 1) * self.grid_size)
+            ys = np.trunc(np.arange(cy_start, cy_end + 1) * self.grid_size)
+            separated = np.zeros((len(ys), len(xs)), dtype=bool)
+            for polygon in (mover, wall):
+                edges = np.roll(polygon, -1, axis=0) - polygon
+                for normal_x, normal_y in zip(edges[:, 1], -edges[:, 0]):
+                    mover_projection = mover[:, 0] * normal_x + mover[:, 1] * normal_y
+                    wall_projection = wall[:, 0] * normal_x + wall[:, 1] * normal_y
+                    offset = ys[:, None] * normal_y + xs[None, :] * normal_x
+                    # Touching doesn't count as colliding, allow for rounding
+                    separated |= (mover_projection.max() + offset <= wall_projection.min() + _TOUCH_TOLERANCE) \
+                        | (wall_projection.max() <= mover_projection.min() + offset + _TOUCH_TOLERANCE)
+
+            region[cy_start - first_cy:cy_end - first_cy + 1,
+                   cx_start - first_cx:cx_end - first_cx + 1] |= ~separated
+
+    def _update_barrier_list(self):
+        cy, cx = np.nonzero(self.barrier_mask)
+        self.barrier_list = sorted(zip((cx + self.left).tolist(), (cy + self.bottom).tolist()))
+        self._flow_fields.clear()
+
     def recalculate(self):
         """
         Recalculate blocking sprites.
         """
-        # --- Iterate through the blocking sprites and find where we are blocked
+        self.barrier_mask = np.zeros((self.top - self.bottom + 1, self.right - self.left + 1), dtype=bool)
+        self._rasterize(self.left, self.right, self.bottom, self.top)
+        self._update_barrier_list()
 
-        # Save original location
-        original_pos = self.moving_sprite.position
-        # Create a set of barriers
-        self.barrier_list = set()
-        # Loop through the grid
-        for cx in range(self.left, self.right + 1):
-            for cy in range(self.bottom, self.top + 1):
-                # Grid location
-                cpos = cx, cy
-                # Pixel location
-                pos = _expand(cpos, self.grid_size)
+    def update_region(self, rect: Rect):
+        """
+        Recalculate only the part of the grid a change in the blocking sprites
+        can affect, such as a door opening. Much faster than
+        :meth:`recalculate` for small changes.
 
-                # See if we'll have a collision if our sprite is at this location
-                self.moving_sprite.position = pos
-                if len(check_for_collision_with_list(self.moving_sprite, self.blocking_sprites)) > 0:
-                    self.barrier_list.add(cpos)
+        :param Rect rect: (left, bottom, width, height) in pixels of the area
+                          where blocking sprites were added, removed or moved.
+                          Cover both the old and the new place of a moved sprite.
+        """
+        left, bottom, width, height = rect
+        # Every cell where the moving sprite would reach into the area
+        mover = _relative_hit_box(self.moving_sprite)
+        extent_right = max(point[0] for point in mover)
+        extent_left = -min(point[0] for point in mover)
+        extent_up = max(point[1] for point in mover)
+        extent_down = -min(point[1] for point in mover)
 
-        # Restore original location
-        self.moving_sprite.position = original_pos
-        self.barrier_list = sorted(self.barrier_list)
+        first_cx = max(math.floor((left - extent_right) / self.grid_size) - 1, self.left)
+        last_cx = min(math.ceil((left + width + extent_left) / self.grid_size) + 1, self.right)
+        first_cy = max(math.floor((bottom - extent_up) / self.grid_size) - 1, self.bottom)
+        last_cy = min(math.ceil((bottom + height + extent_down) / self.grid_size) + 1, self.top)
+        if first_cx > last_cx or first_cy > last_cy:
+            return
+
+        self._rasterize(first_cx, last_cx, first_cy, last_cy)
+        self._update_barrier_list()
+
+    def get_cost_grid(self) -> np.ndarray:
+        """
+        Get the barriers as a cost grid for :func:`astar_grid_path`. Cell
+        (x, y) of the barrier list is at [y - bottom, x - left] in the grid.
+        Barriers cost infinity to enter, all other cells cost 1.
+        """
+        return np.where(self.barrier_mask, np.inf, 1.0)
 
 
 def astar_calculate_path(start_point: Point,
@@ -285,3 +533,1008 @@ def astar_calculate_path(start_point: Point,
     # locations.
     revised_result = [_expand(p, grid_size) for p in result]
     return revised_result
+
+
+_SQRT2 = math.sqrt(2)
+
+
+def _octile_distance(dx: int, dy: int) -> float:
+    return max(dx, dy) + (_SQRT2 - 1) * min(dx, dy)
+
+
+def _manhattan_distance(dx: int, dy: int) -> float:
+    return dx + dy
+
+
+_HEURISTICS = {
+    "octile": _octile_distance,
+    "manhattan": _manhattan_distance,
+}
+
+
+class _GridSearch:
+    """
+    A* and Jump Point Search over a cost grid, for :func:`astar_grid_path`.
+    Cells are (x, y) tuples. Costs are given as a flat list, row by row, as
+    that is much faster than indexing the NumPy array one cell at a time.
+    """
+    def __init__(self, costs: List[float], shape: Tuple[int, int], goal: Tuple[int, int], heuristic,
+                 diagonal_movement: bool):
+        self.height, self.width = shape
+        self.costs = costs
+        self.goal = goal
+        self.heuristic = heuristic
+        if diagonal_movement:
+            self.directions = (1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, 1), (1, -1), (-1, -1)
+        else:
+            self.directions = (1, 0), (-1, 0), (0, 1), (0, -1)
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and self.costs[y * self.width + x] != math.inf
+
+    def estimate(self, cell: Tuple[int, int]) -> float:
+        return self.heuristic(abs(cell[0] - self.goal[0]), abs(cell[1] - self.goal[1]))
+
+    def neighbours(self, cell: Tuple[int, int], parent: Optional[Tuple[int, int]]):
+        """ Cells to move to next. Diagonal moves can't cut the corner of a blocked cell. """
+        x, y = cell
+        for dx, dy in self.directions:
+            if not self.is_walkable(x + dx, y + dy):
+                continue
+            if dx and dy and not (self.is_walkable(x + dx, y) and self.is_walkable(x, y + dy)):
+                continue
+            yield x + dx, y + dy
+
+    def search(self, start: Tuple[int, int], max_iterations: Optional[int]) -> Optional[List[Tuple[int, int]]]:
+        if not (self.is_walkable(*start) and self.is_walkable(*self.goal)):
+            return None
+
+        g_scores: Dict[Tuple[int, int], float] = {start: 0}
+        came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        closed = set()
+        # Ties on the total estimate go to the cell closest to the goal, then to the oldest
+        counter = 0
+        open_heap = [(self.estimate(start), self.estimate(start), counter, start)]
+
+        iterations = 0
+        while open_heap:
+            _, _, _, current = heapq.heappop(open_heap)
+            if current in closed:
+                continue
+            if current == self.goal:
+                path = [current]
+                while current in came_from:
+                    current = came_from[current]
+                    path.append(current)
+                path.reverse()
+                return path
+
+            iterations += 1
+            if max_iterations is not None and iterations > max_iterations:
+                return None
+            closed.add(current)
+
+            g_current = g_scores[current]
+            for neighbour in self.neighbours(current, came_from.get(current)):
+                if neighbour in closed:
+                    continue
+                candidate_g = g_current + self.move_cost(current, neighbour)
+                if candidate_g < g_scores.get(neighbour, math.inf):
+                    g_scores[neighbour] = candidate_g
+                    came_from[neighbour] = current
+                    h = self.estimate(neighbour)
+                    counter += 1
+                    heapq.heappush(open_heap, (candidate_g + h, h, counter, neighbour))
+        return None
+
+    def move_cost(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
+        cost = self.costs[b[1] * self.width + b[0]]
+        return cost if a[0] == b[0] or a[1] == b[1] else cost * _SQRT2
+
+    def get_distances(self, starts: Iterable[Tuple[int, int]],
+                      reverse: bool = False) -> Dict[Tuple[int, int], float]:
+        """
+        Dijkstra: cost of the cheapest path from the nearest start to every
+        cell it can reach, or with `reverse` from every cell to its nearest start.
+        """
+        distances: Dict[Tuple[int, int], float] = {}
+        open_heap = [(0.0, start) for start in starts if self.is_walkable(*start)]
+        heapq.heapify(open_heap)
+        while open_heap:
+            distance, current = heapq.heappop(open_heap)
+            if current in distances:
+                continue
+            distances[current] = distance
+            for neighbour in self.neighbours(current, None):
+                if neighbour not in distances:
+                    cost = self.move_cost(neighbour, current) if reverse else self.move_cost(current, neighbour)
+                    heapq.heappush(open_heap, (distance + cost, neighbour))
+        return distances
+
+
+class _JumpPointSearch(_GridSearch):
+    """
+    Jump Point Search: A* on a grid where every open cell costs the same.
+    Straight and diagonal runs with nothing interesting beside them are
+    skipped over in one step, so far fewer cells go through the open set.
+    """
+    def neighbours(self, cell: Tuple[int, int], parent: Optional[Tuple[int, int]]):
+        if parent is None:
+            candidates = super().neighbours(cell, None)
+        else:
+            candidates = self._pruned_neighbours(cell, parent)
+        for next_x, next_y in candidates:
+            jump_point = self._jump(next_x, next_y, next_x - cell[0], next_y - cell[1])
+            if jump_point is not None:
+                yield jump_point
+
+    def _pruned_neighbours(self, cell: Tuple[int, int], parent: Tuple[int, int]):
+        """ The directions worth following, given the direction we came from. """
+        x, y = cell
+        dx = (x > parent[0]) - (x < parent[0])
+        dy = (y > parent[1]) - (y < parent[1])
+        walkable = self.is_walkable
+        if dx and dy:
+            if walkable(x, y + dy):
+                yield x, y + dy
+            if walkable(x + dx, y):
+                yield x + dx, y
+            if walkable(x, y + dy) and walkable(x + dx, y) and walkable(x + dx, y + dy):
+                yield x + dx, y + dy
+        elif dx:
+            next_open = walkable(x + dx, y)
+            up_open = walkable(x, y + 1)
+            down_open = walkable(x, y - 1)
+            if next_open:
+                yield x + dx, y
+                if up_open and walkable(x + dx, y + 1):
+                    yield x + dx, y + 1
+                if down_open and walkable(x + dx, y - 1):
+                    yield x + dx, y - 1
+            if up_open:
+                yield x, y + 1
+            if down_open:
+                yield x, y - 1
+        else:
+            next_open = walkable(x, y + dy)
+            right_open = walkable(x + 1, y)
+            left_open = walkable(x - 1, y)
+            if next_open:
+                yield x, y + dy
+                if right_open and walkable(x + 1, y + dy):
+                    yield x + 1, y + dy
+                if left_open and walkable(x - 1, y + dy):
+                    yield x - 1, y + dy
+            if right_open:
+                yield x + 1, y
+            if left_open:
+                yield x - 1, y
+
+    def _jump(self, x: int, y: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+        """ Run from (x, y) in direction (dx, dy) until a cell worth stopping at. """
+        walkable = self.is_walkable
+        while True:
+            if not walkable(x, y):
+                return None
+            if (x, y) == self.goal:
+                return x, y
+            if dx and dy:
+                if self._jump(x + dx, y, dx, 0) is not None or self._jump(x, y + dy, 0, dy) is not None:
+                    return x, y
+            elif dx:
+                if (walkable(x, y - 1) and not walkable(x - dx, y - 1)) \
+                        or (walkable(x, y + 1) and not walkable(x - dx, y + 1)):
+                    return x, y
+            else:
+                if (walkable(x - 1, y) and not walkable(x - 1, y - dy)) \
+                        or (walkable(x + 1, y) and not walkable(x + 1, y - dy)):
+                    return x, y
+            # Diagonal runs can't squeeze between two blocked cells
+            if not (walkable(x + dx, y) and walkable(x, y + dy)):
+                return None
+            x += dx
+            y += dy
+
+    def move_cost(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
+        return _octile_distance(abs(a[0] - b[0]), abs(a[1] - b[1])) * self.costs[b[1] * self.width + b[0]]
+
+    def search(self, start: Tuple[int, int], max_iterations: Optional[int]) -> Optional[List[Tuple[int, int]]]:
+        jump_points = super().search(start, max_iterations)
+        if jump_points is None:
+            return None
+
+        # Fill in the cells between jump points, which are always on a straight or diagonal line
+        path = [jump_points[0]]
+        for x, y in jump_points[1:]:
+            last_x, last_y = path[-1]
+            dx = (x > last_x) - (x < last_x)
+            dy = (y > last_y) - (y < last_y)
+            while (last_x, last_y) != (x, y):
+                last_x += dx
+                last_y += dy
+                path.append((last_x, last_y))
+        return path
+
+
+def astar_grid_path(start: Tuple[int, int],
+                    goal: Tuple[int, int],
+                    cost_grid: np.ndarray,
+                    diagonal_movement: bool = True,
+                    heuristic: Union[str, Callable[[int, int], float]] = "octile",
+                    jump_point_search: bool = False,
+                    max_iterations: Optional[int] = None) -> Optional[List[Tuple[int, int]]]:
+    """
+    Find the cheapest path between two cells of a grid with A*.
+
+    The grid gives the cost of entering each cell, with ``np.inf`` for cells
+    that can't be entered. Diagonal moves cost the square root of two times
+    as much, and can't cut the corner of a blocked cell. Get a grid from an
+    :class:`AStarBarrierList` with :meth:`AStarBarrierList.get_cost_grid`, or
+    make one from an array of blocked cells with
+    ``np.where(blocked, np.inf, 1.0)``.
+
+    :param start: (x, y) cell to start from.
+    :param goal: (x, y) cell to go to.
+    :param np.ndarray cost_grid: 2D array of costs, indexed by [y, x].
+    :param bool diagonal_movement: Allow moving diagonally.
+    :param heuristic: 'octile' or 'manhattan', or a function taking the x and y
+                      distance to the goal in cells. The heuristic is scaled by
+                      the cheapest cell cost. 'manhattan' is only exact without
+                      diagonal movement, with it searches are faster but paths
+                      may not be the shortest.
+    :param bool jump_point_search: Use Jump Point Search, which is much faster on
+                                   big open areas. Needs diagonal movement, and
+                                   all cells that can be entered must cost the same.
+    :param int max_iterations: Give up after looking at this many cells.
+                               Defaults to no limit.
+
+    :returns: List of (x, y) cells from start to goal, or None if there is no
+              path or the search gave up.
+    """
+    cost_grid = np.asarray(cost_grid, dtype=np.float64)
+    if cost_grid.ndim != 2:
+        raise ValueError("The cost grid has to be a 2D array.")
+
+    distance = _HEURISTICS[heuristic] if isinstance(heuristic, str) else heuristic
+    open_costs = cost_grid[np.isfinite(cost_grid)]
+    if len(open_costs) == 0:
+        return None
+    min_cost = float(open_costs.min())
+    if min_cost <= 0:
+        raise ValueError("Cell costs have to be positive.")
+
+    def scaled_heuristic(dx: int, dy: int) -> float:
+        return distance(dx, dy) * min_cost
+
+    start = int(start[0]), int(start[1])
+    goal = int(goal[0]), int(goal[1])
+    if jump_point_search:
+        if not diagonal_movement:
+            raise ValueError("Jump Point Search needs diagonal movement.")
+        if float(open_costs.max()) != min_cost:
+            raise ValueError("Jump Point Search needs all open cells to cost the same.")
+        search = _JumpPointSearch(cost_grid.ravel().tolist(), cost_grid.shape, goal, scaled_heuristic,
+                                  diagonal_movement)
+    else:
+        search = _GridSearch(cost_grid.ravel().tolist(), cost_grid.shape, goal, scaled_heuristic,
+                             diagonal_movement)
+    return search.search(start, max_iterations)
+
+
+# Cell offsets a flow field can point in, and the cost of each step
+_FLOW_DIRECTIONS = ((1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+                    (1, 1, _SQRT2), (-1, 1, _SQRT2), (1, -1, _SQRT2), (-1, -1, _SQRT2))
+
+# Number of flow fields an AStarBarrierList keeps for reuse
+FLOW_FIELD_CACHE_SIZE = 16
+
+
+def _shift(grid: np.ndarray, dx: int, dy: int, fill) -> np.ndarray:
+    """ For each cell, the value of the cell (dx, dy) away, or `fill` past the edge. """
+    height, width = grid.shape
+    padded = np.full((height + 2, width + 2), fill, dtype=grid.dtype)
+    padded[1:-1, 1:-1] = grid
+    return padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+
+class FlowField:
+    """
+    Distance to the nearest goal and the direction to head in, for every cell
+    of an :class:`AStarBarrierList`. Get one with :func:`flow_field_calculate`.
+
+    All agents heading for the same goals can share one field, and each one
+    looks up its next step in constant time.
+
+    :param AStarBarrierList astar_barrier_list: Grid the field is for.
+    :param goal_cells: (x, y) grid cells to head for.
+    :param bool diagonal_movement: Allow moving diagonally.
+    """
+    def __init__(self,
+                 astar_barrier_list: "AStarBarrierList",
+                 goal_cells: Iterable[Tuple[int, int]],
+                 diagonal_movement: bool = True):
+        self.grid_size = astar_barrier_list.grid_size
+        self.left = astar_barrier_list.left
+        self.bottom = astar_barrier_list.bottom
+        self.goal_cells = tuple(goal_cells)
+
+        open_cells = ~astar_barrier_list.barrier_mask
+        directions = _FLOW_DIRECTIONS if diagonal_movement else _FLOW_DIRECTIONS[:4]
+
+        # Cost of each step from each cell: infinite where either end is blocked,
+        # or where it would cut past a blocked corner
+        step_costs = []
+        for dx, dy, cost in directions:
+            can_move = open_cells & _shift(open_cells, dx, dy, False)
+            if dx and dy:
+                can_move &= _shift(open_cells, dx, 0, False) & _shift(open_cells, 0, dy, False)
+            step_costs.append(np.where(can_move, cost, np.inf))
+
+        # Integration field, from a Dijkstra search spreading out from all the goals at once.
+        # Every step costs the same both ways, so distances from the goals are distances to them.
+        height, width = open_cells.shape
+        search = _GridSearch(np.where(open_cells, 1.0, np.inf).ravel().tolist(), open_cells.shape,
+                             None, None, diagonal_movement)
+        goal_indexes = [(cx - self.left, cy - self.bottom) for cx, cy in self.goal_cells]
+        distances = np.full((height, width), np.inf)
+        for (column, row), distance in search.get_distances(goal_indexes).items():
+            distances[row, column] = distance
+        self.distances = distances
+
+        # Step towards the neighbour closest to a goal. Goals and unreachable cells stay put.
+        padded = np.full((height + 2, width + 2), np.inf)
+        padded[1:-1, 1:-1] = distances
+        neighbour_views = [padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width] for dx, dy, _ in directions]
+        best = np.stack([neighbours + step_cost
+                         for neighbours, step_cost in zip(neighbour_views, step_costs)]).argmin(axis=0)
+        moving = np.isfinite(distances) & (distances > 0)
+        self.step_x = np.where(moving, np.array([dx for dx, _, _ in directions], dtype=np.int8)[best], 0)
+        self.step_y = np.where(moving, np.array([dy for _, dy, _ in directions], dtype=np.int8)[best], 0)
+
+    def _get_index(self, position: Point) -> Optional[Tuple[int, int]]:
+        cx, cy = _collapse(position, self.grid_size)
+        row, column = cy - self.bottom, cx - self.left
+        if 0 <= row < self.distances.shape[0] and 0 <= column < self.distances.shape[1]:
+            return row, column
+        return None
+
+    def get_direction(self, position: Point) -> Tuple[int, int]:
+        """
+        Which way to go from a position to get closer to a goal.
+
+        :param Point position: Position in pixels.
+        :returns: (x, y) step in cells, each -1, 0 or 1. (0, 0) at a goal, in a
+                  barrier, off the grid or where no goal can be reached.
+        """
+        index = self._get_index(position)
+        if index is None:
+            return 0, 0
+        return int(self.step_x[index]), int(self.step_y[index])
+
+    def get_distance(self, position: Point) -> float:
+        """
+        Path length from a position to the nearest goal, in cells.
+
+        :param Point position: Position in pixels.
+        :returns: Distance, or infinity if no goal can be reached.
+        """
+        index = self._get_index(position)
+        if index is None:
+            return math.inf
+        return float(self.distances[index])
+
+
+def flow_field_calculate(goal_points: Union[Point, Iterable[Point]],
+                         astar_barrier_list: AStarBarrierList,
+                         diagonal_movement: bool = True) -> FlowField:
+    """
+    Get a flow field leading to one or more goals, for moving many sprites to
+    the same place without a path search for each of them.
+
+    Fields are kept by the barrier list and reused for the same goal cells,
+    until the barriers change with :meth:`AStarBarrierList.recalculate` or
+    :meth:`AStarBarrierList.update_region`. Calling this every frame is cheap
+    as long as the goals stay in the same cells.
+
+    .. code-block:: python
+
+        field = arcade.flow_field_calculate(player.position, barrier_list)
+        for enemy in enemy_list:
+            step_x, step_y = field.get_direction(enemy.position)
+            enemy.change_x = step_x * ENEMY_SPEED
+            enemy.change_y = step_y * ENEMY_SPEED
+
+    :param goal_points: Position in pixels of the goal, or a list of them.
+    :param AStarBarrierList astar_barrier_list: Barriers to find the way around.
+    :param bool diagonal_movement: Allow moving diagonally.
+
+    :returns: FlowField
+    """
+    grid_size = astar_barrier_list.grid_size
+    goal_points = list(goal_points)
+    if goal_points and not isinstance(goal_points[0], (tuple, list)):
+        goal_points = [goal_points]
+    goal_cells = tuple(sorted({_collapse(point, grid_size) for point in goal_points}))
+
+    key = goal_cells, diagonal_movement
+    cache = astar_barrier_list._flow_fields
+    field = cache.get(key)
+    if field is not None:
+        cache.move_to_end(key)
+        return field
+
+    field = FlowField(astar_barrier_list, goal_cells, diagonal_movement)
+    cache[key] = field
+    while len(cache) > FLOW_FIELD_CACHE_SIZE:
+        cache.popitem(last=False)
+    return field
+
+
+# Entrances at least this many cells wide get a transition at each end, not just the middle
+_HPA_WIDE_ENTRANCE = 6
+
+
+class HierarchicalPathfinder:
+    """
+    Hierarchical path finding (HPA*) for grids too big to search cell by cell.
+
+    The grid is split into square clusters. Where two clusters share open
+    border cells, transitions are placed between them. A path is found by
+    first searching the graph of transitions, which skips across whole
+    clusters at a time, and then finding the short paths between consecutive
+    transitions inside their cluster. Paths are close to, but not always
+    exactly, the shortest.
+
+    The distances between the transitions of a cluster are worked out the
+    first time a search passes through it, and kept. When walls change, call
+    :meth:`update_region` and only the clusters around the change are redone.
+
+    .. code-block:: python
+
+        pathfinder = arcade.HierarchicalPathfinder(barrier_list.get_cost_grid())
+        path = pathfinder.find_path((0, 0), (2000, 1500))
+
+    :param np.ndarray cost_grid: 2D array of cell costs, indexed by [y, x], with
+                                 ``np.inf`` for blocked cells. See :func:`astar_grid_path`.
+    :param int cluster_size: Width and height of a cluster, in cells.
+    :param bool diagonal_movement: Allow moving diagonally.
+    """
+    def __init__(self, cost_grid: np.ndarray, cluster_size: int = 16, diagonal_movement: bool = True):
+        self.cost_grid = np.array(cost_grid, dtype=np.float64)
+        if self.cost_grid.ndim != 2:
+            raise ValueError("The cost grid has to be a 2D array.")
+        self.cluster_size = cluster_size
+        self.diagonal_movement = diagonal_movement
+        self.height, self.width = self.cost_grid.shape
+        self.clusters_x = math.ceil(self.width / cluster_size)
+        self.clusters_y = math.ceil(self.height / cluster_size)
+
+        # Transitions across each cluster border, as pairs of cells on either side
+        self._borders: Dict[Tuple[int, int, int], List[Tuple[Tuple[int, int], Tuple[int, int]]]] = {}
+        # Cells of each transition, and the cells they lead to in the next cluster
+        self._links: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        self._cluster_nodes: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        # Distances from each transition cell to every cell of its cluster, made on first use
+        self._cluster_distances: Dict[Tuple[int, int], Dict[Tuple[int, int], Dict[Tuple[int, int], float]]] = {}
+        self._update_min_cost()
+
+        for cluster_x in range(self.clusters_x):
+            for cluster_y in range(self.clusters_y):
+                for border in self._get_cluster_borders(cluster_x, cluster_y):
+                    if border not in self._borders:
+                        self._add_border(border)
+        for cluster_x in range(self.clusters_x):
+            for cluster_y in range(self.clusters_y):
+                self._update_cluster_nodes((cluster_x, cluster_y))
+
+    def _get_cluster(self, cell: Tuple[int, int]) -> Tuple[int, int]:
+        return cell[0] // self.cluster_size, cell[1] // self.cluster_size
+
+    def _get_cluster_bounds(self, cluster: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """ First x, first y, end x and end y of a cluster's cells. """
+        x = cluster[0] * self.cluster_size
+        y = cluster[1] * self.cluster_size
+        return x, y, min(x + self.cluster_size, self.width), min(y + self.cluster_size, self.height)
+
+    def _get_cluster_borders(self, cluster_x: int, cluster_y: int) -> List[Tuple[int, int, int]]:
+        """
+        Borders around a cluster. (0, x, y) is the border between cluster (x, y)
+        and the one to its right, (1, x, y) the one above it.
+        """
+        borders = []
+        if cluster_x + 1 < self.clusters_x:
+            borders.append((0, cluster_x, cluster_y))
+        if cluster_x > 0:
+            borders.append((0, cluster_x - 1, cluster_y))
+        if cluster_y + 1 < self.clusters_y:
+            borders.append((1, cluster_x, cluster_y))
+        if cluster_y > 0:
+            borders.append((1, cluster_x, cluster_y - 1))
+        return borders
+
+    def _add_border(self, border: Tuple[int, int, int]):
+        """ Find the open stretches along a border and place transitions across them. """
+        vertical, cluster_x, cluster_y = border
+        first_x, first_y, end_x, end_y = self._get_cluster_bounds((cluster_x, cluster_y))
+        if vertical == 0:
+            # Column at the right edge of the cluster, and the one after it
+            cells = [((end_x - 1, y), (end_x, y)) for y in range(first_y, end_y)]
+        else:
+            cells = [((x, end_y - 1), (x, end_y)) for x in range(first_x, end_x)]
+
+        transitions = []
+        run: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+        for pair in cells + [None]:
+            if pair is not None and all(math.isfinite(self.cost_grid[cell[1], cell[0]]) for cell in pair):
+                run.append(pair)
+                continue
+            if len(run) >= _HPA_WIDE_ENTRANCE:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+
+        self._borders[border] = transitions
+        for cell_a, cell_b in transitions:
+            self._links.setdefault(cell_a, []).append(cell_b)
+            self._links.setdefault(cell_b, []).append(cell_a)
+
+    def _remove_border(self, border: Tuple[int, int, int]):
+        for cell_a, cell_b in self._borders.pop(border, []):
+            for cell, other in (cell_a, cell_b), (cell_b, cell_a):
+                links = self._links.get(cell)
+                if links is not None:
+                    links.remove(other)
+                    if not links:
+                        del self._links[cell]
+
+    def _update_cluster_nodes(self, cluster: Tuple[int, int]):
+        first_x, first_y, end_x, end_y = self._get_cluster_bounds(cluster)
+        nodes = set()
+        for border in self._get_cluster_borders(*cluster):
+            for pair in self._borders.get(border, []):
+                nodes.update(cell for cell in pair if first_x <= cell[0] < end_x and first_y <= cell[1] < end_y)
+        self._cluster_nodes[cluster] = sorted(nodes)
+        self._cluster_distances.pop(cluster, None)
+
+    def _create_search(self, bounds: Tuple[int, int, int, int], goal: Tuple[int, int]) -> "_GridSearch":
+        """ A search limited to part of the grid. Cells are relative to its corner. """
+        first_x, first_y, end_x, end_y = bounds
+        min_cost = self._min_cost
+
+        def heuristic(dx: int, dy: int) -> float:
+            return _octile_distance(dx, dy) * min_cost
+
+        cost_grid = self.cost_grid[first_y:end_y, first_x:end_x]
+        return _GridSearch(cost_grid.ravel().tolist(), cost_grid.shape,
+                           (goal[0] - first_x, goal[1] - first_y), heuristic, self.diagonal_movement)
+
+    def _search_within(self, bounds: Tuple[int, int, int, int],
+                       start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        first_x, first_y, _, _ = bounds
+        path = self._create_search(bounds, goal).search((start[0] - first_x, start[1] - first_y), None)
+        if path is None:
+            return None
+        return [(x + first_x, y + first_y) for x, y in path]
+
+    def _update_min_cost(self):
+        """ Cheapest cell cost, to scale the heuristic by. """
+        open_costs = self.cost_grid[np.isfinite(self.cost_grid)]
+        self._min_cost = float(open_costs.min()) if len(open_costs) else 1.0
+
+    def _get_local_distances(self, cell: Tuple[int, int], reverse: bool = False) -> Dict[Tuple[int, int], float]:
+        """ Distances from a cell to the rest of its cluster, or the other way around. """
+        cluster = self._get_cluster(cell)
+        bounds = self._get_cluster_bounds(cluster)
+        first_x, first_y, _, _ = bounds
+        search = self._create_search(bounds, cell)
+        distances = search.get_distances([(cell[0] - first_x, cell[1] - first_y)], reverse)
+        return {(x + first_x, y + first_y): distance for (x, y), distance in distances.items()}
+
+    def _get_cluster_edges(self, cluster: Tuple[int, int]) -> Dict[Tuple[int, int], List[Tuple[Tuple[int, int], float]]]:
+        """
+        Distances between the transitions of a cluster, worked out on first use.
+        All transitions are done at once, relaxing a stack of distance grids,
+        one per transition, until nothing gets shorter.
+        """
+        edges = self._cluster_distances.get(cluster)
+        if edges is not None:
+            return edges
+
+        first_x, first_y, end_x, end_y = self._get_cluster_bounds(cluster)
+        costs = self.cost_grid[first_y:end_y, first_x:end_x]
+        height, width = costs.shape
+        nodes = self._cluster_nodes[cluster]
+        open_cells = np.isfinite(costs)
+
+        # Cost of stepping into each cell from the cell (-dx, -dy) away
+        directions = _FLOW_DIRECTIONS if self.diagonal_movement else _FLOW_DIRECTIONS[:4]
+        step_costs = []
+        for dx, dy, step in directions:
+            can_move = open_cells & _shift(open_cells, -dx, -dy, False)
+            if dx and dy:
+                can_move &= _shift(open_cells, -dx, 0, False) & _shift(open_cells, 0, -dy, False)
+            step_costs.append(np.where(can_move, costs * step, np.inf))
+
+        distances = np.full((len(nodes), height, width), np.inf)
+        for index, (x, y) in enumerate(nodes):
+            distances[index, y - first_y, x - first_x] = 0
+        padded = np.full((len(nodes), height + 2, width + 2), np.inf)
+        neighbour_views = [padded[:, 1 - dy:1 - dy + height, 1 - dx:1 - dx + width] for dx, dy, _ in directions]
+        candidate = np.empty_like(distances)
+        while True:
+            padded[:, 1:-1, 1:-1] = distances
+            updated = distances.copy()
+            for neighbours, step_cost in zip(neighbour_views, step_costs):
+                np.add(neighbours, step_cost, out=candidate)
+                np.minimum(updated, candidate, out=updated)
+            if np.array_equal(updated, distances):
+                break
+            distances = updated
+
+        edges = {}
+        for index, node in enumerate(nodes):
+            edges[node] = [(other, float(distances[index, other[1] - first_y, other[0] - first_x]))
+                           for other in nodes
+                           if other != node and math.isfinite(distances[index, other[1] - first_y, other[0] - first_x])]
+        self._cluster_distances[cluster] = edges
+        return edges
+
+    def update_region(self, x: int, y: int, width: int, height: int, cost_grid: Optional[np.ndarray] = None):
+        """
+        Redo the clusters covering a changed part of the grid.
+
+        :param int x: First column that changed.
+        :param int y: First row that changed.
+        :param int width: Number of columns that changed.
+        :param int height: Number of rows that changed.
+        :param np.ndarray cost_grid: Grid to copy the new costs of the region
+                                     from. Leave out if :attr:`cost_grid` was
+                                     changed directly.
+        """
+        if cost_grid is not None:
+            self.cost_grid[y:y + height, x:x + width] = cost_grid[y:y + height, x:x + width]
+        self._update_min_cost()
+
+        first_cluster = self._get_cluster((max(x, 0), max(y, 0)))
+        last_cluster = self._get_cluster((min(x + width, self.width) - 1, min(y + height, self.height) - 1))
+        changed = [(cluster_x, cluster_y)
+                   for cluster_x in range(first_cluster[0], last_cluster[0] + 1)
+                   for cluster_y in range(first_cluster[1], last_cluster[1] + 1)]
+
+        borders = {border for cluster in changed for border in self._get_cluster_borders(*cluster)}
+        for border in borders:
+            self._remove_border(border)
+        for border in borders:
+            self._add_border(border)
+
+        # The clusters across the redone borders have new transitions too
+        touched = set(changed)
+        for vertical, cluster_x, cluster_y in borders:
+            touched.add((cluster_x, cluster_y))
+            touched.add((cluster_x + 1, cluster_y) if vertical == 0 else (cluster_x, cluster_y + 1))
+        for cluster in touched:
+            self._update_cluster_nodes(cluster)
+
+    def _refine(self, cell_a: Tuple[int, int], cell_b: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """ Cells from a to b, both in the same cluster or right next to each other. """
+        cluster = self._get_cluster(cell_a)
+        if cluster != self._get_cluster(cell_b):
+            return [cell_a, cell_b]
+        return self._search_within(self._get_cluster_bounds(cluster), cell_a, cell_b)
+
+    def _get_path_cost(self, path: List[Tuple[int, int]]) -> float:
+        cost = 0.0
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            step = 1 if x1 == x2 or y1 == y2 else _SQRT2
+            cost += self.cost_grid[y2, x2] * step
+        return cost
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a path between two cells.
+
+        :param start: (x, y) cell to start from.
+        :param goal: (x, y) cell to go to.
+        :returns: List of (x, y) cells from start to goal, or None if there is no path.
+        """
+        start = int(start[0]), int(start[1])
+        goal = int(goal[0]), int(goal[1])
+        for cell in start, goal:
+            if not (0 <= cell[0] < self.width and 0 <= cell[1] < self.height) \
+                    or not math.isfinite(self.cost_grid[cell[1], cell[0]]):
+                return None
+
+        start_cluster = self._get_cluster(start)
+        goal_cluster = self._get_cluster(goal)
+        min_cost = self._min_cost
+        start_distances = self._get_local_distances(start)
+        goal_distances = self._get_local_distances(goal, reverse=True)
+
+        def estimate(cell: Tuple[int, int]) -> float:
+            return _octile_distance(abs(cell[0] - goal[0]), abs(cell[1] - goal[1])) * min_cost
+
+        # A* over the transitions, with start and goal joined in through their clusters
+        g_scores: Dict[Tuple[int, int], float] = {start: 0.0}
+        came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        closed = set()
+        counter = 0
+        open_heap = [(estimate(start), counter, start)]
+        while open_heap:
+            _, _, current = heapq.heappop(open_heap)
+            if current in closed:
+                continue
+            if current == goal:
+                break
+            closed.add(current)
+
+            if current == start:
+                edges = [(node, start_distances[node]) for node in self._cluster_nodes[start_cluster]
+                         if node != start and node in start_distances]
+            else:
+                edges = list(self._get_cluster_edges(self._get_cluster(current)).get(current, []))
+            if current in goal_distances:
+                edges.append((goal, goal_distances[current]))
+            edges += [(other, self.cost_grid[other[1], other[0]]) for other in self._links.get(current, [])]
+
+            for neighbour, cost in edges:
+                candidate_g = g_scores[current] + cost
+                if neighbour not in closed and candidate_g < g_scores.get(neighbour, math.inf):
+                    g_scores[neighbour] = candidate_g
+                    came_from[neighbour] = current
+                    counter += 1
+                    heapq.heappush(open_heap, (candidate_g + estimate(neighbour), counter, neighbour))
+        else:
+            return None
+
+        abstract_path = [goal]
+        while abstract_path[-1] in came_from:
+            abstract_path.append(came_from[abstract_path[-1]])
+        abstract_path.reverse()
+
+        path = [start]
+        for cell_a, cell_b in zip(abstract_path, abstract_path[1:]):
+            segment = self._refine(cell_a, cell_b)
+            if segment is None:
+                return None
+            path += segment[1:]
+
+        # Short paths pay the most for going through transitions. Also try a
+        # plain search over the start and goal clusters, and keep the shorter.
+        if max(abs(start_cluster[0] - goal_cluster[0]), abs(start_cluster[1] - goal_cluster[1])) <= 1:
+            start_bounds = self._get_cluster_bounds(start_cluster)
+            goal_bounds = self._get_cluster_bounds(goal_cluster)
+            bounds = (min(start_bounds[0], goal_bounds[0]), min(start_bounds[1], goal_bounds[1]),
+                      max(start_bounds[2], goal_bounds[2]), max(start_bounds[3], goal_bounds[3]))
+            local_path = self._search_within(bounds, start, goal)
+            if local_path is not None and self._get_path_cost(local_path) < self._get_path_cost(path):
+                path = local_path
+        return path
+
+
+# The cost grid a worker process last attached to: (name, shared memory, flat costs, shape, cheapest cost)
+_worker_grid = None
+
+
+def _solve_path_request(grid_name: str,
+                        shape: Tuple[int, int],
+                        start: Tuple[int, int],
+                        goal: Tuple[int, int],
+                        diagonal_movement: bool,
+                        max_iterations: Optional[int]) -> Optional[List[Tuple[int, int]]]:
+    """
+    Runs in a worker process of a :class:`PathRequestQueue`. The cost grid is
+    read from shared memory, and kept as a flat list until the queue shares
+    a new grid.
+    """
+    global _worker_grid
+    if _worker_grid is None or _worker_grid[0] != grid_name:
+        if _worker_grid is not None:
+            _worker_grid[1].close()
+        memory = shared_memory.SharedMemory(name=grid_name)
+        cost_grid = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+        open_costs = cost_grid[np.isfinite(cost_grid)]
+        min_cost = float(open_costs.min()) if len(open_costs) else 1.0
+        _worker_grid = grid_name, memory, cost_grid.ravel().tolist(), shape, min_cost
+    _, _, costs, shape, min_cost = _worker_grid
+
+    def heuristic(dx: int, dy: int) -> float:
+        return _octile_distance(dx, dy) * min_cost
+
+    search = _GridSearch(costs, shape, goal, heuristic, diagonal_movement)
+    return search.search(start, max_iterations)
+
+
+class PathRequest:
+    """
+    Handle for a path asked for from a :class:`PathRequestQueue`.
+
+    :attr:`path` is set, and :attr:`done` becomes True, during the
+    :meth:`PathRequestQueue.update` call that hands the result over.
+    """
+    def __init__(self, start_point: Point, end_point: Point, key, on_done):
+        self.start_point = start_point
+        self.end_point = end_point
+        self.key = key
+        self.on_done = on_done
+        self.path: Optional[List[Point]] = None
+        self.done = False
+        self.cancelled = False
+        self._future: Optional[Future] = None
+
+    def cancel(self):
+        """ Drop the request. Its result is thrown away if the search already started. """
+        self.cancelled = True
+        if self._future is not None:
+            self._future.cancel()
+
+
+class PathRequestQueue:
+    """
+    Finds paths in worker processes, so many sprites can ask for a new path
+    on the same frame without the game stalling.
+
+    The barrier grid is copied once into shared memory, which all workers
+    read from. Submit requests with :meth:`submit`, and call :meth:`update`
+    once per frame to collect finished paths on the main thread. Paths come
+    out as lists of points, like :func:`astar_calculate_path` returns.
+
+    .. code-block:: python
+
+        self.path_queue = arcade.PathRequestQueue(self.barrier_list)
+
+        def on_update(self, delta_time):
+            for enemy in self.enemy_list:
+                if enemy.needs_path:
+                    # A newer request for the same enemy cancels the old one
+                    self.path_queue.submit(enemy.position, self.player.position, key=enemy,
+                                           on_done=lambda request, enemy=enemy: enemy.follow(request.path))
+            self.path_queue.update()
+
+    Shared memory needs Python 3.8. On older versions the searches run on a
+    background thread instead.
+
+    :param AStarBarrierList astar_barrier_list: Barriers to find paths around.
+    :param int workers: Number of worker processes.
+    :param bool diagonal_movement: Allow moving diagonally.
+    :param int max_iterations: Give up on a search after looking at this many cells.
+    """
+    def __init__(self,
+                 astar_barrier_list: AStarBarrierList,
+                 workers: int = 2,
+                 diagonal_movement: bool = True,
+                 max_iterations: Optional[int] = None):
+        self.diagonal_movement = diagonal_movement
+        self.max_iterations = max_iterations
+        self._pending: "OrderedDict[PathRequest, None]" = OrderedDict()
+        self._by_key: Dict = {}
+        self._memory = None
+        self._executor: Executor
+        if shared_memory is not None:
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arcade-paths")
+        self.update_barriers(astar_barrier_list)
+
+    def update_barriers(self, astar_barrier_list: AStarBarrierList):
+        """
+        Share a new copy of the barriers with the workers, after they changed.
+        Requests still waiting are searched again against the new barriers.
+        """
+        self.grid_size = astar_barrier_list.grid_size
+        self.left = astar_barrier_list.left
+        self.bottom = astar_barrier_list.bottom
+        cost_grid = astar_barrier_list.get_cost_grid()
+
+        old_memory = self._memory
+        if shared_memory is not None:
+            self._memory = shared_memory.SharedMemory(create=True, size=max(cost_grid.nbytes, 1))
+            np.ndarray(cost_grid.shape, dtype=np.float64, buffer=self._memory.buf)[:] = cost_grid
+            self._cost_grid = None
+        else:
+            self._cost_grid = cost_grid
+        self._shape = cost_grid.shape
+
+        for request in self._pending:
+            if request._future is not None:
+                request._future.cancel()
+            self._start(request)
+
+        # Workers attached to the old grid keep their mapping until they move on to the new one
+        if old_memory is not None:
+            old_memory.close()
+            old_memory.unlink()
+
+    def _start(self, request: PathRequest):
+        start = _collapse(request.start_point, self.grid_size)
+        goal = _collapse(request.end_point, self.grid_size)
+        start = start[0] - self.left, start[1] - self.bottom
+        goal = goal[0] - self.left, goal[1] - self.bottom
+        if self._memory is not None:
+            request._future = self._executor.submit(_solve_path_request, self._memory.name, self._shape,
+                                                    start, goal, self.diagonal_movement, self.max_iterations)
+        else:
+            request._future = self._executor.submit(astar_grid_path, start, goal, self._cost_grid,
+                                                    self.diagonal_movement, max_iterations=self.max_iterations)
+
+    def submit(self, start_point: Point, end_point: Point, key=None, on_done=None) -> PathRequest:
+        """
+        Ask for a path.
+
+        :param Point start_point: Where the path starts, in pixels.
+        :param Point end_point: Where the path goes, in pixels.
+        :param key: Anything identifying who the path is for, such as the sprite.
+                    Submitting a new request with the same key cancels the old one.
+        :param on_done: Function called with the request when its path is ready.
+        :returns: PathRequest
+        """
+        if key is not None:
+            old_request = self._by_key.get(key)
+            if old_request is not None:
+                self.cancel(old_request)
+
+        request = PathRequest(start_point, end_point, key, on_done)
+        self._pending[request] = None
+        if key is not None:
+            self._by_key[key] = request
+        self._start(request)
+        return request
+
+    def cancel(self, request: PathRequest):
+        """ Cancel a request, same as :meth:`PathRequest.cancel`. """
+        request.cancel()
+        self._forget(request)
+
+    def _forget(self, request: PathRequest):
+        self._pending.pop(request, None)
+        if request.key is not None and self._by_key.get(request.key) is request:
+            del self._by_key[request.key]
+
+    @property
+    def pending(self) -> int:
+        """ Number of requests still waiting for a result. """
+        return len(self._pending)
+
+    def update(self, max_results: Optional[int] = None, time_budget: Optional[float] = 0.002) -> List[PathRequest]:
+        """
+        Hand over finished paths, oldest request first. Call once per frame.
+
+        :param int max_results: Most requests to finish in this call.
+        :param float time_budget: Seconds to spend on handing over paths and
+                                  calling `on_done`. Checked after each
+                                  request, so at least one gets done.
+        :returns: The requests finished in this call.
+        """
+        start_time = time.perf_counter()
+        finished = []
+        for request in list(self._pending):
+            if max_results is not None and len(finished) >= max_results:
+                break
+            if request.cancelled:
+                self._forget(request)
+                continue
+            if not request._future.done():
+                continue
+
+            self._forget(request)
+            cells = request._future.result()
+            if cells is not None:
+                request.path = [_expand((x + self.left, y + self.bottom), self.grid_size) for x, y in cells]
+            request.done = True
+            if request.on_done is not None:
+                request.on_done(request)
+            finished.append(request)
+
+            if time_budget is not None and time.perf_counter() - start_time > time_budget:
+                break
+        return finished
+
+    def close(self):
+        """ Cancel everything waiting, stop the workers and free the shared memory. """
+        for request in list(self._pending):
+            self.cancel(request)
+        self._executor.shutdown(wait=True)
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
@@ -5,12 +5,33 @@
 
 import math
 # import time
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
 
 from arcade import check_for_collision_with_list
 from arcade import check_for_collision
 from arcade import Sprite
 from arcade import SpriteList
+from arcade import OccupancyGrid
 from arcade import get_distance
+from arcade import are_polygons_intersecting
+from arcade import get_polygon_penetration
+from arcade.arcade_types import PointList
+
+# How far short of a wall a swept move stops, so the sprite ends up near it without touching
+_CONTACT_GAP = 0.001
+
+# Pushes out of walls to try before falling back on _circular_check
+_MAX_OVERLAP_PUSHES = 4
+
+
+def _check_for_collision_with_walls(sprite: Sprite, walls: Union[SpriteList, OccupancyGrid]) -> List[Sprite]:
+    """ Collision check against walls kept in either a sprite list or an occupancy grid. """
+    if isinstance(walls, OccupancyGrid):
+        return walls.get_colliding_sprites(sprite)
+    return check_for_collision_with_list(sprite, walls)
+
 
 def _circular_check(player, walls):
     """
@@ -37,59 +58,96 @@ def _circular_check(player, walls):
             x, y = my_item
             player.center_x = x
             player.center_y = y
-            check_hit_list = check_for_collision_with_list(player, walls)
+            check_hit_list = _check_for_collision_with_walls(player, walls)
             # print(f"Vary {vary} ({self.player_sprite.center_x} {self.player_sprite.center_y}) "
             #       f"= {len(check_hit_list)}")
             if len(check_hit_list) == 0:
                 return
         vary *= 2
 
-def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
 
-    # start_time = time.time()
-
-    # See if we are starting this turn with a sprite already colliding with us.
-    if len(check_for_collision_with_list(moving_sprite, walls)) > 0:
+def _resolve_overlap(moving_sprite: Sprite, walls: Union[SpriteList, OccupancyGrid]):
+    """
+    Get a sprite out of the walls it overlaps. Each try pushes it out of the
+    wall it is deepest in, by the minimum translation vector of their hit boxes.
+    If that doesn't work out in a few tries, such as when it is wedged between
+    walls, fall back to _circular_check.
+    """
+    hit_list = _check_for_collision_with_walls(moving_sprite, walls)
+    pushes = 0
+    while hit_list and pushes < _MAX_OVERLAP_PUSHES:
+        hit_box = moving_sprite.get_adjusted_hit_box()
+        push_x, push_y, depth = 0.0, 0.0, 0.0
+        for wall in hit_list:
+            penetration = get_polygon_penetration(hit_box, wall.get_adjusted_hit_box())
+            if penetration is not None and math.hypot(*penetration) > depth:
+                push_x, push_y = penetration
+                depth = math.hypot(push_x, push_y)
+        if depth == 0:
+            break
+
+        # Go a little further, so rounding doesn't leave the hit boxes overlapping
+        scale = (depth + _CONTACT_GAP) / depth
+        moving_sprite.position = moving_sprite.center_x + push_x * scale, moving_sprite.center_y + push_y * scale
+        hit_list = _check_for_collision_with_walls(moving_sprite, walls)
+        pushes += 1
+
+    if hit_list:
         _circular_check(moving_sprite, walls)
 
-    original_x = moving_sprite.center_x
-    original_y = moving_sprite.center_y
-    original_angle = moving_sprite.angle
 
-    # --- Rotate
-    rotating_hit_list = []
+def _rotate_sprite(moving_sprite: Sprite, walls: Union[SpriteList, OccupancyGrid]) -> List[Sprite]:
+    """ Turn a sprite by its change_angle, and get it out of any walls that puts it in. """
+    rotating_hit_list: List[Sprite] = []
     if moving_sprite.change_angle:
+        original_x = moving_sprite.center_x
+        original_y = moving_sprite.center_y
+        original_angle = moving_sprite.angle
 
         # Rotate
         moving_sprite.angle += moving_sprite.change_angle
 
         # Resolve collisions caused by rotating
-        rotating_hit_list = check_for_collision_with_list(moving_sprite, walls)
+        rotating_hit_list = _check_for_collision_with_walls(moving_sprite, walls)
 
         if len(rotating_hit_list) > 0:
 
             max_distance = (moving_sprite.width + moving_sprite.height) / 2
 
-            # Resolve any collisions by this weird kludge
-            _circular_check(moving_sprite, walls)
+            _resolve_overlap(moving_sprite, walls)
             if get_distance(original_x, original_y, moving_sprite.center_x, moving_sprite.center_y) > max_distance:
                 # Ok, glitched trying to rotate. Reset.
                 moving_sprite.center_x = original_x
                 moving_sprite.center_y = original_y
                 moving_sprite.angle = original_angle
+    return rotating_hit_list
+
+
+def _move_sprite(moving_sprite: Sprite, walls: Union[SpriteList, OccupancyGrid], ramp_up: bool):
+
+    # start_time = time.time()
+
+    # See if we are starting this turn with a sprite already colliding with us.
+    _resolve_overlap(moving_sprite, walls)
+
+    original_x = moving_sprite.center_x
+    original_y = moving_sprite.center_y
+
+    # --- Rotate
+    rotating_hit_list = _rotate_sprite(moving_sprite, walls)
 
     # --- Move in the y direction
     moving_sprite.center_y += moving_sprite.change_y
 
     # Check for wall hit
-    hit_list_x = check_for_collision_with_list(moving_sprite, walls)
+    hit_list_x = _check_for_collision_with_walls(moving_sprite, walls)
     # print(f"Post-y move {hit_list_x}")
     complete_hit_list = hit_list_x
 
     # If we hit a wall, move so the edges are at the same point
     if len(hit_list_x) > 0:
         if moving_sprite.change_y > 0:
-            while len(check_for_collision_with_list(moving_sprite, walls)) > 0:
+            while len(_check_for_collision_with_walls(moving_sprite, walls)) > 0:
                 moving_sprite.center_y -= 1
             # print(f"Spot X ({self.player_sprite.center_x}, {self.player_sprite.center_y})"
             #       f" {self.player_sprite.change_y}")
@@ -146,7 +204,7 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
 
             # Move sprite and check for collisions
             moving_sprite.center_x = original_x + cur_x_change * direction
-            collision_check = check_for_collision_with_list(moving_sprite, walls)
+            collision_check = _check_for_collision_with_walls(moving_sprite, walls)
 
             # Update collision list
             for sprite in collision_check:
@@ -160,7 +218,7 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
                     cur_y_change = cur_x_change
                     moving_sprite.center_y = original_y + cur_y_change
 
-                    collision_check = check_for_collision_with_list(moving_sprite, walls)
+                    collision_check = _check_for_collision_with_walls(moving_sprite, walls)
                     if len(collision_check) > 0:
                         cur_y_change -= cur_x_change
                     else:
@@ -168,7 +226,7 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
                             # print("Ramp up check")
                             cur_y_change -= 1
                             moving_sprite.center_y = almost_original_y + cur_y_change
-                            collision_check = check_for_collision_with_list(moving_sprite, walls)
+                            collision_check = _check_for_collision_with_walls(moving_sprite, walls)
                         cur_y_change += 1
                         collision_check = []
 
@@ -211,6 +269,229 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
     return complete_hit_list
 
 
+def _get_walls_in_box(walls: Union[SpriteList, OccupancyGrid],
+                      left: float, bottom: float, right: float, top: float) -> List[Sprite]:
+    """ Broad phase: walls that may reach into an axis-aligned box. """
+    if isinstance(walls, OccupancyGrid):
+        return walls.get_sprites_in_box(left, bottom, right, top)
+    if walls.use_spatial_hash:
+        return list(walls.spatial_hash.get_objects_for_rect(left, bottom, right, top))
+    return [wall for wall in walls
+            if wall.right >= left and wall.left <= right and wall.top >= bottom and wall.bottom <= top]
+
+
+def _get_time_of_impact(moving: PointList, delta_x: float, delta_y: float,
+                        wall: PointList) -> Optional[Tuple[float, float, float]]:
+    """
+    Separating axis test for a convex polygon moving in a straight line
+    towards another one. On every axis, work out the part of the move where
+    their projections overlap; they meet where all of those parts do.
+
+    :returns: Fraction of the move where they first touch, and the normal of the
+        wall side touched, pointing back at the moving polygon. None if they don't
+        meet during the move, only touch, or already overlap at the start.
+    """
+    t_first = -math.inf
+    t_last = math.inf
+    normal = None
+    for polygon in moving, wall:
+        for i in range(len(polygon)):
+            x1, y1 = polygon[i - 1]
+            x2, y2 = polygon[i]
+            axis_x = y2 - y1
+            axis_y = x1 - x2
+            length = math.hypot(axis_x, axis_y)
+            if length == 0:
+                continue
+            axis_x /= length
+            axis_y /= length
+
+            moving_projection = [x * axis_x + y * axis_y for x, y in moving]
+            wall_projection = [x * axis_x + y * axis_y for x, y in wall]
+            moving_min, moving_max = min(moving_projection), max(moving_projection)
+            wall_min, wall_max = min(wall_projection), max(wall_projection)
+            speed = delta_x * axis_x + delta_y * axis_y
+
+            if abs(speed) < 1e-12:
+                # Not moving along this axis, so they have to overlap on it already
+                if moving_max <= wall_min or wall_max <= moving_min:
+                    return None
+                continue
+
+            if speed > 0:
+                enter = (wall_min - moving_max) / speed
+                leave = (wall_max - moving_min) / speed
+            else:
+                enter = (wall_max - moving_min) / speed
+                leave = (wall_min - moving_max) / speed
+            if enter > t_first:
+                t_first = enter
+                normal = (-axis_x, -axis_y) if speed > 0 else (axis_x, axis_y)
+            t_last = min(t_last, leave)
+            if t_first >= t_last:
+                return None
+
+    if normal is None or t_first < -1e-9 or t_first >= 1:
+        return None
+    return max(t_first, 0.0), normal[0], normal[1]
+
+
+def _sweep_sprite(moving_sprite: Sprite, delta_x: float, delta_y: float,
+                  candidates: List[Sprite]) -> Tuple[float, List[Tuple[Sprite, float, float]]]:
+    """
+    Move a sprite in a straight line until it hits one of the candidate walls,
+    stopping just short of it.
+
+    :returns: Fraction of the move made, and each wall hit first with the
+        normal it was hit on.
+    """
+    distance = math.hypot(delta_x, delta_y)
+    if distance == 0:
+        return 1.0, []
+
+    hit_box = moving_sprite.get_adjusted_hit_box()
+    xs = [point[0] for point in hit_box]
+    ys = [point[1] for point in hit_box]
+    left = min(xs) + min(delta_x, 0)
+    right = max(xs) + max(delta_x, 0)
+    bottom = min(ys) + min(delta_y, 0)
+    top = max(ys) + max(delta_y, 0)
+
+    t_hit = 1.0
+    contacts: List[Tuple[Sprite, float, float, float]] = []
+    for wall in candidates:
+        if wall.right < left or wall.left > right or wall.top < bottom or wall.bottom > top:
+            continue
+        impact = _get_time_of_impact(hit_box, delta_x, delta_y, wall.get_adjusted_hit_box())
+        if impact is not None and impact[0] <= t_hit + 1e-9:
+            t_hit = min(t_hit, impact[0])
+            contacts.append((wall, *impact))
+
+    hits = [(wall, normal_x, normal_y) for wall, t, normal_x, normal_y in contacts if t <= t_hit + 1e-9]
+    if hits:
+        t_hit = max(t_hit - _CONTACT_GAP / distance, 0.0)
+    moving_sprite.position = moving_sprite.center_x + delta_x * t_hit, moving_sprite.center_y + delta_y * t_hit
+    return t_hit, hits
+
+
+def _move_sprite_swept(moving_sprite: Sprite, walls: Union[SpriteList, OccupancyGrid], ramp_up: bool):
+    """
+    Move a sprite like :func:`_move_sprite`, but find where it hits a wall
+    with the time of impact of its hit box along the move, instead of stepping
+    back out of the walls. Each axis takes one broad phase query for the box
+    the sprite sweeps through, and fast sprites can't skip over thin walls.
+    """
+    # See if we are starting this turn with a sprite already colliding with us.
+    _resolve_overlap(moving_sprite, walls)
+
+    # --- Rotate
+    rotating_hit_list = _rotate_sprite(moving_sprite, walls)
+
+    complete_hit_list: List[Sprite] = []
+
+    # --- Move in the y direction
+    change_y = moving_sprite.change_y
+    if change_y:
+        candidates = _get_walls_in_box(walls,
+                                       moving_sprite.left, moving_sprite.bottom + min(change_y, 0),
+                                       moving_sprite.right, moving_sprite.top + max(change_y, 0))
+        _, hits = _sweep_sprite(moving_sprite, 0, change_y, candidates)
+        if hits:
+            if change_y < 0:
+                # Ride along with moving platforms
+                for wall, _, _ in hits:
+                    if wall.change_x != 0:
+                        moving_sprite.center_x += wall.change_x
+            moving_sprite.change_y = min(0.0, hits[0][0].change_y)
+            complete_hit_list.extend(wall for wall, _, _ in hits)
+
+    # --- Move in the x direction
+    change_x = moving_sprite.change_x
+    if change_x:
+        # Leave room above to walk up ramps as steep as 45 degrees
+        climb = abs(change_x) if ramp_up else 0
+        candidates = _get_walls_in_box(walls,
+                                       moving_sprite.left + min(change_x, 0), moving_sprite.bottom,
+                                       moving_sprite.right + max(change_x, 0), moving_sprite.top + climb)
+        t_hit, hits = _sweep_sprite(moving_sprite, change_x, 0, candidates)
+        for wall, _, _ in hits:
+            if wall not in complete_hit_list:
+                complete_hit_list.append(wall)
+
+        # Blocked only by slopes we can walk up? Go on along the steepest of them.
+        if hits and ramp_up and all(0 < abs(normal_x) <= normal_y + 1e-9 for _, normal_x, normal_y in hits):
+            _, normal_x, normal_y = max(hits, key=lambda hit: abs(hit[1]))
+            remaining_x = change_x * (1 - t_hit)
+            _, hits = _sweep_sprite(moving_sprite, remaining_x, abs(remaining_x * normal_x / normal_y), candidates)
+            for wall, _, _ in hits:
+                if wall not in complete_hit_list:
+                    complete_hit_list.append(wall)
+
+    # Add in rotating hit list
+    for sprite in rotating_hit_list:
+        if sprite not in complete_hit_list:
+            complete_hit_list.append(sprite)
+
+    return complete_hit_list
+
+
+def _is_axis_aligned_box(points: PointList) -> bool:
+    """ Return True if a hit box is a rectangle with its sides along the axes. """
+    return len(points) == 4 and len({point[0] for point in points}) == 2 and len({point[1] for point in points}) == 2
+
+
+def _get_hit_box_bounds(points: PointList) -> Tuple[float, float, float, float]:
+    """ Left, bottom, right and top of a hit box. """
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _expand_counts(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ For a count per item, the item and the number within it of each of count.sum() entries. """
+    owners = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, offsets
+
+
+def _get_box_cells(bounds: np.ndarray, cell_size: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Grid cells covered by each of a set of boxes.
+
+    :param bounds: Array with a row of (left, bottom, right, top) for each box.
+    :returns: The index of the box and the key of the cell, for every cell covered.
+    """
+    cells = np.floor(bounds / cell_size).astype(np.int64)
+    rows = cells[:, 3] - cells[:, 1] + 1
+    owners, offsets = _expand_counts((cells[:, 2] - cells[:, 0] + 1) * rows)
+    cell_x = cells[owners, 0] + offsets // rows[owners]
+    cell_y = cells[owners, 1] + offsets % rows[owners]
+    return owners, cell_x * 4294967296 + (cell_y + 2147483648)
+
+
+def _get_boxes_time_of_impact(bounds: np.ndarray, deltas: np.ndarray,
+                              wall_bounds: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Time of impact for pairs of axis-aligned boxes, one moving along an axis
+    and one standing still.
+
+    :param bounds: (left, bottom, right, top) of the moving box of each pair.
+    :param deltas: How far each moving box goes along the axis.
+    :param wall_bounds: (left, bottom, right, top) of the other box of each pair.
+    :param int axis: 0 to move along x, 1 along y.
+    :returns: Fraction of the move where each pair first touches, inf if it doesn't.
+    """
+    low, high = axis, axis + 2
+    side_low, side_high = 1 - axis, 3 - axis
+    alongside = (bounds[:, side_low] < wall_bounds[:, side_high]) & (wall_bounds[:, side_low] < bounds[:, side_high])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(deltas > 0,
+                     (wall_bounds[:, low] - bounds[:, high]) / deltas,
+                     (wall_bounds[:, high] - bounds[:, low]) / deltas)
+    hit = alongside & (deltas != 0) & (t >= -1e-9) & (t < 1)
+    return np.where(hit, np.maximum(t, 0.0), np.inf)
+
+
 class PhysicsEngineSimple:
     """
     Simplistic physics engine for use in games without gravity, such as top-down
@@ -219,17 +500,21 @@ class PhysicsEngineSimple:
     does not currently handle rotation.
     """
 
-    def __init__(self, player_sprite: Sprite, walls: SpriteList):
+    def __init__(self, player_sprite: Sprite, walls: Union[SpriteList, OccupancyGrid],
+                 continuous_collision: bool = False):
         """
         Create a simple physics engine.
 
         :param Sprite player_sprite: The moving sprite
-        :param SpriteList walls: The sprites it can't move through
+        :param walls: The sprites it can't move through, or an OccupancyGrid of them
+        :param bool continuous_collision: Sweep the sprite's hit box along its move to find
+            where it hits, so fast sprites can't pass through thin walls
         """
         assert(isinstance(player_sprite, Sprite))
-        assert(isinstance(walls, SpriteList))
+        assert(isinstance(walls, (SpriteList, OccupancyGrid)))
         self.player_sprite = player_sprite
         self.walls = walls
+        self.continuous_collision = continuous_collision
 
     def update(self):
         """
@@ -238,10 +523,151 @@ def update(self):
         :Returns: SpriteList with all sprites contacted. Empty list if no sprites.
         """
 
-        complete_hit_list = _move_sprite(self.player_sprite, self.walls, ramp_up=False)
+        move_sprite = _move_sprite_swept if self.continuous_collision else _move_sprite
+        complete_hit_list = move_sprite(self.player_sprite, self.walls, ramp_up=False)
         return complete_hit_list
 
 
+class PhysicsEngineKinematic:
+    """
+    Physics engine for many sprites moving without gravity, such as the
+    enemies of a top-down game, against walls that don't move. Instead of an
+    engine per sprite, all of them are moved together: one broad phase on a
+    grid of the walls finds every sprite and wall that may meet, and NumPy
+    works out the time of impact of all those pairs at once.
+
+    Sprites only collide with the walls, not with each other, and rotation is
+    not handled. Pairs where a hit box isn't a rectangle along the axes are
+    checked one at a time.
+    """
+
+    def __init__(self, sprites: SpriteList, walls: Union[SpriteList, OccupancyGrid]):
+        """
+        Create a physics engine for a group of sprites.
+
+        :param SpriteList sprites: The moving sprites
+        :param walls: The sprites they can't move through, or an OccupancyGrid of them.
+            Call :meth:`update_walls` after changing them.
+        """
+        assert(isinstance(sprites, SpriteList))
+        assert(isinstance(walls, (SpriteList, OccupancyGrid)))
+        self.sprites = sprites
+        self.walls = walls
+        self.update_walls()
+
+    def update_walls(self):
+        """ Index the walls again, after adding, removing or moving any of them. """
+        # Grid cells are merged into far fewer rectangles
+        walls = self.walls.create_collision_list() if isinstance(self.walls, OccupancyGrid) else self.walls
+        self._wall_sprites = list(walls)
+        self._wall_hit_boxes = [wall.get_adjusted_hit_box() for wall in self._wall_sprites]
+        self._wall_bounds = np.array([_get_hit_box_bounds(points) for points in self._wall_hit_boxes],
+                                     dtype=np.float64).reshape(-1, 4)
+        self._wall_is_box = np.array([_is_axis_aligned_box(points) for points in self._wall_hit_boxes], dtype=bool)
+
+        # Broad phase grid, with cells about the size of a typical wall
+        sizes = np.maximum(self._wall_bounds[:, 2] - self._wall_bounds[:, 0],
+                           self._wall_bounds[:, 3] - self._wall_bounds[:, 1])
+        self._cell_size = max(float(np.median(sizes)), 1.0) if len(sizes) else 1.0
+        owners, keys = _get_box_cells(self._wall_bounds, self._cell_size)
+        order = np.argsort(keys, kind="stable")
+        self._cell_keys = keys[order]
+        self._cell_walls = owners[order]
+
+    def _get_pairs(self, bounds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ Broad phase: the sprite and wall of each pair whose bounds overlap. """
+        if not self._wall_sprites:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        owners, keys = _get_box_cells(bounds, self._cell_size)
+        first = np.searchsorted(self._cell_keys, keys, side="left")
+        entries, offsets = _expand_counts(np.searchsorted(self._cell_keys, keys, side="right") - first)
+        walls = self._cell_walls[first[entries] + offsets]
+
+        # Walls over several cells turn up once for each
+        wall_count = len(self._wall_sprites)
+        pairs = np.unique(owners[entries] * wall_count + walls)
+        movers, walls = pairs // wall_count, pairs % wall_count
+
+        mover_bounds = bounds[movers]
+        wall_bounds = self._wall_bounds[walls]
+        close = (mover_bounds[:, 0] <= wall_bounds[:, 2]) & (wall_bounds[:, 0] <= mover_bounds[:, 2]) \
+            & (mover_bounds[:, 1] <= wall_bounds[:, 3]) & (wall_bounds[:, 1] <= mover_bounds[:, 3])
+        return movers[close], walls[close]
+
+    def update(self) -> List[List[Sprite]]:
+        """
+        Move all the sprites and resolve their collisions with the walls.
+
+        :Returns: A list for each sprite, in sprite list order, with the walls it contacted.
+        """
+        sprites = list(self.sprites)
+        hit_lists: List[List[Sprite]] = [[] for _ in sprites]
+        if not sprites:
+            return hit_lists
+
+        hit_boxes = [sprite.get_adjusted_hit_box() for sprite in sprites]
+        bounds = np.array([_get_hit_box_bounds(points) for points in hit_boxes], dtype=np.float64)
+        is_box = np.array([_is_axis_aligned_box(points) for points in hit_boxes], dtype=bool)
+        changes = np.array([(sprite.change_x, sprite.change_y) for sprite in sprites], dtype=np.float64)
+
+        # One broad phase for the whole box each sprite sweeps through
+        swept_bounds = bounds.copy()
+        swept_bounds[:, :2] += np.minimum(changes, 0)
+        swept_bounds[:, 2:] += np.maximum(changes, 0)
+        movers, walls = self._get_pairs(swept_bounds)
+        boxes = is_box[movers] & self._wall_is_box[walls]
+
+        # Sprites starting inside a wall get out and move on their own
+        mover_bounds = bounds[movers]
+        wall_bounds = self._wall_bounds[walls]
+        stuck = np.zeros(len(sprites), dtype=bool)
+        stuck[movers[boxes & (mover_bounds[:, 0] < wall_bounds[:, 2]) & (wall_bounds[:, 0] < mover_bounds[:, 2])
+                     & (mover_bounds[:, 1] < wall_bounds[:, 3]) & (wall_bounds[:, 1] < mover_bounds[:, 3])]] = True
+        for pair in np.nonzero(~boxes)[0]:
+            if not stuck[movers[pair]] and are_polygons_intersecting(hit_boxes[movers[pair]],
+                                                                     self._wall_hit_boxes[walls[pair]]):
+                stuck[movers[pair]] = True
+        for index in np.nonzero(stuck)[0]:
+            hit_lists[index] = _move_sprite_swept(sprites[index], self.walls, ramp_up=False)
+        moving = ~stuck[movers]
+        movers, walls, boxes = movers[moving], walls[moving], boxes[moving]
+
+        # Move along y, then x, like the other engines
+        offsets = np.zeros((len(sprites), 2))
+        for axis in 1, 0:
+            deltas = changes[:, axis]
+            t = _get_boxes_time_of_impact(bounds[movers] + np.tile(offsets[movers], 2), deltas[movers],
+                                          self._wall_bounds[walls], axis)
+            t[~boxes] = np.inf
+            for pair in np.nonzero(~boxes)[0]:
+                mover = movers[pair]
+                if deltas[mover]:
+                    delta = (deltas[mover], 0.0) if axis == 0 else (0.0, deltas[mover])
+                    hit_box = [(x + offsets[mover, 0], y + offsets[mover, 1]) for x, y in hit_boxes[mover]]
+                    impact = _get_time_of_impact(hit_box, delta[0], delta[1], self._wall_hit_boxes[walls[pair]])
+                    if impact is not None:
+                        t[pair] = impact[0]
+
+            first_hit = np.ones(len(sprites))
+            np.minimum.at(first_hit, movers, t)
+            with np.errstate(divide="ignore"):
+                stop = np.where(first_hit < 1, np.maximum(first_hit - _CONTACT_GAP / np.abs(deltas), 0.0), 1.0)
+            offsets[:, axis] += deltas * stop
+
+            for pair in np.nonzero(np.isfinite(t) & (t <= first_hit[movers] + 1e-9))[0]:
+                sprite_hits = hit_lists[movers[pair]]
+                wall = self._wall_sprites[walls[pair]]
+                if wall not in sprite_hits:
+                    sprite_hits.append(wall)
+                if axis == 1:
+                    sprites[movers[pair]].change_y = min(0.0, wall.change_y)
+
+        for index in np.nonzero(~stuck)[0]:
+            sprite = sprites[index]
+            sprite.position = sprite.center_x + offsets[index, 0], sprite.center_y + offsets[index, 1]
+        return hit_lists
+
+
 class PhysicsEnginePlatformer:
     """
     Simplistic physics engine for use in a platformer. It is easier to get
@@ -251,17 +677,27 @@ class PhysicsEnginePlatformer:
 
     def __init__(self,
                  player_sprite: Sprite,
-                 platforms: SpriteList,
+                 platforms: Union[SpriteList, OccupancyGrid],
                  gravity_constant: float = 0.5,
                  ladders: SpriteList = None,
+                 continuous_collision: bool = False,
                  ):
         """
         Create a physics engine for a platformer.
 
         :param Sprite player_sprite: The moving sprite
-        :param SpriteList platforms: The sprites it can't move through
+        :param platforms: The sprites it can't move through, or an OccupancyGrid of them
         :param float gravity_constant: Downward acceleration per frame
         :param SpriteList ladders: Ladders the user can climb on
+        :param bool continuous_collision: Sweep the player's hit box along its move to find
+            where it hits, so falling fast can't take it through thin platforms
+
+        Platforms that move, such as the ones a tile map gives change_x,
+        change_y or boundary properties, are kept in moving_platforms and only
+        those are moved each update. The platforms are looked through again
+        whenever a sprite is added to, removed from or replaced in the platforms
+        list, and ones taken out of it are dropped. Use :meth:`add_moving_platform`
+        for any that start moving later.
         """
         if ladders is not None and not isinstance(ladders, SpriteList):
             raise TypeError("Fourth parameter should be a SpriteList of ladders")
@@ -273,6 +709,85 @@ def __init__(self,
         self.allowed_jumps = 1
         self.allow_multi_jump = False
         self.ladders = ladders
+        self.continuous_collision = continuous_collision
+
+        self.moving_platforms: List[Sprite] = []
+        # Platforms taken out of moving_platforms by hand, not to be found again
+        self._stopped_platforms: List[Sprite] = []
+        self._platforms_change_count = -1
+        self._update_moving_platforms()
+
+    def _update_moving_platforms(self):
+        """
+        Drop moving platforms no longer in the platforms list, and look for
+        new ones if the platforms list changed.
+        """
+        # Occupancy grids are static, there are no moving platforms in them
+        if not isinstance(self.platforms, SpriteList):
+            return
+        self.moving_platforms = [platform for platform in self.moving_platforms
+                                 if self.platforms in platform.sprite_lists]
+        if self.platforms._change_count == self._platforms_change_count:
+            return
+
+        self._platforms_change_count = self.platforms._change_count
+        self._stopped_platforms = [platform for platform in self._stopped_platforms
+                                   if self.platforms in platform.sprite_lists]
+        for platform in self.platforms:
+            if platform.change_x != 0 or platform.change_y != 0 \
+                    or platform.boundary_left is not None or platform.boundary_right is not None \
+                    or platform.boundary_bottom is not None or platform.boundary_top is not None:
+                if platform not in self.moving_platforms and platform not in self._stopped_platforms:
+                    self.moving_platforms.append(platform)
+
+    def add_moving_platform(self, platform: Sprite):
+        """
+        Have a platform moved by its change_x and change_y every update.
+        It should be in the platforms list too.
+        """
+        if platform in self._stopped_platforms:
+            self._stopped_platforms.remove(platform)
+        if platform not in self.moving_platforms:
+            self.moving_platforms.append(platform)
+
+    def remove_moving_platform(self, platform: Sprite):
+        """ Stop moving a platform, leaving it where it is. """
+        self.moving_platforms.remove(platform)
+        self._stopped_platforms.append(platform)
+
+    def _move_platform(self, platform: Sprite):
+        """
+        Move a platform, turning it around at its boundaries, with a single position update.
+        The player is pushed along if the platform overlaps it after both the x and y moves.
+        """
+        change_x = platform.change_x
+        if platform.boundary_left is not None and platform.left + change_x <= platform.boundary_left:
+            change_x = platform.boundary_left - platform.left
+            if platform.change_x < 0:
+                platform.change_x *= -1
+        if platform.boundary_right is not None and platform.right + change_x >= platform.boundary_right:
+            change_x = platform.boundary_right - platform.right
+            if platform.change_x > 0:
+                platform.change_x *= -1
+
+        change_y = platform.change_y
+        if platform.boundary_top is not None and platform.top + change_y >= platform.boundary_top:
+            change_y = platform.boundary_top - platform.top
+            if platform.change_y > 0:
+                platform.change_y *= -1
+        if platform.boundary_bottom is not None and platform.bottom + change_y <= platform.boundary_bottom:
+            change_y = platform.boundary_bottom - platform.bottom
+            if platform.change_y < 0:
+                platform.change_y *= -1
+
+        platform.position = platform.center_x + change_x, platform.center_y + change_y
+
+        # Push the player along
+        if platform.change_x != 0 and check_for_collision(self.player_sprite, platform):
+            if platform.change_x < 0:
+                self.player_sprite.right = platform.left
+            if platform.change_x > 0:
+                self.player_sprite.left = platform.right
 
     def is_on_ladder(self):
         """ Return 'true' if the player is in contact with a sprite in the ladder list. """
@@ -297,7 +812,7 @@ def can_jump(self, y_distance=5) -> bool:
         self.player_sprite.center_y -= y_distance
 
         # Check for wall hit
-        hit_list = check_for_collision_with_list(self.player_sprite, self.platforms)
+        hit_list = _check_for_collision_with_walls(self.player_sprite, self.platforms)
 
         self.player_sprite.center_y += y_distance
 
@@ -363,43 +878,13 @@ def update(self):
 
         # print(f"Spot B ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
 
-        complete_hit_list = _move_sprite(self.player_sprite, self.platforms, ramp_up=True)
+        move_sprite = _move_sprite_swept if self.continuous_collision else _move_sprite
+        complete_hit_list = move_sprite(self.player_sprite, self.platforms, ramp_up=True)
 
-        for platform in self.platforms:
+        self._update_moving_platforms()
+        for platform in self.moving_platforms:
             if platform.change_x != 0 or platform.change_y != 0:
-                platform.center_x += platform.change_x
-
-                if platform.boundary_left is not None \
-                        and platform.left <= platform.boundary_left:
-                    platform.left = platform.boundary_left
-                    if platform.change_x < 0:
-                        platform.change_x *= -1
-
-                if platform.boundary_right is not None \
-                        and platform.right >= platform.boundary_right:
-                    platform.right = platform.boundary_right
-                    if platform.change_x > 0:
-                        platform.change_x *= -1
-
-                if check_for_collision(self.player_sprite, platform):
-                    if platform.change_x < 0:
-                        self.player_sprite.right = platform.left
-                    if platform.change_x > 0:
-                        self.player_sprite.left = platform.right
-
-                platform.center_y += platform.change_y
-
-                if platform.boundary_top is not None \
-                        and platform.top >= platform.boundary_top:
-                    platform.top = platform.boundary_top
-                    if platform.change_y > 0:
-                        platform.change_y *= -1
-
-                if platform.boundary_bottom is not None \
-                        and platform.bottom <= platform.boundary_bottom:
-                    platform.bottom = platform.boundary_bottom
-                    if platform.change_y < 0:
-                        platform.change_y *= -1
+                self._move_platform(platform)
 
         # print(f"Spot Z ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
         # Return list of encountered sprites
@@ -0,0 +1,46 @@
+#version 330
+
+// Atlas slot (plus one) of every cell in the layer, bottom row first. 0 is an empty cell.
+uniform usampler2D grid;
+// All the tile images of the layer, in slots of tile_size
+uniform sampler2D atlas;
+// Columns of slots in the atlas
+uniform int atlas_columns;
+// Size of a tile in the atlas, in pixels
+uniform vec2 tile_size;
+// Size of a tile in the world
+uniform vec2 world_tile_size;
+// The 2D projection: left, right, bottom, top
+uniform vec4 projection;
+uniform float alpha;
+
+in vec2 v_uv;
+out vec4 f_color;
+
+void main() {
+    vec2 world_pos = vec2(mix(projection.x, projection.y, v_uv.x),
+                          mix(projection.z, projection.w, v_uv.y));
+    vec2 cell_pos = world_pos / world_tile_size;
+    ivec2 cell = ivec2(floor(cell_pos));
+    if (any(lessThan(cell, ivec2(0))) || any(greaterThanEqual(cell, textureSize(grid, 0)))) {
+        discard;
+    }
+
+    int slot = int(texelFetch(grid, cell, 0).r) - 1;
+    if (slot < 0) {
+        discard;
+    }
+
+    // Slots are laid out top to bottom, the atlas texture is bottom row first
+    ivec2 atlas_size = textureSize(atlas, 0);
+    vec2 slot_origin = vec2(slot % atlas_columns, 0.0) * tile_size;
+    slot_origin.y = float(atlas_size.y) - float(slot / atlas_columns + 1) * tile_size.y;
+    vec2 texel = slot_origin + fract(cell_pos) * tile_size;
+
+    vec4 color = texelFetch(atlas, ivec2(texel), 0);
+    color.a *= alpha;
+    if (color.a == 0.0) {
+        discard;
+    }
+    f_color = color;
+}
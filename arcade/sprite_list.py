@@ -11,18 +11,19 @@
 from typing import Optional
 from typing import Union
 from typing import Set
+from typing import Dict
 
 import logging
 import math
 import array
 import time
 
+import numpy as np
 from PIL import Image
 
 from arcade import Color
 from arcade import Matrix3x3
 from arcade import Sprite
-from arcade import get_distance_between_sprites
 from arcade import are_polygons_intersecting
 from arcade import is_point_in_polygon
 
@@ -173,12 +174,16 @@ def get_objects_for_box(self, check_object: Sprite) -> Set[Sprite]:
 
 
         """
-        # Get the corners
-        min_x = check_object.left
-        max_x = check_object.right
-        min_y = check_object.bottom
-        max_y = check_object.top
+        return self.get_objects_for_rect(check_object.left, check_object.bottom,
+                                         check_object.right, check_object.top)
+
+    def get_objects_for_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Set[Sprite]:
+        """
+        Returns Sprites in the same box(es) as an axis-aligned rectangle.
 
+        :return: Set of close-by sprites
+        :rtype: Set
+        """
         min_point = (min_x, min_y)
         max_point = (max_x, max_y)
 
@@ -219,6 +224,166 @@ def get_objects_for_point(self, check_point: Point) -> List[Sprite]:
 
         return close_by_sprites
 
+    def get_objects_for_segment(self, start: Point, end: Point) -> Iterator[Tuple[List[Sprite], float]]:
+        """
+        Walk the cells a line segment passes through, in order, stepping from
+        one cell border to the next.
+
+        :param Point start: Start of the segment
+        :param Point end: End of the segment
+
+        :return: For each cell, the sprites in it and the fraction along the
+            segment where the segment leaves the cell
+        """
+        delta_x = end[0] - start[0]
+        delta_y = end[1] - start[1]
+        grid_x = start[0] / self.cell_size
+        grid_y = start[1] / self.cell_size
+        column = math.floor(grid_x)
+        row = math.floor(grid_y)
+        end_column = math.floor(end[0] / self.cell_size)
+        end_row = math.floor(end[1] / self.cell_size)
+
+        # Fraction of the segment between crossing one column or row and the next, and to the first crossing
+        if delta_x:
+            step_column = 1 if delta_x > 0 else -1
+            t_delta_x = self.cell_size / abs(delta_x)
+            t_max_x = ((column + 1 - grid_x) if delta_x > 0 else (grid_x - column)) * t_delta_x
+        else:
+            step_column, t_delta_x, t_max_x = 0, math.inf, math.inf
+        if delta_y:
+            step_row = 1 if delta_y > 0 else -1
+            t_delta_y = self.cell_size / abs(delta_y)
+            t_max_y = ((row + 1 - grid_y) if delta_y > 0 else (grid_y - row)) * t_delta_y
+        else:
+            step_row, t_delta_y, t_max_y = 0, math.inf, math.inf
+
+        previous_key = None
+        for _ in range(abs(end_column - column) + abs(end_row - row) + 1):
+            # _hash rounds toward zero, so the cells either side of 0 share a bucket
+            key = column if column >= 0 else column + 1, row if row >= 0 else row + 1
+            t_exit = min(t_max_x, t_max_y, 1.0)
+            if key != previous_key:
+                yield self.contents.get(key, []), t_exit
+                previous_key = key
+
+            if t_max_x < t_max_y:
+                t_max_x += t_delta_x
+                column += step_column
+            else:
+                t_max_y += t_delta_y
+                row += step_row
+            if t_exit >= 1:
+                break
+
+
+class _PositionIndex:
+    """
+    Sprite centers sorted into a grid, for finding the sprites nearest to a
+    point. The grid is sized for about four sprites per occupied cell.
+    """
+
+    def __init__(self, sprites: List[Sprite]):
+        self.sprites = list(sprites)
+        self.positions = np.array([sprite.position for sprite in self.sprites], dtype=np.float64).reshape(-1, 2)
+        self.cells: Dict[Tuple[int, int], np.ndarray] = {}
+        if not self.sprites:
+            self.cell_size = 1.0
+            self.min_cell = self.max_cell = (0, 0)
+            return
+
+        extent = self.positions.max(axis=0) - self.positions.min(axis=0)
+        self.cell_size = max(float(extent.max()) * 2 / math.sqrt(len(self.sprites)), 1.0)
+        cells = np.floor(self.positions / self.cell_size).astype(np.int64)
+        self.min_cell = tuple(cells.min(axis=0).tolist())
+        self.max_cell = tuple(cells.max(axis=0).tolist())
+
+        # Group the sprite indices by cell
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        sorted_cells = cells[order]
+        starts = np.nonzero(np.any(np.diff(sorted_cells, axis=0) != 0, axis=1))[0] + 1
+        for indices in np.split(order, starts):
+            cell_x, cell_y = cells[indices[0]].tolist()
+            self.cells[cell_x, cell_y] = indices
+
+    def _get_ring(self, cell_x: int, cell_y: int, ring: int) -> List[np.ndarray]:
+        """ Sprite indices in the cells `ring` cells away from a cell. """
+        if ring == 0:
+            found = self.cells.get((cell_x, cell_y))
+            return [] if found is None else [found]
+        keys = []
+        for offset in range(-ring, ring + 1):
+            keys.append((cell_x + offset, cell_y - ring))
+            keys.append((cell_x + offset, cell_y + ring))
+        for offset in range(-ring + 1, ring):
+            keys.append((cell_x - ring, cell_y + offset))
+            keys.append((cell_x + ring, cell_y + offset))
+        return [self.cells[key] for key in keys if key in self.cells]
+
+    def get_nearest(self, point: Point, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The sprites closest to a point, nearest first. Ties go to the sprite
+        earliest in the list.
+
+        :returns: Sprite indices and distances.
+        """
+        cell_x = math.floor(point[0] / self.cell_size)
+        cell_y = math.floor(point[1] / self.cell_size)
+        # Rings past this one are outside the grid
+        last_ring = max(abs(cell_x - self.min_cell[0]), abs(cell_x - self.max_cell[0]),
+                        abs(cell_y - self.min_cell[1]), abs(cell_y - self.max_cell[1]))
+
+        found: List[np.ndarray] = []
+        found_count = 0
+        for ring in range(last_ring + 1):
+            ring_indices = self._get_ring(cell_x, cell_y, ring)
+            found += ring_indices
+            found_count += sum(len(indices) for indices in ring_indices)
+            # Sprites in the next ring are at least this far away
+            if found_count >= count and ring < last_ring:
+                indices = np.concatenate(found)
+                distances = np.hypot(self.positions[indices, 0] - point[0], self.positions[indices, 1] - point[1])
+                if np.partition(distances, count - 1)[count - 1] <= ring * self.cell_size:
+                    break
+        if not found:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        indices = np.concatenate(found)
+        distances = np.hypot(self.positions[indices, 0] - point[0], self.positions[indices, 1] - point[1])
+        nearest = np.lexsort((indices, distances))[:count]
+        return indices[nearest], distances[nearest]
+
+    def get_in_radius(self, point: Point, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The sprites within a distance of a point, nearest first.
+
+        :returns: Sprite indices and distances.
+        """
+        first_x = max(math.floor((point[0] - radius) / self.cell_size), self.min_cell[0])
+        last_x = min(math.floor((point[0] + radius) / self.cell_size), self.max_cell[0])
+        first_y = max(math.floor((point[1] - radius) / self.cell_size), self.min_cell[1])
+        last_y = min(math.floor((point[1] + radius) / self.cell_size), self.max_cell[1])
+        if first_x > last_x or first_y > last_y:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        if (last_x - first_x + 1) * (last_y - first_y + 1) > len(self.cells):
+            indices = np.arange(len(self.sprites))
+        else:
+            found = [self.cells[cell_x, cell_y]
+                     for cell_x in range(first_x, last_x + 1)
+                     for cell_y in range(first_y, last_y + 1)
+                     if (cell_x, cell_y) in self.cells]
+            if not found:
+                return np.empty(0, dtype=np.int64), np.empty(0)
+            indices = np.concatenate(found)
+
+        distances = np.hypot(self.positions[indices, 0] - point[0], self.positions[indices, 1] - point[1])
+        inside = distances <= radius
+        indices = indices[inside]
+        distances = distances[inside]
+        nearest = np.lexsort((indices, distances))
+        return indices[nearest], distances[nearest]
+
 
 _SpriteType = TypeVar('_SpriteType', bound=Sprite)
 
@@ -305,6 +470,11 @@ def __init__(self,
         else:
             self.spatial_hash = None
 
+        # Built when first needed for nearest sprite queries, dropped when sprites move
+        self._position_index: Optional[_PositionIndex] = None
+        # Counts sprites added, removed or replaced, for anything keeping track of the contents
+        self._change_count = 0
+
         LOG.debug("[%s] Creating SpriteList use_spatial_hash=%s is_static=%s",
                   id(self), use_spatial_hash, is_static)
 
@@ -319,6 +489,8 @@ def append(self, item: _SpriteType):
         self.sprite_idx[item] = idx
         item.register_sprite_list(self)
         self._vao1 = None
+        self._position_index = None
+        self._change_count += 1
         if self._use_spatial_hash:
             self.spatial_hash.insert_object_for_box(item)
 
@@ -344,6 +516,8 @@ def insert(self, index: int, item: _SpriteType):
             self.sprite_idx[sprite] = idx
 
         self._vao1 = None
+        self._position_index = None
+        self._change_count += 1
         if self._use_spatial_hash:
             self.spatial_hash.insert_object_for_box(item)
 
@@ -356,6 +530,7 @@ def reverse(self):
             self.sprite_idx[sprite] = idx
 
         self._vao1 = None
+        self._position_index = None
 
     @property
     def percent_sprites_moved(self):
@@ -405,9 +580,34 @@ def remove(self, item: _SpriteType):
             self.sprite_idx[sprite] = idx
 
         self._vao1 = None
+        self._position_index = None
+        self._change_count += 1
         if self._use_spatial_hash:
             self.spatial_hash.remove_object(item)
 
+    def remove_many(self, items: Iterable[_SpriteType]):
+        """
+        Remove several sprites from the list at once. Much faster than calling
+        :meth:`remove` for each of them on a big list, as the index is only
+        rebuilt once.
+
+        :param items: Sprites to remove. They must be in the list.
+        """
+        items = set(items)
+        self.sprite_list[:] = [sprite for sprite in self.sprite_list if sprite not in items]
+        for item in items:
+            item.sprite_lists.remove(self)
+            del self.sprite_idx[item]
+            if self._use_spatial_hash:
+                self.spatial_hash.remove_object(item)
+
+        for idx, sprite in enumerate(self.sprite_list):
+            self.sprite_idx[sprite] = idx
+
+        self._vao1 = None
+        self._position_index = None
+        self._change_count += 1
+
     def update(self):
         """
         Call the update() method on each sprite in the list.
@@ -839,6 +1039,7 @@ def update_position(self, sprite: Sprite):
 
         :param Sprite sprite: Sprite to update.
         """
+        self._position_index = None
         if self._vao1 is None:
             return
 
@@ -929,6 +1130,7 @@ def update_location(self, sprite: Sprite):
 
         :param Sprite sprite: Sprite to update.
         """
+        self._position_index = None
         if self._vao1 is None:
             return
 
@@ -1049,6 +1251,8 @@ def __getitem__(self, i):
 
     def __setitem__(self, key: int, value: Sprite):
         self._vao1 = None
+        self._position_index = None
+        self._change_count += 1
         self.sprite_list[key] = value
         self.sprite_idx[value] = key
 
@@ -1067,28 +1271,71 @@ def pop(self, index: int = -1) -> Sprite:
         self.remove(sprite)
         return sprite
 
+    def _get_position_index(self) -> _PositionIndex:
+        """
+        Index of where the sprites are. It is kept until a sprite in the list
+        moves or the list changes, so all the queries made between two
+        updates share it.
+        """
+        if self._position_index is None:
+            self._position_index = _PositionIndex(self.sprite_list)
+        return self._position_index
+
 
 def get_closest_sprite(sprite: Sprite, sprite_list: SpriteList) -> Optional[Tuple[Sprite, float]]:
     """
     Given a Sprite and SpriteList, returns the closest sprite, and its distance.
 
+    The sprite centers are put in a grid the first time the list is searched,
+    and the grid is reused until a sprite in the list moves. Searching the
+    same list for many sprites in a frame only builds it once.
+
     :param Sprite sprite: Target sprite
     :param SpriteList sprite_list: List to search for closest sprite.
 
     :return: Closest sprite.
     :rtype: Sprite
     """
-    if len(sprite_list) == 0:
+    nearest = get_k_nearest_sprites(sprite, sprite_list, 1)
+    if not nearest:
         return None
+    return nearest[0]
+
+
+def get_k_nearest_sprites(sprite: Sprite, sprite_list: SpriteList, k: int) -> List[Tuple[Sprite, float]]:
+    """
+    Find the sprites in a list whose centers are closest to a sprite's center.
+    Uses the same index as :func:`get_closest_sprite`.
 
-    min_pos = 0
-    min_distance = get_distance_between_sprites(sprite, sprite_list[min_pos])
-    for i in range(1, len(sprite_list)):
-        distance = get_distance_between_sprites(sprite, sprite_list[i])
-        if distance < min_distance:
-            min_pos = i
-            min_distance = distance
-    return sprite_list[min_pos], min_distance
+    :param Sprite sprite: Target sprite
+    :param SpriteList sprite_list: List to search.
+    :param int k: Number of sprites to find.
+
+    :return: Up to `k` (sprite, distance) pairs, closest first.
+    """
+    if k <= 0 or len(sprite_list) == 0:
+        return []
+    index = sprite_list._get_position_index()
+    indices, distances = index.get_nearest(sprite.position, k)
+    return [(index.sprites[i], distance) for i, distance in zip(indices.tolist(), distances.tolist())]
+
+
+def get_sprites_in_radius(point: Point, sprite_list: SpriteList, radius: float) -> List[Sprite]:
+    """
+    Get the sprites whose centers are within a distance of a point. Uses the
+    same index as :func:`get_closest_sprite`.
+
+    :param Point point: Point to search around.
+    :param SpriteList sprite_list: List to search.
+    :param float radius: Distance from the point.
+
+    :return: Sprites found, closest first.
+    """
+    if len(sprite_list) == 0:
+        return []
+    index = sprite_list._get_position_index()
+    indices, _ = index.get_in_radius(point, radius)
+    return [index.sprites[i] for i in indices.tolist()]
 
 
 def check_for_collision(sprite1: Sprite, sprite2: Sprite) -> bool:
@@ -1206,6 +1453,101 @@ def get_sprites_at_point(point: Point,
 
     return collision_list
 
+
+def get_sprites_at_points(points, sprite_list: SpriteList) -> List[List[int]]:
+    """
+    Get the sprites at many points at once, such as every hit-scan shot or
+    touch in a frame. Gives the same sprites as calling
+    :func:`get_sprites_at_point` for each point, but the point in polygon
+    tests are done together with NumPy.
+
+    With a spatial hash, the points are sorted into the hash cells first and
+    only tested against the sprites in their cell. Otherwise each point is
+    tested against the sprites whose bounding box it is in.
+
+    :param points: Array or list of (x, y) points, shaped N x 2
+    :param SpriteList sprite_list: SpriteList to check against
+
+    :returns: For each point, the indices in the sprite list of the sprites
+              at that point, in list order.
+    """
+    if not isinstance(sprite_list, SpriteList):
+        raise TypeError(f"Parameter 2 is a {type(sprite_list)} instead of expected SpriteList.")
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    results: List[List[int]] = [[] for _ in range(len(points))]
+    if len(points) == 0 or len(sprite_list) == 0:
+        return results
+
+    # Pairs of point and sprite to test
+    if sprite_list.use_spatial_hash:
+        cell_size = sprite_list.spatial_hash.cell_size
+        # Same rounding toward zero as _SpatialHash._hash
+        keys = np.trunc(points / cell_size).astype(np.int64)
+        unique_keys, key_index = np.unique(keys, axis=0, return_inverse=True)
+        key_index = key_index.reshape(-1)
+        order = np.argsort(key_index, kind="stable")
+        point_groups = np.split(order, np.cumsum(np.bincount(key_index, minlength=len(unique_keys)))[:-1])
+
+        point_list = []
+        sprite_list_index = []
+        for (key_x, key_y), group in zip(unique_keys.tolist(), point_groups):
+            bucket = sprite_list.spatial_hash.contents.get((key_x, key_y))
+            if not bucket:
+                continue
+            bucket_index = np.array([sprite_list.sprite_idx[sprite] for sprite in bucket], dtype=np.int64)
+            point_list.append(np.repeat(group, len(bucket_index)))
+            sprite_list_index.append(np.tile(bucket_index, len(group)))
+        if not point_list:
+            return results
+        point_index = np.concatenate(point_list)
+        sprite_index = np.concatenate(sprite_list_index)
+        used_sprites, polygon_index = np.unique(sprite_index, return_inverse=True)
+    else:
+        used_sprites = np.arange(len(sprite_list))
+
+    # Hit boxes padded to the same number of points by repeating the last one, which adds edges of no length
+    hit_boxes = [sprite_list.sprite_list[i].get_adjusted_hit_box() for i in used_sprites.tolist()]
+    point_count = max(len(hit_box) for hit_box in hit_boxes)
+    if point_count == 0:
+        return results
+    polygons = np.full((len(hit_boxes), point_count, 2), np.nan)
+    for row, hit_box in enumerate(hit_boxes):
+        if hit_box:
+            polygons[row, :len(hit_box)] = hit_box
+            polygons[row, len(hit_box):] = hit_box[-1]
+
+    if not sprite_list.use_spatial_hash:
+        # Sprites without a hit box are all NaN and match no point
+        with np.errstate(invalid="ignore"):
+            low = polygons.min(axis=1)
+            high = polygons.max(axis=1)
+        inside_box = (points[:, None, 0] >= low[None, :, 0]) & (points[:, None, 0] <= high[None, :, 0]) \
+            & (points[:, None, 1] >= low[None, :, 1]) & (points[:, None, 1] <= high[None, :, 1])
+        point_index, polygon_index = np.nonzero(inside_box)
+        sprite_index = used_sprites[polygon_index]
+
+    # The same crossing test as is_point_in_polygon, for every pair at once
+    x = points[point_index, 0][:, None]
+    y = points[point_index, 1][:, None]
+    x1 = polygons[polygon_index, :, 0]
+    y1 = polygons[polygon_index, :, 1]
+    x2 = np.roll(x1, -1, axis=1)
+    y2 = np.roll(y1, -1, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing_x = (y - y1) * (x2 - x1) / (y2 - y1) + x1
+        crosses = (y > np.minimum(y1, y2)) & (y <= np.maximum(y1, y2)) & (x <= np.maximum(x1, x2)) \
+            & ((x1 == x2) | (x <= crossing_x))
+    inside = np.count_nonzero(crosses, axis=1) % 2 == 1
+
+    point_index = point_index[inside]
+    sprite_index = sprite_index[inside]
+    order = np.lexsort((sprite_index, point_index))
+    for point, sprite in zip(point_index[order].tolist(), sprite_index[order].tolist()):
+        results[point].append(sprite)
+    return results
+
+
 def get_sprites_at_exact_point(point: Point,
                                sprite_list: SpriteList) -> List[Sprite]:
     """
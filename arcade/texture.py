@@ -2,15 +2,28 @@
 Code related to working with textures.
 """
 
+import hashlib
+import json
 import math
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import PIL.Image
 import PIL.ImageOps
 import PIL.ImageDraw
 
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
 from typing import Optional
 from typing import List
+from typing import Set
+from typing import Tuple
 from typing import Union
 
 from arcade import lerp
@@ -64,6 +77,59 @@ def shear(self, sx: float, sy: float):
         return self.multiply([1.0, sy, 0.0, sx, 1.0, 0.0, 0.0, 0.0, 1.0])
 
 
+_hit_box_cache_dir: Optional[Path] = None
+
+
+def set_hit_box_cache_dir(path: Optional[Union[str, Path]]):
+    """
+    Store calculated hit boxes on disk, so they are only calculated once for
+    each version of an image rather than on every start of the game. Entries are
+    keyed by a hash of the image content, the hit box algorithm and the detail.
+
+    :param path: Directory to keep the hit boxes in. It is created if needed.
+                 Pass None to turn the disk cache off again, which is the default.
+    """
+    global _hit_box_cache_dir
+    if path is None:
+        _hit_box_cache_dir = None
+        return
+    _hit_box_cache_dir = Path(path)
+    _hit_box_cache_dir.mkdir(parents=True, exist_ok=True)
+
+
+def _calculate_hit_box_points(image: PIL.Image.Image, hit_box_algorithm: str, hit_box_detail: float):
+    """
+    Calculate the hit box of an image, going through the disk cache if enabled.
+    """
+    cache_dir = _hit_box_cache_dir
+    if cache_dir is not None:
+        digest = hashlib.sha1(image.tobytes())
+        digest.update(f"{image.mode}-{image.size}-{hit_box_algorithm}-{hit_box_detail}".encode())
+        cache_file = cache_dir / f"{digest.hexdigest()}.json"
+        try:
+            with open(cache_file) as file:
+                return tuple(tuple(point) for point in json.load(file))
+        except (OSError, ValueError):
+            pass
+
+    if hit_box_algorithm == "Simple":
+        points = calculate_hit_box_points_simple(image)
+    else:
+        points = calculate_hit_box_points_detailed(image, hit_box_detail)
+
+    if cache_dir is not None:
+        # Write to a temporary file first, so other processes never read half a file
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(temp_file, "w") as file:
+                json.dump([list(point) for point in points], file)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            pass
+
+    return points
+
+
 class Texture:
     """
     Class that represents a texture.
@@ -154,10 +220,10 @@ def hit_box_points(self):
         if self._hit_box_points is not None:
             return self._hit_box_points
         else:
-            if self._hit_box_algorithm == "Simple":
-                self._hit_box_points = calculate_hit_box_points_simple(self.image)
-            elif self._hit_box_algorithm == "Detailed":
-                self._hit_box_points = calculate_hit_box_points_detailed(self.image, self._hit_box_detail)
+            if self._hit_box_algorithm == "Simple" or self._hit_box_algorithm == "Detailed":
+                self._hit_box_points = _calculate_hit_box_points(self.image,
+                                                                 self._hit_box_algorithm,
+                                                                 self._hit_box_detail)
             else:
                 p1 = (-self.image.width / 2, -self.image.height / 2)
                 p2 = (self.image.width / 2, -self.image.height / 2)
@@ -242,6 +308,130 @@ def draw_scaled(self, center_x: float, center_y: float,
             self._sprite_list.draw()
 
 
+class TextureCache:
+    """
+    Cache of loaded textures used by :func:`load_texture` and friends. It is
+    available as ``load_texture.texture_cache``.
+
+    Keys are tuples, such as ``(file_name, x, y, width, height, ...)``. The cache
+    keeps track of how many bytes of image data it holds. When that goes over
+    ``max_bytes`` the least recently used entries are dropped, but only those
+    that nothing else references and that are not pinned. A texture still used by
+    a sprite is never evicted, since dropping it would not free any memory and
+    the next load would create a duplicate.
+
+    :param int max_bytes: Size of image data to keep cached. None for no limit.
+    """
+    def __init__(self, max_bytes: Optional[int] = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Texture]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._pinned: Set[Hashable] = set()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _size_of(texture: Texture) -> int:
+        """ Bytes of image data held by a texture. """
+        if texture.image is None:
+            return 0
+        return texture.image.width * texture.image.height * len(texture.image.getbands())
+
+    def get(self, key: Hashable) -> Optional[Texture]:
+        """
+        Get a texture from the cache.
+
+        :param key: Key the texture was stored under.
+        :returns: The texture, or None if it isn't cached.
+        """
+        texture = self._entries.get(key)
+        if texture is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return texture
+
+    def put(self, key: Hashable, texture: Texture):
+        """
+        Store a texture in the cache, and evict entries if that takes it over
+        ``max_bytes``.
+
+        :param key: Key to store the texture under.
+        :param Texture texture: Texture to store.
+        """
+        if key in self._entries:
+            self.bytes -= self._sizes[key]
+        self._entries[key] = texture
+        self._entries.move_to_end(key)
+        self._sizes[key] = self._size_of(texture)
+        self.bytes += self._sizes[key]
+        self.evict()
+
+    def pin(self, key: Hashable):
+        """
+        Keep an entry in the cache, even when it's unreferenced.
+        """
+        self._pinned.add(key)
+
+    def unpin(self, key: Hashable):
+        """
+        Let a pinned entry be evicted again.
+        """
+        self._pinned.discard(key)
+
+    def _in_use(self, key: Hashable) -> bool:
+        # One reference is ours, the other the argument of getrefcount
+        return sys.getrefcount(self._entries[key]) > 2
+
+    def evict(self):
+        """
+        Drop least recently used, unreferenced and unpinned entries until the cache
+        is within ``max_bytes``.
+        """
+        if self.max_bytes is None or self.bytes <= self.max_bytes:
+            return
+        for key in list(self._entries):
+            if self.bytes <= self.max_bytes:
+                break
+            if key in self._pinned or self._in_use(key):
+                continue
+            del self._entries[key]
+            self.bytes -= self._sizes.pop(key)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Empty the cache and reset its statistics. Pins are kept.
+        """
+        self._entries.clear()
+        self._sizes.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache statistics: ``hits``, ``misses``, ``bytes``, ``evictions`` and
+        ``entries``.
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'bytes': self.bytes,
+                'evictions': self.evictions,
+                'entries': len(self._entries)}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def load_textures(file_name: Union[str, Path],
                   image_location_list: RectList,
                   mirrored: bool = False,
@@ -269,16 +459,15 @@ def load_textures(file_name: Union[str, Path],
     :raises: ValueError
     """
     # See if we already loaded this texture file, and we can just use a cached version.
-    cache_file_name = "{}".format(file_name)
-    if cache_file_name in load_texture.texture_cache:  # type: ignore # dynamic attribute on function obj
-        texture = load_texture.texture_cache[cache_file_name]  # type: ignore # dynamic attribute on function obj
+    # Paths and strings naming the same file share cache entries.
+    file_name = str(file_name)
+    texture_cache = load_texture.texture_cache  # type: ignore # dynamic attribute on function obj
+    texture = texture_cache.get((file_name,))
+    if texture is not None:
         source_image = texture.image
     else:
-        file_name = resolve_resource_path(file_name)
-
-        source_image = PIL.Image.open(file_name)
-        result = Texture(cache_file_name, source_image)
-        load_texture.texture_cache[cache_file_name] = result  # type: ignore # dynamic attribute on function obj
+        source_image = PIL.Image.open(resolve_resource_path(file_name))
+        texture_cache.put((file_name,), Texture("{}".format(file_name), source_image))
 
     source_image_width, source_image_height = source_image.size
     texture_info_list = []
@@ -306,10 +495,9 @@ def load_textures(file_name: Union[str, Path],
                              .format(y + height, source_image_height))
 
         # See if we already loaded this texture, and we can just use a cached version.
-        cache_name = "{}{}{}{}{}{}{}".format(file_name, x, y, width, height, flipped, mirrored)
-        if cache_name in load_texture.texture_cache:  # type: ignore # dynamic attribute on function obj
-            result = load_texture.texture_cache[cache_name]  # type: ignore # dynamic attribute on function obj
-        else:
+        cache_key = (file_name, x, y, width, height, flipped, mirrored)
+        result = texture_cache.get(cache_key)
+        if result is None:
             image = source_image.crop((x, y, x + width, y + height))
             # image = _trim_image(image)
 
@@ -318,13 +506,78 @@ def load_textures(file_name: Union[str, Path],
 
             if flipped:
                 image = PIL.ImageOps.flip(image)
-            result = Texture(cache_name, image)
-            load_texture.texture_cache[cache_name] = result  # type: ignore # dynamic attribute on function obj
+            result = Texture("{}{}{}{}{}{}{}".format(*cache_key), image)
+            texture_cache.put(cache_key, result)
         texture_info_list.append(result)
 
     return texture_info_list
 
 
+def _texture_cache_name(file_name: Union[str, Path],
+                        x: float, y: float, width: float, height: float,
+                        flipped_horizontally: bool,
+                        flipped_vertically: bool,
+                        flipped_diagonally: bool,
+                        hit_box_algorithm) -> str:
+    """
+    Name a texture is stored under in the cache of :func:`load_texture`.
+    """
+    return "{}-{}-{}-{}-{}-{}-{}-{}-{}".format(file_name,
+                                               x,
+                                               y,
+                                               width,
+                                               height,
+                                               flipped_horizontally,
+                                               flipped_vertically,
+                                               flipped_diagonally,
+                                               hit_box_algorithm)
+
+
+def _crop_and_flip(source_image: PIL.Image.Image,
+                   x: float, y: float, width: float, height: float,
+                   flipped_horizontally: bool,
+                   flipped_vertically: bool,
+                   flipped_diagonally: bool) -> PIL.Image.Image:
+    """
+    Crops and flips a source image like requested by :func:`load_texture`.
+    """
+    source_image_width, source_image_height = source_image.size
+
+    if x != 0 or y != 0 or width != 0 or height != 0:
+        if x > source_image_width:
+            raise ValueError("Can't load texture starting at an x of {} "
+                             "when the image is only {} across."
+                             .format(x, source_image_width))
+        if y > source_image_height:
+            raise ValueError("Can't load texture starting at an y of {} "
+                             "when the image is only {} high."
+                             .format(y, source_image_height))
+        if x + width > source_image_width:
+            raise ValueError("Can't load texture ending at an x of {} "
+                             "when the image is only {} wide."
+                             .format(x + width, source_image_width))
+        if y + height > source_image_height:
+            raise ValueError("Can't load texture ending at an y of {} "
+                             "when the image is only {} high."
+                             .format(y + height, source_image_height))
+
+        image = source_image.crop((x, y, x + width, y + height))
+    else:
+        image = source_image
+
+    # image = _trim_image(image)
+    if flipped_diagonally:
+        image = image.transpose(PIL.Image.TRANSPOSE)
+
+    if flipped_horizontally:
+        image = image.transpose(PIL.Image.FLIP_LEFT_RIGHT)
+
+    if flipped_vertically:
+        image = image.transpose(PIL.Image.FLIP_TOP_BOTTOM)
+
+    return image
+
+
 def load_texture(file_name: Union[str, Path],
                  x: float = 0,
                  y: float = 0,
@@ -393,75 +646,206 @@ def load_texture(file_name: Union[str, Path],
         flipped_horizontally = mirrored
 
     # See if we already loaded this texture, and we can just use a cached version.
-    cache_name = "{}-{}-{}-{}-{}-{}-{}-{}-{}".format(file_name,
-                                                     x,
-                                                     y,
-                                                     width,
-                                                     height,
-                                                     flipped_horizontally,
-                                                     flipped_vertically,
-                                                     flipped_diagonally,
-                                                     hit_box_algorithm)
-    if can_cache and cache_name in load_texture.texture_cache:  # type: ignore # dynamic attribute on function obj
-        return load_texture.texture_cache[cache_name]  # type: ignore # dynamic attribute on function obj
+    # Paths and strings naming the same file share cache entries.
+    file_name = str(file_name)
+    texture_cache = load_texture.texture_cache  # type: ignore # dynamic attribute on function obj
+    cache_key = (file_name, x, y, width, height,
+                 flipped_horizontally, flipped_vertically, flipped_diagonally,
+                 hit_box_algorithm)
+    if can_cache:
+        result = texture_cache.get(cache_key)
+        if result is not None:
+            return result
 
     # See if we already loaded this texture file, and we can just use a cached version.
-    cache_file_name = f"{file_name}"
-    if cache_file_name in load_texture.texture_cache:  # type: ignore # dynamic attribute on function obj
-        texture = load_texture.texture_cache[cache_file_name]  # type: ignore # dynamic attribute on function obj
+    texture = texture_cache.get((file_name,))
+    if texture is not None:
         source_image = texture.image
     else:
         # If we should pull from local resources, replace with proper path
-        file_name = resolve_resource_path(file_name)
+        source_image = PIL.Image.open(resolve_resource_path(file_name)).convert('RGBA')
+        texture_cache.put((file_name,), Texture(f"{file_name}", source_image,
+                                                hit_box_algorithm=hit_box_algorithm,
+                                                hit_box_detail=hit_box_detail))
 
-        source_image = PIL.Image.open(file_name).convert('RGBA')
-        result = Texture(cache_file_name, source_image,
-                         hit_box_algorithm=hit_box_algorithm,
-                         hit_box_detail=hit_box_detail)
-        load_texture.texture_cache[cache_file_name] = result  # type: ignore # dynamic attribute on function obj
+    image = _crop_and_flip(source_image, x, y, width, height,
+                           flipped_horizontally, flipped_vertically, flipped_diagonally)
 
-    source_image_width, source_image_height = source_image.size
+    result = Texture(_texture_cache_name(*cache_key), image,
+                     hit_box_algorithm=hit_box_algorithm,
+                     hit_box_detail=hit_box_detail)
+    texture_cache.put(cache_key, result)
+    return result
 
-    if x != 0 or y != 0 or width != 0 or height != 0:
-        if x > source_image_width:
-            raise ValueError("Can't load texture starting at an x of {} "
-                             "when the image is only {} across."
-                             .format(x, source_image_width))
-        if y > source_image_height:
-            raise ValueError("Can't load texture starting at an y of {} "
-                             "when the image is only {} high."
-                             .format(y, source_image_height))
-        if x + width > source_image_width:
-            raise ValueError("Can't load texture ending at an x of {} "
-                             "when the image is only {} wide."
-                             .format(x + width, source_image_width))
-        if y + height > source_image_height:
-            raise ValueError("Can't load texture ending at an y of {} "
-                             "when the image is only {} high."
-                             .format(y + height, source_image_height))
 
-        image = source_image.crop((x, y, x + width, y + height))
-    else:
-        image = source_image
+load_texture.texture_cache = TextureCache()  # type: ignore
 
-    # image = _trim_image(image)
-    if flipped_diagonally:
-        image = image.transpose(PIL.Image.TRANSPOSE)
 
-    if flipped_horizontally:
-        image = image.transpose(PIL.Image.FLIP_LEFT_RIGHT)
+_texture_load_executor: Optional[ThreadPoolExecutor] = None
 
-    if flipped_vertically:
-        image = image.transpose(PIL.Image.FLIP_TOP_BOTTOM)
 
-    result = Texture(cache_name, image,
+def _get_texture_load_executor() -> ThreadPoolExecutor:
+    """
+    Thread pool used to decode textures in the background. Created on first use.
+    """
+    global _texture_load_executor
+    if _texture_load_executor is None:
+        _texture_load_executor = ThreadPoolExecutor(thread_name_prefix="arcade-texture-loader")
+    return _texture_load_executor
+
+
+def _load_texture_uncached(cache_key: Tuple, hit_box_detail: float) -> Texture:
+    """
+    Worker side of the async loaders. Decodes, crops and flips the image and
+    calculates the hit box, without touching the texture cache.
+    """
+    (file_name, x, y, width, height,
+     flipped_horizontally, flipped_vertically, flipped_diagonally,
+     hit_box_algorithm) = cache_key
+    source_image = PIL.Image.open(resolve_resource_path(file_name)).convert('RGBA')
+    image = _crop_and_flip(source_image, x, y, width, height,
+                           flipped_horizontally, flipped_vertically, flipped_diagonally)
+    result = Texture(_texture_cache_name(*cache_key), image,
                      hit_box_algorithm=hit_box_algorithm,
                      hit_box_detail=hit_box_detail)
-    load_texture.texture_cache[cache_name] = result  # type: ignore # dynamic attribute on function obj
+    # Calculate the hit box now, so the main thread doesn't have to on the first collision check
+    result.hit_box_points
     return result
 
 
-load_texture.texture_cache = dict()  # type: ignore
+def load_texture_async(file_name: Union[str, Path],
+                       x: float = 0,
+                       y: float = 0,
+                       width: float = 0, height: float = 0,
+                       flipped_horizontally: bool = False,
+                       flipped_vertically: bool = False,
+                       flipped_diagonally: bool = False,
+                       hit_box_algorithm="Simple",
+                       hit_box_detail: float = 4.5) -> "Future[Texture]":
+    """
+    Load a texture on a background thread. Decoding the image and calculating
+    its hit box happens off the main thread, which keeps the game responsive
+    while large images load.
+
+    Parameters are the same as :func:`load_texture`. If the texture is already in
+    the cache of :func:`load_texture` the returned future is already done.
+    Textures loaded this way are not added to that cache; use
+    :func:`preload_textures` for that.
+
+    :returns: A :class:`concurrent.futures.Future` resolving to a :class:`Texture`.
+    """
+    cache_key = (str(file_name), x, y, width, height,
+                 flipped_horizontally, flipped_vertically, flipped_diagonally,
+                 hit_box_algorithm)
+    texture = load_texture.texture_cache.get(cache_key)  # type: ignore # dynamic attribute on function obj
+    if texture is not None:
+        future: Future = Future()
+        future.set_result(texture)
+        return future
+
+    return _get_texture_load_executor().submit(_load_texture_uncached, cache_key, hit_box_detail)
+
+
+class TexturePreload:
+    """
+    Handle for textures being loaded by :func:`preload_textures`.
+
+    Call :meth:`update` once per frame, for example from ``on_update``. It adds
+    the textures that have finished loading to the texture cache, but stops when
+    its time budget is used up, so a frame never stalls on a large batch.
+
+    :param List[Future] futures: Futures of the textures being loaded, in order.
+    :param List[Tuple] cache_keys: Texture cache keys of the textures, in the same order.
+    """
+    def __init__(self, futures: List[Future], cache_keys: List[Tuple]):
+        self.futures = futures
+        self.cache_keys = cache_keys
+        self._textures: List[Texture] = []
+
+    @property
+    def progress(self) -> float:
+        """ Fraction of the textures that have finished loading, from 0.0 to 1.0. """
+        if not self.futures:
+            return 1.0
+        return sum(1 for future in self.futures if future.done()) / len(self.futures)
+
+    @property
+    def done(self) -> bool:
+        """ True when every texture has been loaded and added to the cache. """
+        return len(self._textures) == len(self.futures)
+
+    @property
+    def textures(self) -> List[Texture]:
+        """ The textures added to the cache so far, in the order they were requested. """
+        return self._textures
+
+    def update(self, time_budget: float = 0.002) -> bool:
+        """
+        Add finished textures to the texture cache, in request order.
+
+        :param float time_budget: Seconds this call may spend before returning.
+        :returns: True when all textures are done.
+        :raises: Any exception raised while loading a texture.
+        """
+        start_time = time.perf_counter()
+        while not self.done:
+            future = self.futures[len(self._textures)]
+            if not future.done():
+                break
+            texture = future.result()
+            cache_key = self.cache_keys[len(self._textures)]
+            texture_cache = load_texture.texture_cache  # type: ignore # dynamic attribute on function obj
+            # Another load may have cached the same texture in the meantime. Keep that one.
+            if cache_key in texture_cache:
+                texture = texture_cache.get(cache_key)
+            else:
+                texture_cache.put(cache_key, texture)
+            self._textures.append(texture)
+            if time.perf_counter() - start_time >= time_budget:
+                break
+        return self.done
+
+    def wait(self) -> List[Texture]:
+        """
+        Block until every texture is loaded, then return them all.
+        """
+        for future in self.futures:
+            future.result()
+        while not self.update(time_budget=math.inf):
+            pass
+        return self._textures
+
+
+def preload_textures(file_names: Iterable[Union[str, Path]],
+                     hit_box_algorithm="Simple",
+                     hit_box_detail: float = 4.5) -> TexturePreload:
+    """
+    Start loading a batch of textures on background threads, for example
+    while showing a loading screen.
+
+    .. code-block:: python
+
+        self.preload = arcade.preload_textures([":resources:images/tiles/grassMid.png",
+                                                ":resources:images/tiles/boxCrate.png"])
+
+        def on_update(self, delta_time):
+            if self.preload.update():
+                # Every texture is loaded. load_texture() now hits the cache.
+                ...
+
+    :param file_names: Names of the image files to load.
+    :param str hit_box_algorithm: One of 'None', 'Simple' or 'Detailed'.
+    :param float hit_box_detail: Used with 'Detailed' to hit box.
+    :returns: A :class:`TexturePreload` to follow and finish the loading.
+    """
+    file_names = list(file_names)
+    futures = [load_texture_async(file_name,
+                                  hit_box_algorithm=hit_box_algorithm,
+                                  hit_box_detail=hit_box_detail)
+               for file_name in file_names]
+    cache_keys = [(str(file_name), 0, 0, 0, 0, False, False, False, hit_box_algorithm)
+                  for file_name in file_names]
+    return TexturePreload(futures, cache_keys)
 
 
 def cleanup_texture_cache():
@@ -469,7 +853,7 @@ def cleanup_texture_cache():
     This cleans up the cache of textures. Useful when running unit tests so that
     the next test starts clean.
     """
-    load_texture.texture_cache = dict()
+    load_texture.texture_cache.clear()  # type: ignore # dynamic attribute on function obj
     import gc
     gc.collect()
 
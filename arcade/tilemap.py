@@ -11,18 +11,28 @@
 
 """
 
-from typing import Optional, List, cast, Union
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Optional, List, Set, Tuple, cast, Union
+import array
 import math
 import copy
+import hashlib
+import pickle
 import pytiled_parser
 import os
+import re
 from pathlib import Path
 
+import PIL.Image
+
 from arcade import Sprite
 from arcade import AnimatedTimeBasedSprite
 from arcade import AnimationKeyframe
 from arcade import SpriteList
 from arcade import load_texture
+from arcade import OccupancyGrid
 from arcade.arcade_types import Point
 from arcade.resources import resolve_resource_path
 
@@ -31,7 +41,88 @@
 _FLIPPED_DIAGONALLY_FLAG = 0x20000000
 
 
-def read_tmx(tmx_file: Union[str, Path]) -> pytiled_parser.objects.TileMap:
+_TMX_CACHE_VERSION = 1
+
+
+class _PackedGrid:
+    """
+    Tile layer data packed into an array of unsigned ints, for the parsed map cache.
+    """
+    def __init__(self, grid: List[List[int]]):
+        self.width = len(grid[0]) if grid else 0
+        self.data = array.array('I', [gid for row in grid for gid in row]).tobytes()
+
+    def unpack(self) -> List[List[int]]:
+        if self.width == 0:
+            return []
+        data = array.array('I')
+        data.frombytes(self.data)
+        return [data[start:start + self.width].tolist() for start in range(0, len(data), self.width)]
+
+
+def _tile_layers(layers):
+    """ All tile layers in a list of layers, including those in layer groups. """
+    for layer in layers:
+        if isinstance(layer, pytiled_parser.objects.TileLayer):
+            yield layer
+        elif isinstance(layer, pytiled_parser.objects.LayerGroup) and layer.layers:
+            yield from _tile_layers(layer.layers)
+
+
+def _swap_layer_grids(tile_map: pytiled_parser.objects.TileMap, swap):
+    """ Replace the layer data grids of a map, and its chunks for infinite maps. """
+    for layer in _tile_layers(tile_map.layers):
+        if layer.layer_data is None:
+            continue
+        if tile_map.infinite:
+            for chunk in layer.layer_data:
+                chunk.chunk_data = swap(chunk.chunk_data)
+        else:
+            layer.layer_data = swap(layer.layer_data)
+
+
+def _read_tmx_cached(tmx_file: Path, cache_dir: Path) -> pytiled_parser.objects.TileMap:
+    """
+    Read a map through the parsed map cache. The cache entry is keyed by the
+    content of the map and of its external tilesets, so any change to one of
+    them gives a new entry.
+    """
+    with open(tmx_file, 'rb') as file:
+        tmx_data = file.read()
+    digest = hashlib.sha1(f"{_TMX_CACHE_VERSION}-{tmx_file}".encode())
+    digest.update(tmx_data)
+    for source in re.findall(rb'<tileset[^>]*\ssource="([^"]+)"', tmx_data):
+        with open(Path(tmx_file).parent / source.decode(), 'rb') as file:
+            digest.update(file.read())
+    cache_file = cache_dir / f"{digest.hexdigest()}.tmxcache"
+
+    try:
+        with open(cache_file, 'rb') as file:
+            tile_map = pickle.load(file)
+        _swap_layer_grids(tile_map, _PackedGrid.unpack)
+        return tile_map
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass
+
+    tile_map = pytiled_parser.parse_tile_map(tmx_file)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    _swap_layer_grids(tile_map, _PackedGrid)
+    try:
+        with open(temp_file, 'wb') as file:
+            pickle.dump(tile_map, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+    finally:
+        _swap_layer_grids(tile_map, _PackedGrid.unpack)
+
+    return tile_map
+
+
+def read_tmx(tmx_file: Union[str, Path],
+             cache_dir: Optional[Union[str, Path]] = None) -> pytiled_parser.objects.TileMap:
     """
     Given a .tmx, this will read in a tiled map, and return
     a TiledMap object.
@@ -46,7 +137,13 @@ def read_tmx(tmx_file: Union[str, Path]) -> pytiled_parser.objects.TileMap:
     but only polygons are supported.
     (This is a great area for PR's to improve things.)
 
+    Parsing big maps can take a while. If `cache_dir` is given, the parsed map
+    is stored there in binary form and read back on the next run, as long as
+    the map and its tilesets haven't changed. Only point it to a directory
+    the game controls, the cache files are pickles.
+
     :param str tmx_file: String with name of our TMX file
+    :param cache_dir: Directory to cache parsed maps in. Defaults to no caching.
 
     :returns: Map
     :rtype: TiledMap
@@ -55,6 +152,9 @@ def read_tmx(tmx_file: Union[str, Path]) -> pytiled_parser.objects.TileMap:
     # If we should pull from local resources, replace with proper path
     tmx_file = resolve_resource_path(tmx_file)
 
+    if cache_dir is not None:
+        return _read_tmx_cached(tmx_file, Path(cache_dir))
+
     tile_map = pytiled_parser.parse_tile_map(tmx_file)
 
     return tile_map
@@ -358,6 +458,30 @@ def _create_sprite_from_tile(map_object: pytiled_parser.objects.TileMap,
     return my_sprite
 
 
+class _TilePrototype:
+    """
+    What every tile with the same GID in a layer has in common: the texture,
+    the hit box set from the tileset and the properties. Sprites for the other
+    tiles with that GID are made from it, instead of looking the tile, its image
+    and its hit box up again.
+    """
+    def __init__(self, sprite: Sprite):
+        self.texture = sprite.texture
+        # The first sprite's unscaled hit box: the tileset's if it defines one, else the texture's
+        self.hit_box = sprite._points
+        self.properties = MappingProxyType(dict(sprite.properties))
+
+    def create_sprite(self, scaling: float) -> Sprite:
+        my_sprite = Sprite(scale=scaling)
+        if self.texture is not None:
+            my_sprite.texture = self.texture
+            my_sprite.textures = [self.texture]
+        if self.hit_box is not None:
+            my_sprite.set_hit_box(self.hit_box)
+        my_sprite.properties = dict(self.properties)
+        return my_sprite
+
+
 def _process_object_layer(map_object: pytiled_parser.objects.TileMap,
                           layer: pytiled_parser.objects.ObjectLayer,
                           scaling: float = 1,
@@ -435,6 +559,59 @@ def _process_object_layer(map_object: pytiled_parser.objects.TileMap,
     return sprite_list
 
 
+def _create_tile_layer_sprite(map_object: pytiled_parser.objects.TileMap,
+                              layer: pytiled_parser.objects.TileLayer,
+                              item: int,
+                              prototypes: Dict[int, _TilePrototype],
+                              scaling: float,
+                              base_directory: str,
+                              hit_box_algorithm,
+                              hit_box_detail: float) -> Optional[Sprite]:
+    """
+    Create the sprite for a tile layer cell holding GID `item`, from its prototype
+    if there is one. Makes the prototype otherwise.
+    """
+    prototype = prototypes.get(item)
+    if prototype is not None:
+        return prototype.create_sprite(scaling)
+
+    tile = _get_tile_by_gid(map_object, item)
+    if tile is None:
+        print(f"Warning, couldn't find tile for item {item} in layer "
+              f"'{layer.name}' in file '{map_object.tmx_file}'.")
+        return None
+
+    my_sprite = _create_sprite_from_tile(map_object, tile, scaling=scaling,
+                                         base_directory=base_directory,
+                                         hit_box_algorithm=hit_box_algorithm,
+                                         hit_box_detail=hit_box_detail)
+
+    if my_sprite is None:
+        print(f"Warning: Could not create sprite number {item} in layer '{layer.name}' {tile.image.source}")
+    # Animated tiles each get their own frames, so they always take the long way
+    elif not tile.animation:
+        prototypes[item] = _TilePrototype(my_sprite)
+
+    return my_sprite
+
+
+def _place_tile_layer_sprite(map_object: pytiled_parser.objects.TileMap,
+                             layer: pytiled_parser.objects.TileLayer,
+                             my_sprite: Sprite,
+                             row_index: int,
+                             column_index: int,
+                             scaling: float):
+    """ Move a tile layer sprite to its cell. """
+    my_sprite.center_x = column_index * (map_object.tile_size[0] * scaling) + my_sprite.width / 2
+    my_sprite.center_y = (map_object.map_size.height - row_index - 1) \
+        * (map_object.tile_size[1] * scaling) + my_sprite.height / 2
+
+    # Opacity
+    opacity = layer.opacity
+    if opacity:
+        my_sprite.alpha = int(opacity * 255)
+
+
 def _process_tile_layer(map_object: pytiled_parser.objects.TileMap,
                         layer: pytiled_parser.objects.TileLayer,
                         scaling: float = 1,
@@ -445,6 +622,7 @@ def _process_tile_layer(map_object: pytiled_parser.objects.TileMap,
                         ) -> SpriteList:
     sprite_list: SpriteList = SpriteList(use_spatial_hash=use_spatial_hash)
     map_array = layer.layer_data
+    prototypes: Dict[int, _TilePrototype] = {}
 
     # Loop through the layer and add in the wall list
     for row_index, row in enumerate(map_array):
@@ -453,32 +631,351 @@ def _process_tile_layer(map_object: pytiled_parser.objects.TileMap,
             if item == 0:
                 continue
 
-            tile = _get_tile_by_gid(map_object, item)
-            if tile is None:
-                print(f"Warning, couldn't find tile for item {item} in layer "
-                      f"'{layer.name}' in file '{map_object.tmx_file}'.")
+            my_sprite = _create_tile_layer_sprite(map_object, layer, item, prototypes, scaling,
+                                                  base_directory, hit_box_algorithm, hit_box_detail)
+            if my_sprite is not None:
+                _place_tile_layer_sprite(map_object, layer, my_sprite, row_index, column_index, scaling)
+                sprite_list.append(my_sprite)
+
+    return sprite_list
+
+
+_chunk_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_chunk_executor() -> ThreadPoolExecutor:
+    """
+    Thread used to build the chunks of streaming tile layers. Created on first use.
+    """
+    global _chunk_executor
+    if _chunk_executor is None:
+        _chunk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arcade-tilemap-chunks")
+    return _chunk_executor
+
+
+class StreamingTileLayer:
+    """
+    A tile layer that only has sprites for the part of the map around a focus
+    point, usually the player. This keeps very large maps from taking up lots
+    of memory and loading time, and keeps sprite lists short.
+
+    The layer is split into square chunks of tiles. Call :meth:`update` each
+    frame with the focus point. Chunks within `load_radius` of it are built and
+    added to :attr:`sprite_list`, chunks farther away than
+    `load_radius + hysteresis` are removed again. The hysteresis stops chunks
+    from being built and dropped over and over when the focus point moves back
+    and forth near the edge.
+
+    :attr:`sprite_list` uses a spatial hash, so it can be handed to the physics
+    engines or collision functions as the walls of the layer.
+
+    .. code-block:: python
+
+        self.walls = arcade.tilemap.StreamingTileLayer(my_map, "Platforms", load_radius=1500)
+        self.physics_engine = arcade.PhysicsEnginePlatformer(self.player, self.walls.sprite_list)
+
+        def on_update(self, delta_time):
+            self.walls.update(self.player.center_x, self.player.center_y)
+            self.physics_engine.update()
+
+    :param map_object: The TileMap read in by read_tmx.
+    :param str layer_name: Name of the tile layer.
+    :param float scaling: Scaling the layer up or down.
+    :param str base_directory: Base directory of the file, that we start from to load images.
+    :param int chunk_size: Width and height of a chunk, in tiles.
+    :param float load_radius: Distance from the focus point within which chunks are loaded.
+    :param float hysteresis: Extra distance a chunk has to be away before it is unloaded.
+    :param bool threaded: Build chunks on a background thread. The sprites are added to
+                          the sprite list on a later :meth:`update`.
+    :param str hit_box_algorithm: One of 'None', 'Simple' or 'Detailed'.
+    :param float hit_box_detail: Used with 'Detailed' to hit box.
+    """
+    def __init__(self,
+                 map_object: pytiled_parser.objects.TileMap,
+                 layer_name: str,
+                 scaling: float = 1,
+                 base_directory: str = "",
+                 chunk_size: int = 16,
+                 load_radius: float = 1000,
+                 hysteresis: float = 200,
+                 threaded: bool = True,
+                 hit_box_algorithm="Simple",
+                 hit_box_detail: float = 4.5):
+        layer = get_tilemap_layer(map_object, layer_name)
+        if not isinstance(layer, pytiled_parser.objects.TileLayer) or map_object.infinite:
+            raise ValueError(f"'{layer_name}' is not a tile layer of a finite map.")
+
+        if len(base_directory) > 0 and not base_directory.endswith("/"):
+            base_directory += "/"
+
+        self.map_object = map_object
+        self.layer = layer
+        self.scaling = scaling
+        self.base_directory = base_directory
+        self.chunk_size = chunk_size
+        self.load_radius = load_radius
+        self.hysteresis = hysteresis
+        self.threaded = threaded
+        self.hit_box_algorithm = hit_box_algorithm
+        self.hit_box_detail = hit_box_detail
+
+        self.sprite_list = SpriteList(use_spatial_hash=True)
+
+        self._chunks: Dict[Tuple[int, int], List[Sprite]] = {}
+        self._pending: Dict[Tuple[int, int], Future] = {}
+        self._prototypes: Dict[int, _TilePrototype] = {}
+        # GIDs that can't have a prototype, such as animated tiles. Built on the main thread.
+        self._no_prototype: Set[int] = set()
+
+        self._rows = len(layer.layer_data)
+        self._columns = len(layer.layer_data[0]) if self._rows else 0
+        self._chunk_width = chunk_size * map_object.tile_size[0] * scaling
+        self._chunk_height = chunk_size * map_object.tile_size[1] * scaling
+        self._map_height = map_object.map_size.height * map_object.tile_size[1] * scaling
+
+    @property
+    def loaded_chunks(self) -> Set[Tuple[int, int]]:
+        """ (column, row) of the chunks with sprites in the sprite list. Row 0 is the top of the map. """
+        return set(self._chunks)
+
+    def _chunk_distance(self, chunk: Tuple[int, int], x: float, y: float) -> float:
+        """ Distance from a point to the nearest edge of a chunk, 0 if it is inside. """
+        column, row = chunk
+        left = column * self._chunk_width
+        right = left + self._chunk_width
+        top = self._map_height - row * self._chunk_height
+        bottom = top - self._chunk_height
+        dx = max(left - x, 0, x - right)
+        dy = max(bottom - y, 0, y - top)
+        return math.hypot(dx, dy)
+
+    def _cells(self, chunk: Tuple[int, int]):
+        """ (row, column, gid) of the non-empty cells in a chunk. """
+        column, row = chunk
+        data = self.layer.layer_data
+        for row_index in range(row * self.chunk_size, min((row + 1) * self.chunk_size, self._rows)):
+            map_row = data[row_index]
+            for column_index in range(column * self.chunk_size, min((column + 1) * self.chunk_size, self._columns)):
+                item = map_row[column_index]
+                if item != 0:
+                    yield row_index, column_index, item
+
+    def _build_chunk(self, chunk: Tuple[int, int]):
+        """
+        Make the sprites of a chunk from the tile prototypes. Doesn't touch the
+        texture cache or any sprite list, so it can run on a worker thread.
+
+        :returns: The sprites, and the cells that have to be built on the main thread.
+        """
+        sprites = []
+        leftovers = []
+        for row_index, column_index, item in self._cells(chunk):
+            prototype = self._prototypes.get(item)
+            if prototype is None:
+                leftovers.append((row_index, column_index, item))
                 continue
+            my_sprite = prototype.create_sprite(self.scaling)
+            _place_tile_layer_sprite(self.map_object, self.layer, my_sprite, row_index, column_index, self.scaling)
+            sprites.append(my_sprite)
+        return sprites, leftovers
+
+    def _add_chunk(self, chunk: Tuple[int, int], sprites: List[Sprite], leftovers):
+        for row_index, column_index, item in leftovers:
+            my_sprite = _create_tile_layer_sprite(self.map_object, self.layer, item, self._prototypes,
+                                                  self.scaling, self.base_directory,
+                                                  self.hit_box_algorithm, self.hit_box_detail)
+            if my_sprite is not None:
+                _place_tile_layer_sprite(self.map_object, self.layer, my_sprite,
+                                         row_index, column_index, self.scaling)
+                sprites.append(my_sprite)
+        self.sprite_list.extend(sprites)
+        self._chunks[chunk] = sprites
+
+    def _load_chunk(self, chunk: Tuple[int, int]):
+        # Textures are loaded here on the main thread. Only the sprite building is left to the worker.
+        for _, _, item in self._cells(chunk):
+            if item not in self._prototypes and item not in self._no_prototype:
+                _create_tile_layer_sprite(self.map_object, self.layer, item, self._prototypes,
+                                          self.scaling, self.base_directory,
+                                          self.hit_box_algorithm, self.hit_box_detail)
+                if item not in self._prototypes:
+                    self._no_prototype.add(item)
+
+        if self.threaded:
+            self._pending[chunk] = _get_chunk_executor().submit(self._build_chunk, chunk)
+        else:
+            self._add_chunk(chunk, *self._build_chunk(chunk))
+
+    def update(self, focus_x: float, focus_y: float):
+        """
+        Load the chunks near the focus point and unload the ones far away.
+        Chunks finished on the background thread are added to the sprite list.
+
+        :param float focus_x: X position the map is loaded around.
+        :param float focus_y: Y position the map is loaded around.
+        """
+        for chunk, future in list(self._pending.items()):
+            if future.done():
+                del self._pending[chunk]
+                self._add_chunk(chunk, *future.result())
+
+        unload_radius = self.load_radius + self.hysteresis
+        for chunk in list(self._chunks):
+            if self._chunk_distance(chunk, focus_x, focus_y) > unload_radius:
+                self.sprite_list.remove_many(self._chunks.pop(chunk))
+        for chunk in list(self._pending):
+            if self._chunk_distance(chunk, focus_x, focus_y) > unload_radius:
+                self._pending.pop(chunk).cancel()
+
+        if not self._chunk_width or not self._chunk_height:
+            return
+        first_column = max(int((focus_x - self.load_radius) // self._chunk_width), 0)
+        last_column = min(int((focus_x + self.load_radius) // self._chunk_width),
+                          (self._columns - 1) // self.chunk_size)
+        first_row = max(int((self._map_height - focus_y - self.load_radius) // self._chunk_height), 0)
+        last_row = min(int((self._map_height - focus_y + self.load_radius) // self._chunk_height),
+                       (self._rows - 1) // self.chunk_size)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                chunk = column, row
+                if chunk in self._chunks or chunk in self._pending:
+                    continue
+                if self._chunk_distance(chunk, focus_x, focus_y) <= self.load_radius:
+                    self._load_chunk(chunk)
 
-            my_sprite = _create_sprite_from_tile(map_object, tile, scaling=scaling,
-                                                 base_directory=base_directory,
-                                                 hit_box_algorithm=hit_box_algorithm,
-                                                 hit_box_detail=hit_box_detail)
+    def wait(self):
+        """
+        Block until the chunks being built on the background thread are done,
+        and add them to the sprite list.
+        """
+        for chunk, future in list(self._pending.items()):
+            del self._pending[chunk]
+            self._add_chunk(chunk, *future.result())
 
-            if my_sprite is None:
-                print(f"Warning: Could not create sprite number {item} in layer '{layer.name}' {tile.image.source}")
-            else:
-                my_sprite.center_x = column_index * (map_object.tile_size[0] * scaling) + my_sprite.width / 2
-                my_sprite.center_y = (map_object.map_size.height - row_index - 1) \
-                    * (map_object.tile_size[1] * scaling) + my_sprite.height / 2
+    def draw(self):
+        """ Draw the loaded part of the layer. """
+        self.sprite_list.draw()
 
-                # Opacity
-                opacity = layer.opacity
-                if opacity:
-                    my_sprite.alpha = int(opacity * 255)
 
-                sprite_list.append(my_sprite)
+class TileLayerRenderer:
+    """
+    Draws a static tile layer on the GPU, without a sprite per tile.
 
-    return sprite_list
+    The layer is uploaded as a texture with one integer per cell, next to an
+    atlas of the layer's tile images. Drawing renders a single screen-sized
+    quad, and the shader looks up the tile for each pixel. The cost depends on
+    the screen resolution instead of the number of tiles, which suits big
+    background layers. It doesn't give sprites to collide with; use
+    :func:`process_layer` for layers the player interacts with.
+
+    Every tile image in the layer has to be the size of the map's tiles.
+    Animated tiles are drawn with their first frame.
+
+    .. code-block:: python
+
+        self.background = arcade.tilemap.TileLayerRenderer(my_map, "Background")
+
+        def on_draw(self):
+            arcade.start_render()
+            self.background.draw()
+
+    :param map_object: The TileMap read in by read_tmx.
+    :param str layer_name: Name of the tile layer.
+    :param float scaling: Scaling the layer up or down.
+    :param str base_directory: Base directory of the file, that we start from to load images.
+    """
+    def __init__(self,
+                 map_object: pytiled_parser.objects.TileMap,
+                 layer_name: str,
+                 scaling: float = 1,
+                 base_directory: str = ""):
+        layer = get_tilemap_layer(map_object, layer_name)
+        if not isinstance(layer, pytiled_parser.objects.TileLayer) or map_object.infinite:
+            raise ValueError(f"'{layer_name}' is not a tile layer of a finite map.")
+
+        if len(base_directory) > 0 and not base_directory.endswith("/"):
+            base_directory += "/"
+
+        self.scaling = scaling
+        self.alpha = layer.opacity if layer.opacity else 1.0
+        self.tile_width, self.tile_height = map_object.tile_size
+        self.rows = len(layer.layer_data)
+        self.columns = len(layer.layer_data[0]) if self.rows else 0
+
+        # Give every GID in the layer a slot in the atlas. Slot 0 means an empty cell.
+        prototypes: Dict[int, _TilePrototype] = {}
+        slots: Dict[int, int] = {0: 0}
+        images: List[PIL.Image.Image] = []
+        grid = array.array('I')
+        # Bottom row first, as OpenGL wants it
+        for row in reversed(layer.layer_data):
+            for item in row:
+                slot = slots.get(item)
+                if slot is None:
+                    my_sprite = _create_tile_layer_sprite(map_object, layer, item, prototypes, 1,
+                                                          base_directory, "None", 4.5)
+                    if my_sprite is None or my_sprite.texture is None:
+                        slot = 0
+                    else:
+                        image = my_sprite.texture.image
+                        if image.size != (self.tile_width, self.tile_height):
+                            raise ValueError(f"Tile {item} in layer '{layer_name}' is {image.size[0]}x"
+                                             f"{image.size[1]}, but the map's tiles are "
+                                             f"{self.tile_width}x{self.tile_height}. "
+                                             f"Use process_layer for this layer.")
+                        images.append(image)
+                        slot = len(images)
+                    slots[item] = slot
+                grid.append(slot)
+        self._grid_data = grid
+
+        self._atlas_columns = max(math.ceil(math.sqrt(len(images))), 1)
+        atlas_rows = max(math.ceil(len(images) / self._atlas_columns), 1)
+        atlas = PIL.Image.new("RGBA", (self._atlas_columns * self.tile_width, atlas_rows * self.tile_height))
+        for index, image in enumerate(images):
+            atlas.paste(image.convert("RGBA"), ((index % self._atlas_columns) * self.tile_width,
+                                                (index // self._atlas_columns) * self.tile_height))
+        self._atlas_image = atlas.transpose(PIL.Image.FLIP_TOP_BOTTOM)
+
+        self.ctx = None
+        self._program = None
+        self._grid_texture = None
+        self._atlas_texture = None
+        self._quad = None
+
+    def draw(self):
+        """ Draw the layer, in the current projection of the window. """
+        if self.ctx is None:
+            from arcade import get_window
+            from arcade.gl import geometry
+
+            self.ctx = get_window().ctx
+            self._program = self.ctx.load_program(
+                vertex_shader=":resources:shaders/texture_default_projection_vs.glsl",
+                fragment_shader=":resources:shaders/tilemap/tile_layer_fs.glsl",
+            )
+            self._grid_texture = self.ctx.texture((self.columns, self.rows), components=1,
+                                                  dtype="u4", data=self._grid_data)
+            self._atlas_texture = self.ctx.texture(self._atlas_image.size, components=4,
+                                                   data=self._atlas_image.tobytes())
+            self._quad = geometry.quad_2d_fs()
+
+        if not self.columns or not self.rows:
+            return
+
+        self.ctx.enable(self.ctx.BLEND)
+        self.ctx.blend_func = self.ctx.BLEND_DEFAULT
+
+        self._grid_texture.use(0)
+        self._atlas_texture.use(1)
+        self._program['grid'] = 0
+        self._program['atlas'] = 1
+        self._program['atlas_columns'] = self._atlas_columns
+        self._program['tile_size'] = self.tile_width, self.tile_height
+        self._program['world_tile_size'] = self.tile_width * self.scaling, self.tile_height * self.scaling
+        self._program['projection'] = self.ctx.projection_2d
+        self._program['alpha'] = self.alpha
+        self._quad.render(self._program)
 
 
 def process_layer(map_object: pytiled_parser.objects.TileMap,
@@ -559,3 +1056,53 @@ def process_layer(map_object: pytiled_parser.objects.TileMap,
 
     print(f"Warning, layer '{layer_name}' has unexpected type. '{type(layer)}'")
     return SpriteList()
+
+
+def create_occupancy_grid(map_object: pytiled_parser.objects.TileMap,
+                          layer_name: str,
+                          scaling: float = 1,
+                          base_directory: str = "",
+                          hit_box_algorithm="Simple",
+                          hit_box_detail: float = 4.5) -> OccupancyGrid:
+    """
+    Make an :class:`OccupancyGrid` of a tile layer, for fast collision checks
+    and queries against walls. The grid lines up with the sprites
+    :func:`process_layer` makes for the same layer, so use those for drawing
+    and the grid for collisions.
+
+    For a sprite list with the solid tiles merged into large rectangles, use
+    :meth:`OccupancyGrid.create_collision_list` on the grid.
+
+    :param map_object: The TileMap read in by read_tmx.
+    :param str layer_name: Name of the tile layer.
+    :param float scaling: Scaling the layer up or down.
+    :param str base_directory: Base directory of the file, that we start from to load images.
+    :param str hit_box_algorithm: One of 'None', 'Simple' or 'Detailed'.
+    :param float hit_box_detail: Used with 'Detailed' to hit box.
+
+    :returns: An OccupancyGrid.
+    """
+    layer = get_tilemap_layer(map_object, layer_name)
+    if not isinstance(layer, pytiled_parser.objects.TileLayer) or map_object.infinite:
+        raise ValueError(f"'{layer_name}' is not a tile layer of a finite map.")
+
+    if len(base_directory) > 0 and not base_directory.endswith("/"):
+        base_directory += "/"
+
+    tile_width = map_object.tile_size[0] * scaling
+    tile_height = map_object.tile_size[1] * scaling
+
+    # One sprite per GID to get its hit box, measured from the center of the cell
+    prototypes: Dict[int, _TilePrototype] = {}
+    hit_boxes = {}
+    for gid in {item for row in layer.layer_data for item in row if item}:
+        my_sprite = _create_tile_layer_sprite(map_object, layer, gid, prototypes, scaling,
+                                              base_directory, hit_box_algorithm, hit_box_detail)
+        if my_sprite is not None:
+            my_sprite.center_x = (my_sprite.width - tile_width) / 2
+            my_sprite.center_y = (my_sprite.height - tile_height) / 2
+            hit_boxes[gid] = my_sprite.get_adjusted_hit_box()
+
+    # Tiled lists rows top to bottom, the grid bottom to top
+    gids = [[item if item in hit_boxes else 0 for item in row] for row in reversed(layer.layer_data)]
+    return OccupancyGrid(gids, tile_width, tile_height, hit_boxes)
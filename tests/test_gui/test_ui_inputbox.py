@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from arcade.gui import UIEvent, TEXT_INPUT, TEXT_MOTION
@@ -198,3 +200,57 @@ def test_cursor_index_always_greater_equals_0(mock_mng):
     inputbox.cursor_index = -1
 
     assert inputbox.cursor_index == 0
+
+
+def test_keystroke_only_updates_glyphs_behind_cursor(mock_mng):
+    inputbox = UIInputBox(center_x=100, center_y=30, width=200, height=40)
+    inputbox.text = 'Best Game Lib!'
+    inputbox.cursor_index = 5
+    inputbox.on_focus()
+    mock_mng.add_ui_element(inputbox)
+
+    glyphs_before = [(sprite, sprite.texture, sprite.position) for sprite in inputbox._glyphs[1:6]]
+
+    inputbox.on_ui_event(UIEvent(TEXT_INPUT, text='a'))
+
+    glyphs_after = [(sprite, sprite.texture, sprite.position) for sprite in inputbox._glyphs[1:6]]
+    assert glyphs_before == glyphs_after
+    assert inputbox._glyph_count == len('Best aGame Lib!')
+    # both 'a' use the same cached glyph
+    assert inputbox._glyphs[6].texture is inputbox._glyphs[8].texture
+
+
+def test_cursor_blink_does_not_render_text(mock_mng):
+    inputbox = UIInputBox(center_x=100, center_y=30, width=200, height=40)
+    inputbox.text = 'Best Game Lib!'
+    inputbox.on_focus()
+    mock_mng.add_ui_element(inputbox)
+
+    with patch('arcade.gui.elements.inputbox.render_glyph_image') as render_glyph_image:
+        alphas = set()
+        for _ in range(4):
+            inputbox.on_update(UIInputBox.CURSOR_BLINK_INTERVAL)
+            alphas.add(inputbox._cursor.alpha)
+
+    render_glyph_image.assert_not_called()
+    assert alphas == {0, 255}
+
+
+def test_fits_box_to_text_without_width(mock_mng):
+    inputbox = UIInputBox(center_x=100, center_y=100, text='hello')
+    mock_mng.add_ui_element(inputbox)
+
+    width = inputbox.width
+    assert width > 0
+    assert inputbox.texture.width == width
+    assert all(sprite.alpha == 255 for sprite in inputbox._glyphs[1:6])
+
+    inputbox.on_focus()
+    inputbox.on_ui_event(UIEvent(TEXT_INPUT, text='W'))
+
+    assert inputbox.text == 'helloW'
+    assert inputbox.width > width
+    assert inputbox.texture.width == inputbox.width
+    assert all(sprite.alpha == 255 for sprite in inputbox._glyphs[1:7])
+
+    assert UIInputBox(center_x=100, center_y=100).width > 0
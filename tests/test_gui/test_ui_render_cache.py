@@ -0,0 +1,69 @@
+import PIL.Image
+
+import arcade
+from arcade.gui import UIFlatButton, UILabel
+from arcade.gui.ui_style import UIStyle
+from arcade.gui.utils import get_cached_texture, cleanup_ui_texture_cache
+
+
+def test_identical_flat_buttons_share_textures():
+    style = UIStyle({'flatbutton': {'font_color': arcade.color.RED}})
+    button_1 = UIFlatButton('Love snakes.', 100, 100, 100, 30, style=style)
+    button_2 = UIFlatButton('Love snakes.', 200, 100, 100, 30, style=style)
+
+    assert button_1.normal_texture is button_2.normal_texture
+    assert button_1.press_texture is button_2.press_texture
+
+
+def test_flat_buttons_with_different_text_do_not_share_textures():
+    style = UIStyle({})
+    button_1 = UIFlatButton('Love snakes.', 100, 100, 100, 30, style=style)
+    button_2 = UIFlatButton('Love pythons.', 200, 100, 100, 30, style=style)
+
+    assert button_1.normal_texture is not button_2.normal_texture
+
+
+def test_restyled_element_gets_new_texture():
+    style = UIStyle({})
+    button_1 = UIFlatButton('Love snakes.', 100, 100, 100, 30, style=style)
+    button_2 = UIFlatButton('Love snakes.', 200, 100, 100, 30, style=style)
+
+    button_1.set_style_attrs(font_color=arcade.color.BLUE)
+
+    assert button_1.normal_texture is not button_2.normal_texture
+    assert button_1.texture == button_1.normal_texture
+
+
+def test_labels_share_textures():
+    style = UIStyle({})
+    label_1 = UILabel('Snakes everywhere', style=style)
+    label_2 = UILabel('Snakes everywhere', style=style)
+
+    assert label_1.normal_texture is label_2.normal_texture
+
+
+def test_cached_texture_renders_once():
+    cleanup_ui_texture_cache()
+    calls = []
+
+    def render():
+        calls.append(1)
+        return PIL.Image.new('RGBA', (4, 4))
+
+    texture_1 = get_cached_texture('some key', render)
+    texture_2 = get_cached_texture('some key', render)
+
+    assert texture_1 is texture_2
+    assert len(calls) == 1
+
+
+def test_style_resolution_is_memoized_and_invalidated():
+    style = UIStyle({'globals': {'font_size': 10}, 'flatbutton': {'font_size': 12}})
+
+    resolved = style.resolve(['globals', 'flatbutton'])
+    assert resolved['font_size'] == 12
+    assert style.resolve(['globals', 'flatbutton']) is resolved
+
+    style.set_class_attrs('flatbutton', font_size=20)
+
+    assert style.get_attr(['globals', 'flatbutton'], 'font_size') == 20
@@ -0,0 +1,29 @@
+import arcade
+
+COIN = ":resources:images/items/coinGold.png"
+GRASS = ":resources:images/tiles/grassMid.png"
+SPRITESHEET = ":resources:images/spritesheets/codepage_437.png"
+
+
+def test_asset_bundle(tmp_path):
+    bundle_path = tmp_path / "sprites.bundle"
+    characters = arcade.load_spritesheet(SPRITESHEET, 9, 16, 32, 64)
+    arcade.pack_asset_bundle([COIN, GRASS] + characters, bundle_path, page_size=256)
+
+    bundle = arcade.load_asset_bundle(bundle_path)
+    assert len(bundle.names) == 66
+    assert len(bundle.pages) > 1
+
+    coin = bundle.get_texture(COIN)
+    original = arcade.load_texture(COIN)
+    assert coin.image.tobytes() == original.image.tobytes()
+    assert coin.hit_box_points == tuple(original.hit_box_points)
+    assert bundle.get_texture(COIN) is coin
+
+    page, x, y, width, height = bundle.get_region(characters[3].name)
+    assert (width, height) == (9, 16)
+    assert bundle.pages[page].crop((x, y, x + width, y + height)).tobytes() == characters[3].image.tobytes()
+
+    textures = bundle.get_textures()
+    bundle.close()
+    assert textures[1].image.tobytes() == arcade.load_texture(GRASS).image.tobytes()
@@ -0,0 +1,215 @@
+import math
+
+import numpy as np
+
+import arcade
+
+
+def path_cost(path, cost_grid):
+    cost = 0
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert max(abs(x2 - x1), abs(y2 - y1)) == 1
+        step = 1 if x1 == x2 or y1 == y2 else math.sqrt(2)
+        cost += cost_grid[y2, x2] * step
+    return cost
+
+
+def test_astar_grid_path():
+    cost_grid = np.ones((5, 6))
+    # Wall across x = 2, with a gap at the top
+    cost_grid[0:4, 2] = np.inf
+
+    path = arcade.astar_grid_path((0, 0), (5, 0), cost_grid)
+    assert path[0] == (0, 0) and path[-1] == (5, 0)
+    assert all(np.isfinite(cost_grid[y, x]) for x, y in path)
+    # No cutting past the end of the wall
+    gap = path.index((2, 4))
+    assert path[gap - 1] == (1, 4) and path[gap + 1] == (3, 4)
+
+    path = arcade.astar_grid_path((0, 0), (5, 0), cost_grid, diagonal_movement=False, heuristic="manhattan")
+    assert len(path) == 14
+
+    assert arcade.astar_grid_path((0, 0), (5, 0), cost_grid, max_iterations=5) is None
+
+    cost_grid[4, 2] = np.inf
+    assert arcade.astar_grid_path((0, 0), (5, 0), cost_grid) is None
+
+
+def test_weighted_cells():
+    cost_grid = np.ones((3, 5))
+    cost_grid[1, 1:4] = 10
+
+    path = arcade.astar_grid_path((0, 1), (4, 1), cost_grid)
+    assert path_cost(path, cost_grid) < 10
+
+
+def test_jump_point_search_finds_shortest_paths():
+    random_state = np.random.RandomState(5)
+    for _ in range(50):
+        cost_grid = np.where(random_state.rand(20, 20) < 0.3, np.inf, 1.0)
+        cost_grid[0, 0] = cost_grid[19, 19] = 1
+
+        path = arcade.astar_grid_path((0, 0), (19, 19), cost_grid)
+        jps_path = arcade.astar_grid_path((0, 0), (19, 19), cost_grid, jump_point_search=True)
+        if path is None:
+            assert jps_path is None
+        else:
+            assert jps_path[0] == (0, 0) and jps_path[-1] == (19, 19)
+            assert abs(path_cost(path, cost_grid) - path_cost(jps_path, cost_grid)) < 1e-6
+
+
+def test_cost_grid_from_barrier_list():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    wall = arcade.SpriteSolidColor(32, 32, arcade.color.BLACK)
+    wall.position = 64, 32
+    wall_list.append(wall)
+    mover = arcade.SpriteSolidColor(30, 30, arcade.color.RED)
+
+    barrier_list = arcade.AStarBarrierList(mover, wall_list, 32, -32, 128, 0, 64)
+    cost_grid = barrier_list.get_cost_grid()
+
+    assert cost_grid.shape == (3, 6)
+    assert cost_grid[1, 3] == np.inf
+    assert np.isfinite(cost_grid).sum() == 17
+
+
+def blocked_cells(barrier_list):
+    """ Barriers worked out the slow way, by moving the sprite to every cell. """
+    mover = barrier_list.moving_sprite
+    original_position = mover.position
+    blocked = []
+    for cx in range(barrier_list.left, barrier_list.right + 1):
+        for cy in range(barrier_list.bottom, barrier_list.top + 1):
+            mover.position = cx * barrier_list.grid_size, cy * barrier_list.grid_size
+            if arcade.check_for_collision_with_list(mover, barrier_list.blocking_sprites):
+                blocked.append((cx, cy))
+    mover.position = original_position
+    return sorted(blocked)
+
+
+def test_barrier_rasterization_and_region_updates():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for x, y, angle in (0, 0, 0), (100, 40, 45), (250, 200, 30), (32, 160, 0):
+        wall = arcade.Sprite(":resources:images/tiles/boxCrate_double.png", 0.3)
+        wall.position = x, y
+        wall.angle = angle
+        wall_list.append(wall)
+    mover = arcade.Sprite(":resources:images/animated_characters/zombie/zombie_idle.png", 0.25)
+    mover.position = 500, 500
+
+    barrier_list = arcade.AStarBarrierList(mover, wall_list, 16, -64, 320, -64, 320)
+    assert barrier_list.barrier_list == blocked_cells(barrier_list)
+    assert barrier_list.barrier_mask.sum() == len(barrier_list.barrier_list)
+
+    # Open a door and move a wall
+    door = wall_list[3]
+    door_rect = door.left, door.bottom, door.width, door.height
+    wall_list.remove(door)
+    barrier_list.update_region(door_rect)
+    assert barrier_list.barrier_list == blocked_cells(barrier_list)
+
+    wall = wall_list[0]
+    wall.center_x += 40
+    barrier_list.update_region((wall.left - 40, wall.bottom, wall.width + 40, wall.height))
+    assert barrier_list.barrier_list == blocked_cells(barrier_list)
+
+
+def test_flow_field():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for y in range(0, 160, 16):
+        wall = arcade.SpriteSolidColor(16, 16, arcade.color.BLACK)
+        wall.position = 80, y
+        wall_list.append(wall)
+    mover = arcade.SpriteSolidColor(14, 14, arcade.color.RED)
+    barrier_list = arcade.AStarBarrierList(mover, wall_list, 16, 0, 192, 0, 192)
+    cost_grid = barrier_list.get_cost_grid()
+
+    field = arcade.flow_field_calculate((16, 16), barrier_list)
+    assert arcade.flow_field_calculate((20, 20), barrier_list) is field
+    assert field.get_direction((16, 16)) == (0, 0)
+    assert field.get_direction((1000, 1000)) == (0, 0)
+
+    for start in (160, 16), (176, 176), (32, 192):
+        path = arcade.astar_grid_path((start[0] // 16, start[1] // 16), (1, 1), cost_grid)
+        assert abs(field.get_distance(start) - path_cost(path, cost_grid)) < 1e-6
+
+        # Following the field gets to the goal along a shortest path
+        position = start
+        for _ in range(len(path) - 1):
+            step_x, step_y = field.get_direction(position)
+            position = position[0] + step_x * 16, position[1] + step_y * 16
+        assert (position[0] // 16, position[1] // 16) == (1, 1)
+
+    # Two goals: each cell heads for the closer one
+    two_goal_field = arcade.flow_field_calculate([(16, 16), (176, 16)], barrier_list)
+    assert two_goal_field.get_direction((160, 16)) == (1, 0)
+
+    # New barriers give new fields
+    wall_list.remove(wall_list[-1])
+    barrier_list.update_region((72, 136, 16, 16))
+    assert arcade.flow_field_calculate((16, 16), barrier_list) is not field
+
+
+def test_hierarchical_pathfinder():
+    random_state = np.random.RandomState(4)
+    cost_grid = np.where(random_state.rand(60, 60) < 0.25, np.inf, 1.0)
+    cost_grid[0, 0] = cost_grid[59, 59] = 1
+    pathfinder = arcade.HierarchicalPathfinder(cost_grid, cluster_size=8)
+
+    path = pathfinder.find_path((0, 0), (59, 59))
+    shortest = arcade.astar_grid_path((0, 0), (59, 59), cost_grid)
+    assert path[0] == (0, 0) and path[-1] == (59, 59)
+    assert path_cost(path, cost_grid) < path_cost(shortest, cost_grid) * 1.2
+    assert pathfinder.find_path((0, 0), (0, 0)) == [(0, 0)]
+
+    # Wall off the goal
+    new_grid = cost_grid.copy()
+    new_grid[57:, 57] = np.inf
+    new_grid[57, 57:] = np.inf
+    pathfinder.update_region(57, 57, 3, 3, new_grid)
+    assert pathfinder.find_path((0, 0), (59, 59)) is None
+
+    rebuilt = arcade.HierarchicalPathfinder(new_grid, cluster_size=8)
+    assert pathfinder._cluster_nodes == rebuilt._cluster_nodes
+
+
+def test_path_request_queue():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for y in range(0, 160, 16):
+        wall = arcade.SpriteSolidColor(16, 16, arcade.color.BLACK)
+        wall.position = 80, y
+        wall_list.append(wall)
+    mover = arcade.SpriteSolidColor(14, 14, arcade.color.RED)
+    barrier_list = arcade.AStarBarrierList(mover, wall_list, 16, 0, 192, 0, 192)
+
+    path_queue = arcade.PathRequestQueue(barrier_list, workers=1)
+    try:
+        done = []
+        stale = path_queue.submit((16, 16), (16, 32), key="enemy")
+        request = path_queue.submit((16, 16), (160, 16), key="enemy", on_done=done.append)
+        other = path_queue.submit((16, 16), (48, 16))
+        assert stale.cancelled
+
+        finished = []
+        while path_queue.pending:
+            finished += path_queue.update(max_results=1)
+        assert set(finished) == {request, other}
+        assert done == [request]
+        assert request.path[0] == (16, 16) and request.path[-1] == (160, 16)
+        # Through the gap at the top of the wall
+        assert (80, 160) in request.path
+        assert not stale.done and stale.path is None
+
+        # Close the gap in the wall
+        for y in range(160, 208, 16):
+            wall = arcade.SpriteSolidColor(16, 16, arcade.color.BLACK)
+            wall.position = 80, y
+            wall_list.append(wall)
+        barrier_list.update_region((72, 152, 16, 48))
+        path_queue.update_barriers(barrier_list)
+        request = path_queue.submit((16, 16), (160, 16))
+        while not request.done:
+            path_queue.update()
+        assert request.path is None
+    finally:
+        path_queue.close()
@@ -0,0 +1,11 @@
+import arcade
+
+
+def test_polygon_penetration():
+    square = ((0, 0), (10, 0), (10, 10), (0, 10))
+    assert arcade.get_polygon_penetration(square, ((10, 0), (20, 0), (20, 10), (10, 10))) is None
+    push_x, push_y = arcade.get_polygon_penetration(square, ((7, 2), (20, 2), (20, 8), (7, 8)))
+    assert abs(push_x + 3) < 1e-9 and abs(push_y) < 1e-9
+    push_x, push_y = arcade.get_polygon_penetration(((0, 0), (4, 0), (4, 4), (0, 4)),
+                                                    ((-10, -10), (10, -10), (10, 10)))
+    assert abs(push_x + 2) < 1e-9 and abs(push_y - 2) < 1e-9
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+import PIL.Image
+import PIL.ImageDraw
+
+import arcade
+
+
+def make_image():
+    image = PIL.Image.new("RGBA", (32, 32))
+    draw = PIL.ImageDraw.Draw(image)
+    draw.ellipse((4, 4, 28, 28), fill=(255, 0, 0, 255))
+    return image
+
+
+def test_hit_box_disk_cache(tmp_path):
+    arcade.set_hit_box_cache_dir(tmp_path)
+    try:
+        points = arcade.Texture("first", make_image()).hit_box_points
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        # Same image content, so the hit box comes from disk
+        with patch("arcade.texture.calculate_hit_box_points_simple") as calculate:
+            cached_points = arcade.Texture("second", make_image()).hit_box_points
+        calculate.assert_not_called()
+        assert cached_points == tuple(points)
+
+        # Another algorithm is another entry
+        arcade.Texture("third", make_image(), hit_box_algorithm="Detailed").hit_box_points
+        assert len(list(tmp_path.glob("*.json"))) == 2
+    finally:
+        arcade.set_hit_box_cache_dir(None)
+
+
+def test_simple_hit_box():
+    image = PIL.Image.new("RGBA", (32, 32))
+    PIL.ImageDraw.Draw(image).rectangle((4, 6, 27, 25), fill=(255, 0, 0, 255))
+
+    points = arcade.calculate_hit_box_points_simple(image)
+    assert points == ((-12.0, -10.0), (12.0, -10.0), (12.0, 10.0), (-12.0, 10.0))
@@ -39,3 +39,52 @@ def test_line_of_sight():
 
     result = arcade.has_line_of_sight(player.position, enemy.position, wall_list)
     assert result
+
+
+def test_cast_ray():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for x in range(200, 1000, 200):
+        # Too thin for the old sampled check to be sure of hitting
+        wall = arcade.SpriteSolidColor(1, 64, arcade.color.BLACK)
+        wall.position = x + 0.5, 100
+        wall_list.append(wall)
+
+    hit_x, hit_y = arcade.cast_ray((50, 100), (950, 100), wall_list)
+    assert abs(hit_x - 200) < 1e-6 and hit_y == 100
+    hit_x, hit_y = arcade.cast_ray((950, 100), (50, 100), wall_list)
+    assert abs(hit_x - 801) < 1e-6 and hit_y == 100
+    assert arcade.cast_ray((50, 150), (950, 150), wall_list) is None
+    assert not arcade.has_line_of_sight((50, 101), (950, 99), wall_list)
+
+    # Without a spatial hash, and from negative coordinates
+    wall_list.disable_spatial_hashing()
+    hit_x, hit_y = arcade.cast_ray((-500, -200), (900, 400), wall_list)
+    assert abs(hit_x - 200) < 1e-6 and abs(hit_y - 100) < 1e-6
+    wall_list.enable_spatial_hashing(64)
+    hit_x, hit_y = arcade.cast_ray((-500, -200), (900, 400), wall_list)
+    assert abs(hit_x - 200) < 1e-6 and abs(hit_y - 100) < 1e-6
+
+
+def test_line_of_sight_many():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for position in (100, 100), (300, 300), (-100, 0):
+        wall = arcade.SpriteSolidColor(40, 40, arcade.color.BLACK)
+        wall.position = position
+        wall_list.append(wall)
+
+    pairs = [((0, 0), (200, 200)),
+             ((0, 100), (200, 100)),
+             ((0, 200), (200, 0)),
+             ((0, 50), (200, 50)),
+             ((-100, 0), (-300, 0)),
+             ((-200, -100), (-200, 100)),
+             ((0, 0), (10, 10))]
+    expected = [arcade.has_line_of_sight(start, end, wall_list) for start, end in pairs]
+    assert expected == [False, False, False, True, False, True, True]
+    assert arcade.has_line_of_sight_many(pairs, wall_list) == expected
+    assert arcade.has_line_of_sight_many(pairs, wall_list, max_distance=100) == \
+        [False, False, False, False, False, False, True]
+
+    wall_list.disable_spatial_hashing()
+    assert arcade.has_line_of_sight_many(pairs, wall_list) == expected
+    assert arcade.has_line_of_sight_many([], wall_list) == []
@@ -0,0 +1,41 @@
+import pytest
+import arcade
+
+GRASS = ":resources:images/tiles/grassMid.png"
+CRATE = ":resources:images/tiles/boxCrate.png"
+
+
+def test_load_texture_async():
+    arcade.cleanup_texture_cache()
+    texture = arcade.load_texture_async(GRASS, hit_box_algorithm="Detailed").result()
+
+    assert texture.image.mode == "RGBA"
+    assert texture.hit_box_points == arcade.load_texture(GRASS, hit_box_algorithm="Detailed").hit_box_points
+
+
+def test_load_texture_async_cache_hit():
+    arcade.cleanup_texture_cache()
+    texture = arcade.load_texture(GRASS)
+    future = arcade.load_texture_async(GRASS)
+
+    assert future.done()
+    assert future.result() is texture
+
+
+def test_preload_textures():
+    arcade.cleanup_texture_cache()
+    preload = arcade.preload_textures([GRASS, CRATE])
+    textures = preload.wait()
+
+    assert preload.done
+    assert preload.progress == 1.0
+    assert len(textures) == 2
+    # Preloaded textures are cached, so load_texture gets the same objects
+    assert arcade.load_texture(GRASS) is textures[0]
+    assert arcade.load_texture(CRATE) is textures[1]
+
+
+def test_preload_textures_error():
+    preload = arcade.preload_textures(["does_not_exist.png"])
+    with pytest.raises(FileNotFoundError):
+        preload.wait()
@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+
+import arcade
+
+
+def path_length(path):
+    return sum(math.hypot(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in zip(path, path[1:]))
+
+
+def test_outline():
+    # U shape, open at the top
+    navmesh = arcade.create_navmesh_from_outline([(0, 0), (300, 0), (300, 300), (200, 300),
+                                                   (200, 100), (100, 100), (100, 300), (0, 300)])
+    assert len(navmesh) == 6
+    assert navmesh.get_polygon_at((150, 200)) is None
+
+    path = navmesh.find_path((50, 250), (250, 250))
+    assert path == [(50, 250), (100, 100), (200, 100), (250, 250)]
+    assert navmesh.find_path((50, 250), (150, 200)) is None
+
+
+def test_rectangles_with_t_junctions():
+    # One wide rectangle below two narrow ones
+    navmesh = arcade.NavMesh([[(0, 0), (200, 0), (200, 100), (0, 100)],
+                              [(0, 100), (0, 200), (50, 200), (50, 100)],
+                              [(150, 100), (200, 100), (200, 200), (150, 200)]])
+    assert sorted(neighbour for neighbour, _, _ in navmesh.neighbours[0]) == [1, 2]
+    assert navmesh.find_polygon_path((25, 150), (175, 150)) == [1, 0, 2]
+    assert navmesh.find_path((25, 150), (175, 150)) == [(25, 150), (50, 100), (150, 100), (175, 150)]
+
+
+def test_walls():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for y in range(0, 400, 32):
+        wall = arcade.SpriteSolidColor(32, 32, arcade.color.BLACK)
+        wall.position = 320, y
+        wall_list.append(wall)
+    navmesh = arcade.create_navmesh(wall_list, 0, 640, 0, 640, 16, agent_radius=10)
+
+    path = navmesh.find_path((100, 100), (500, 100))
+    assert path[0] == (100, 100) and path[-1] == (500, 100)
+    # Around the top of the wall, far enough away to clear it
+    assert len(path) == 4
+    assert all(point[1] >= 384 + 16 + 10 for point in path[1:-1])
+    assert navmesh.get_polygon_at((320, 100)) is None
+
+
+def test_occupancy_grid():
+    random_state = np.random.RandomState(2)
+    gids = (random_state.rand(60, 60) < 0.15).astype(int)
+    gids[0, 0] = gids[59, 59] = 0
+    grid = arcade.OccupancyGrid(gids, 32, 32)
+    navmesh = arcade.create_navmesh_from_occupancy_grid(grid)
+    assert len(navmesh) < 60 * 60 / 2
+
+    end_point = 59 * 32 + 16, 59 * 32 + 16
+    path = navmesh.find_path((16, 16), end_point)
+    cell_path = arcade.astar_grid_path((0, 0), (59, 59), np.where(grid.solid, np.inf, 1.0))
+    assert path_length(path) <= path_length(cell_path) * 32
+    # Stays off the walls
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        for step in range(21):
+            x = x1 + (x2 - x1) * step / 20
+            y = y1 + (y2 - y1) * step / 20
+            assert navmesh.get_polygon_at((x, y)) is not None
+
+    # Walls grow by whole cells, which closes off the corners
+    assert arcade.create_navmesh_from_occupancy_grid(grid, agent_radius=10).get_polygon_at((16, 16)) is None
@@ -0,0 +1,105 @@
+import arcade
+
+MAP_NAME = ":resources:tmx_maps/map_with_ladders.tmx"
+SLOPE = ((-32, -32), (32, -32), (32, 32))
+
+
+def make_grid():
+    # Row 0 is the bottom row; GID 2 is a slope rising to the right
+    return arcade.OccupancyGrid([[1, 1, 1, 2],
+                                 [0, 0, 0, 0],
+                                 [0, 1, 0, 0]], 64, 64, {2: SLOPE})
+
+
+def test_point_queries():
+    grid = make_grid()
+
+    assert grid.get_cell(100, 150) == (1, 2)
+    assert grid.get_gid(3, 0) == 2
+    assert grid.get_gid(-1, 0) == 0
+    assert grid.is_solid_at(10, 10)
+    assert not grid.is_solid_at(10, 100)
+    assert grid.is_solid_at(100, 150)
+    # Below and above the slope
+    assert grid.is_solid_at(250, 5)
+    assert not grid.is_solid_at(200, 60)
+    assert not grid.is_solid_at(-10, 10)
+
+    grid.set_gid(1, 2, 0)
+    assert not grid.is_solid_at(100, 150)
+
+
+def test_box_queries():
+    grid = make_grid()
+
+    assert grid.overlaps_box(10, 50, 30, 70)
+    assert not grid.overlaps_box(10, 64, 120, 128)
+    assert not grid.overlaps_box(196, 40, 210, 60)
+    assert grid.overlaps_box(240, 40, 250, 60)
+
+
+def test_cast_ray():
+    grid = make_grid()
+
+    assert grid.cast_ray(0, 96, 256, 96) is None
+    hit_x, hit_y = grid.cast_ray(32, 96, 32, 0)
+    assert (hit_x, hit_y) == (32, 64)
+    hit_x, hit_y = grid.cast_ray(100, 100, 100, 300)
+    assert (hit_x, hit_y) == (100, 128)
+    # Comes down onto the slope
+    hit_x, hit_y = grid.cast_ray(240, 100, 240, 0)
+    assert hit_x == 240 and abs(hit_y - 48) < 0.001
+
+
+def test_grid_matches_sprite_list_in_platformer():
+    tmx_map = arcade.read_tmx(MAP_NAME)
+    wall_list = arcade.process_layer(tmx_map, "Platforms", 0.5)
+    wall_grid = arcade.create_occupancy_grid(tmx_map, "Platforms", 0.5)
+
+    positions = []
+    for walls in wall_list, wall_grid:
+        player = arcade.Sprite(":resources:images/animated_characters/female_person/femalePerson_idle.png", 0.4)
+        player.position = 300, 400
+        engine = arcade.PhysicsEnginePlatformer(player, walls, gravity_constant=0.5)
+        path = []
+        for frame in range(200):
+            player.change_x = 4 if frame < 120 else -6
+            if frame == 60 and engine.can_jump():
+                engine.jump(12)
+            engine.update()
+            path.append(player.position)
+        positions.append(path)
+
+    assert positions[0] == positions[1]
+
+
+def test_merged_rectangles():
+    grid = arcade.OccupancyGrid([[1, 1, 1, 2],
+                                 [1, 1, 0, 0],
+                                 [1, 1, 0, 1]], 64, 64, {2: SLOPE})
+
+    rectangles = sorted(tuple(rectangle) for rectangle in grid.get_merged_rectangles())
+    assert rectangles == [(0, 0, 192, 64), (0, 64, 128, 128), (192, 128, 64, 64)]
+
+    collision_list = grid.create_collision_list()
+    assert len(collision_list) == 4
+    assert collision_list[3].properties["gid"] == 2
+
+
+def test_merged_collision_list_matches_tiles_in_platformer():
+    tmx_map = arcade.read_tmx(MAP_NAME)
+    wall_list = arcade.process_layer(tmx_map, "Platforms", 0.5)
+    collision_list = arcade.create_occupancy_grid(tmx_map, "Platforms", 0.5).create_collision_list()
+    assert len(collision_list) < len(wall_list)
+
+    positions = []
+    for walls in wall_list, collision_list:
+        player = arcade.Sprite(":resources:images/animated_characters/female_person/femalePerson_idle.png", 0.4)
+        player.position = 300, 400
+        engine = arcade.PhysicsEnginePlatformer(player, walls, gravity_constant=0.5)
+        for frame in range(200):
+            player.change_x = 4 if frame < 120 else -6
+            engine.update()
+        positions.append(player.position)
+
+    assert positions[0] == positions[1]
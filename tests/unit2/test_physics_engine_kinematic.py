@@ -0,0 +1,80 @@
+import random
+
+import arcade
+
+
+def make_box(center_x, center_y, width, height):
+    box = arcade.SpriteSolidColor(width, height, arcade.color.BLACK)
+    box.position = center_x, center_y
+    return box
+
+
+def make_walls():
+    random.seed(3)
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    for x in range(0, 1024, 32):
+        for y in range(0, 1024, 32):
+            if x in (0, 992) or y in (0, 992) or random.random() < 0.1:
+                walls.append(make_box(x, y, 32, 32))
+    # A rotated wall, checked pair by pair
+    wall = make_box(500, 500, 100, 10)
+    wall.angle = 30
+    walls.append(wall)
+    return walls
+
+
+def make_movers(walls, count):
+    random.seed(4)
+    movers = arcade.SpriteList()
+    while len(movers) < count:
+        mover = make_box(random.uniform(40, 980), random.uniform(40, 980), 20, 20)
+        if not arcade.check_for_collision_with_list(mover, walls):
+            movers.append(mover)
+    return movers
+
+
+def set_speeds(movers, frame):
+    random.seed(frame)
+    for mover in movers:
+        mover.change_x = random.uniform(-40, 40)
+        mover.change_y = random.uniform(-40, 40)
+
+
+def test_matches_one_engine_per_sprite():
+    walls = make_walls()
+    movers = make_movers(walls, 60)
+    movers_2 = make_movers(walls, 60)
+
+    engine = arcade.PhysicsEngineKinematic(movers, walls)
+    engines = [arcade.PhysicsEngineSimple(mover, walls, continuous_collision=True) for mover in movers_2]
+    for frame in range(30):
+        set_speeds(movers, frame)
+        set_speeds(movers_2, frame)
+        hit_lists = engine.update()
+        hit_lists_2 = [single_engine.update() for single_engine in engines]
+
+        assert len(hit_lists) == len(movers)
+        for mover, mover_2, hits, hits_2 in zip(movers, movers_2, hit_lists, hit_lists_2):
+            assert abs(mover.center_x - mover_2.center_x) < 1e-6
+            assert abs(mover.center_y - mover_2.center_y) < 1e-6
+            assert sorted(walls.index(wall) for wall in hits) == sorted(walls.index(wall) for wall in hits_2)
+
+    for mover in movers:
+        assert not arcade.check_for_collision_with_list(mover, walls)
+
+
+def test_stuck_sprite_and_no_walls():
+    walls = arcade.SpriteList()
+    movers = arcade.SpriteList()
+    movers.append(make_box(100, 100, 20, 20))
+    engine = arcade.PhysicsEngineKinematic(movers, walls)
+    movers[0].change_x = 5
+    assert engine.update() == [[]]
+    assert movers[0].center_x == 105
+
+    # Starting inside a wall, it gets pushed out like with PhysicsEngineSimple
+    walls.append(make_box(110, 100, 40, 40))
+    engine.update_walls()
+    engine.update()
+    assert not arcade.check_for_collision_with_list(movers[0], walls)
+    assert abs(movers[0].right - 90) < 0.01
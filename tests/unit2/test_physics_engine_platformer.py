@@ -61,3 +61,65 @@ def test_main():
     window.test()
     multi_jump(window)
     window.close()
+
+
+def test_moving_platforms():
+    platforms = arcade.SpriteList(use_spatial_hash=True)
+    for x in range(0, 640, 64):
+        floor = arcade.SpriteSolidColor(64, 64, arcade.color.BLACK)
+        floor.position = x, 0
+        platforms.append(floor)
+    moving = arcade.SpriteSolidColor(128, 16, arcade.color.BLACK)
+    moving.position = 200, 200
+    moving.change_x = 3
+    moving.boundary_left = 100
+    moving.boundary_right = 300
+    platforms.append(moving)
+
+    player = arcade.SpriteSolidColor(20, 20, arcade.color.RED)
+    player.position = 200, 219
+    engine = arcade.PhysicsEnginePlatformer(player, platforms, gravity_constant=0.5)
+    assert engine.moving_platforms == [moving]
+
+    for _ in range(20):
+        engine.update()
+    # Turned around at the right boundary, carrying the player
+    assert moving.right == 300 - 8 * 3
+    assert moving.change_x == -3
+    assert player.center_x > 205 and abs(player.center_x - moving.center_x) < 4
+    assert player.bottom >= moving.top
+
+    # Platforms that start moving later have to be added
+    floor = platforms[0]
+    floor.change_y = 1
+    engine.add_moving_platform(floor)
+    engine.update()
+    assert floor.center_y == 1
+    engine.remove_moving_platform(floor)
+    engine.update()
+    assert floor.center_y == 1
+
+    # Platforms appended later are found, removed ones are dropped
+    lift = arcade.SpriteSolidColor(64, 16, arcade.color.BLACK)
+    lift.position = 500, 300
+    lift.change_y = 2
+    platforms.append(lift)
+    engine.update()
+    assert lift.center_y == 302
+    assert engine.moving_platforms == [moving, lift]
+
+    moving.remove_from_sprite_lists()
+    position = moving.position
+    engine.update()
+    assert moving.position == position
+    assert engine.moving_platforms == [lift]
+
+    # Swapping a platform for another in the same frame is seen too
+    lift.remove_from_sprite_lists()
+    slider = arcade.SpriteSolidColor(64, 16, arcade.color.BLACK)
+    slider.position = 400, 300
+    slider.change_x = -2
+    platforms.append(slider)
+    engine.update()
+    assert slider.center_x == 398
+    assert engine.moving_platforms == [slider]
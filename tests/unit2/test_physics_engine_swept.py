@@ -0,0 +1,94 @@
+import arcade
+
+
+def make_box(center_x, center_y, width, height):
+    box = arcade.SpriteSolidColor(width, height, arcade.color.BLACK)
+    box.position = center_x, center_y
+    return box
+
+
+def test_fast_fall_stops_on_thin_platform():
+    for use_spatial_hash in True, False:
+        platforms = arcade.SpriteList(use_spatial_hash=use_spatial_hash)
+        platforms.append(make_box(100, 100, 200, 4))
+        player = make_box(100, 200, 20, 20)
+        engine = arcade.PhysicsEnginePlatformer(player, platforms, gravity_constant=0.5, continuous_collision=True)
+
+        player.change_y = -150
+        hit_list = engine.update()
+        assert hit_list == [platforms[0]]
+        assert 0 < player.bottom - 102 < 0.01
+        assert player.change_y == 0
+        assert engine.can_jump()
+
+        # Without sweeping, it drops straight through
+        player.position = 100, 200
+        player.change_y = -150
+        engine.continuous_collision = False
+        engine.update()
+        assert player.top < 98
+
+
+def test_fast_move_stops_at_thin_wall():
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    walls.append(make_box(300, 100, 4, 200))
+    player = make_box(100, 100, 20, 20)
+    engine = arcade.PhysicsEngineSimple(player, walls, continuous_collision=True)
+
+    player.change_x = 500
+    assert engine.update() == [walls[0]]
+    assert 0 < 298 - player.right < 0.01
+    assert player.center_y == 100
+
+
+def test_walk_up_ramp():
+    platforms = arcade.SpriteList(use_spatial_hash=True)
+    platforms.append(make_box(0, -50, 400, 100))
+    ramp = arcade.Sprite(center_x=250, center_y=50)
+    ramp.set_hit_box(((-50, -50), (50, -50), (50, 50)))
+    platforms.append(ramp)
+    player = make_box(100, 11, 20, 20)
+    engine = arcade.PhysicsEnginePlatformer(player, platforms, gravity_constant=0.5, continuous_collision=True)
+
+    for _ in range(40):
+        player.change_x = 4
+        engine.update()
+    # Up the 45 degree slope, standing on it
+    assert player.center_x > 240
+    assert player.bottom > 50
+    assert abs(player.right - 200 - player.bottom) < 1
+    assert not arcade.check_for_collision_with_list(player, platforms)
+
+
+def test_matches_stepping_on_tile_map():
+    tmx_map = arcade.read_tmx(":resources:tmx_maps/map_with_ladders.tmx")
+    wall_list = arcade.process_layer(tmx_map, "Platforms", 0.5, use_spatial_hash=True)
+    wall_grid = arcade.create_occupancy_grid(tmx_map, "Platforms", 0.5)
+
+    positions = []
+    for walls, continuous_collision in (wall_list, False), (wall_list, True), (wall_grid, True):
+        player = arcade.Sprite(":resources:images/animated_characters/female_person/femalePerson_idle.png", 0.4)
+        player.position = 300, 400
+        engine = arcade.PhysicsEnginePlatformer(player, walls, gravity_constant=0.5,
+                                                continuous_collision=continuous_collision)
+        for frame in range(200):
+            player.change_x = 4 if frame < 120 else -6
+            engine.update()
+        positions.append(player.position)
+
+    for x, y in positions[1:]:
+        assert abs(x - positions[0][0]) < 1 and abs(y - positions[0][1]) < 1
+
+
+def test_overlap_pushed_out_in_one_step():
+    for continuous_collision in False, True:
+        platforms = arcade.SpriteList(use_spatial_hash=True)
+        platforms.append(make_box(100, 50, 200, 100))
+        player = make_box(100, 105, 20, 20)
+        engine = arcade.PhysicsEnginePlatformer(player, platforms, gravity_constant=0.5,
+                                                continuous_collision=continuous_collision)
+
+        hit_list = engine.update()
+        assert hit_list == [platforms[0]]
+        assert player.center_x == 100
+        assert 0 <= player.bottom - 100 < 1
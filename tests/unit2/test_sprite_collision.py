@@ -34,6 +34,24 @@ def test_sprites_at_point():
     assert len(sprite_list) == 1
 
 
+def test_sprites_at_points():
+    for use_spatial_hash in True, False:
+        coin_list = arcade.SpriteList(use_spatial_hash=use_spatial_hash)
+        for position in (0, 0), (20, 0), (-200, 130):
+            sprite = arcade.SpriteSolidColor(50, 50, arcade.csscolor.RED)
+            sprite.position = position
+            coin_list.append(sprite)
+        coin_list[2].angle = 45
+
+        points = [(0, 0), (10, 10), (40, 0), (100, 100), (-200, 163), (-200, 170), (-166, 130)]
+        hits = arcade.get_sprites_at_points(points, coin_list)
+        assert hits == [[0, 1], [0, 1], [1], [], [2], [], [2]]
+        for point, point_hits in zip(points, hits):
+            assert [coin_list[i] for i in point_hits] == arcade.get_sprites_at_point(point, coin_list)
+
+    assert arcade.get_sprites_at_points([], coin_list) == []
+
+
 def test_sprite_collides_with_point():
     sprite = arcade.Sprite(center_x=0, center_y=0)
     sprite.width = 2
@@ -56,3 +56,38 @@ def test_it_can_pop_at_a_given_index():
     assert spritelist._vao1 is None
 
 
+def test_nearest_sprite_queries():
+    spritelist = make_named_sprites(50)
+    for sprite in spritelist:
+        sprite.position = (sprite.name % 10) * 100, (sprite.name // 10) * 100
+
+    target = arcade.Sprite()
+    target.position = 310, 220
+    closest, distance = arcade.get_closest_sprite(target, spritelist)
+    assert closest.name == 23
+    assert abs(distance - arcade.get_distance_between_sprites(target, closest)) < 1e-9
+
+    nearest = arcade.get_k_nearest_sprites(target, spritelist, 4)
+    assert [sprite.name for sprite, _ in nearest] == [23, 33, 24, 22]
+    assert [distance for _, distance in nearest] == sorted(distance for _, distance in nearest)
+    assert len(arcade.get_k_nearest_sprites(target, spritelist, 100)) == 50
+
+    in_radius = arcade.get_sprites_in_radius((300, 200), spritelist, 100)
+    assert [sprite.name for sprite in in_radius[:1]] == [23]
+    assert sorted(sprite.name for sprite in in_radius) == [13, 22, 23, 24, 33]
+    assert arcade.get_sprites_in_radius((5000, 5000), spritelist, 100) == []
+
+    # The index is kept between queries, and dropped when a sprite moves
+    index = spritelist._get_position_index()
+    arcade.get_closest_sprite(target, spritelist)
+    assert spritelist._get_position_index() is index
+    spritelist[0].position = 320, 230
+    assert arcade.get_closest_sprite(target, spritelist)[0].name == 0
+
+    # Ties go to the earlier sprite, so reordering drops the index too
+    spritelist[1].position = spritelist[0].position
+    assert arcade.get_closest_sprite(target, spritelist)[0].name == 0
+    spritelist.reverse()
+    assert arcade.get_closest_sprite(target, spritelist)[0].name == 1
+
+    assert arcade.get_closest_sprite(target, arcade.SpriteList()) is None
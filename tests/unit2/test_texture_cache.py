@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import PIL.Image
+import arcade
+
+GRASS = ":resources:images/tiles/grassMid.png"
+
+
+def make_texture(name, size=8):
+    return arcade.Texture(name, PIL.Image.new("RGBA", (size, size)))
+
+
+def test_stats():
+    cache = arcade.TextureCache()
+    texture = make_texture("a")
+    cache.put("a", texture)
+
+    assert cache.get("a") is texture
+    assert cache.get("b") is None
+    assert cache.stats == {'hits': 1, 'misses': 1, 'bytes': 8 * 8 * 4, 'evictions': 0, 'entries': 1}
+
+
+def test_evicts_least_recently_used():
+    cache = arcade.TextureCache(max_bytes=2 * 8 * 8 * 4)
+    cache.put("a", make_texture("a"))
+    cache.put("b", make_texture("b"))
+    cache.get("a")
+    cache.put("c", make_texture("c"))
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.evictions == 1
+    assert cache.bytes == 2 * 8 * 8 * 4
+
+
+def test_referenced_and_pinned_entries_are_kept():
+    cache = arcade.TextureCache(max_bytes=0)
+    texture = make_texture("a")
+    cache.put("a", texture)
+    cache.put("b", make_texture("b"))
+    cache.pin("b")
+    cache.put("c", make_texture("c"))
+    cache.evict()
+
+    assert "a" in cache
+    assert "b" in cache
+    assert "c" not in cache
+
+    del texture
+    cache.unpin("b")
+    cache.evict()
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+def test_load_texture_uses_cache():
+    arcade.cleanup_texture_cache()
+    texture_cache = arcade.load_texture.texture_cache
+
+    texture = arcade.load_texture(GRASS)
+    assert arcade.load_texture(GRASS) is texture
+    assert texture_cache.hits == 1
+    assert (GRASS,) in texture_cache
+    assert arcade.load_texture(GRASS, flipped_horizontally=True) is not texture
+
+
+def test_path_and_string_share_cache_entry():
+    arcade.cleanup_texture_cache()
+    file_name = arcade.resources.resolve_resource_path(GRASS)
+
+    texture = arcade.load_texture(str(file_name))
+    assert arcade.load_texture(Path(file_name)) is texture
+    assert arcade.load_textures(Path(file_name), [[0, 0, 8, 8]])[0] is arcade.load_textures(str(file_name),
+                                                                                            [[0, 0, 8, 8]])[0]
+    assert len(arcade.load_texture.texture_cache) == 3
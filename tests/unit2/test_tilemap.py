@@ -116,3 +116,17 @@ def test_sprite_sheet():
     assert first_sprite.height == 16
     assert first_sprite.width == 16
 
+
+def test_tiles_with_same_gid_share_texture():
+    tmx_map = arcade.tilemap.read_tmx(":resources:tmx_maps/map_with_ladders.tmx")
+    platforms_list = arcade.tilemap.process_layer(tmx_map, "Platforms")
+
+    sprites_by_texture = {}
+    for sprite in platforms_list:
+        sprites_by_texture.setdefault(sprite.texture.name, []).append(sprite)
+    first_sprite, second_sprite = next(sprites for sprites in sprites_by_texture.values() if len(sprites) > 1)[:2]
+
+    assert first_sprite.texture is second_sprite.texture
+    assert first_sprite.get_hit_box() == second_sprite.get_hit_box()
+    assert first_sprite.properties == second_sprite.properties
+    assert first_sprite.properties is not second_sprite.properties
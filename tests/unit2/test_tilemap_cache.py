@@ -0,0 +1,22 @@
+from unittest.mock import patch
+
+import arcade
+
+
+def test_read_tmx_cache(tmp_path):
+    tmx_map = arcade.tilemap.read_tmx(":resources:tmx_maps/map_with_ladders.tmx", cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.tmxcache"))) == 1
+
+    with patch("pytiled_parser.parse_tile_map") as parse_tile_map:
+        cached_map = arcade.tilemap.read_tmx(":resources:tmx_maps/map_with_ladders.tmx",
+                                             cache_dir=tmp_path)
+    parse_tile_map.assert_not_called()
+
+    assert cached_map.map_size == tmx_map.map_size
+    assert [layer.name for layer in cached_map.layers] == [layer.name for layer in tmx_map.layers]
+    for layer_name in ["Platforms", "Ladders", "Background"]:
+        cached_layer = arcade.get_tilemap_layer(cached_map, layer_name)
+        assert cached_layer.layer_data == arcade.get_tilemap_layer(tmx_map, layer_name).layer_data
+    assert cached_map.tile_sets.keys() == tmx_map.tile_sets.keys()
+    platforms = arcade.tilemap.process_layer(cached_map, "Platforms")
+    assert len(platforms) == len(arcade.tilemap.process_layer(tmx_map, "Platforms"))
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+import arcade
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+MAP_NAME = ":resources:tmx_maps/map_with_ladders.tmx"
+
+
+@pytest.fixture(scope="module")
+def window():
+    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, "Test tile layer renderer")
+    yield window
+    window.close()
+
+
+def render(drawable):
+    arcade.start_render()
+    drawable.draw()
+    return np.array(arcade.get_image(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)).astype(int)
+
+
+def test_renderer_matches_sprites(window):
+    tmx_map = arcade.read_tmx(MAP_NAME)
+    arcade.set_background_color(arcade.color.BLACK)
+    arcade.set_viewport(100, 100 + SCREEN_WIDTH, -50, -50 + SCREEN_HEIGHT)
+
+    sprites_image = render(arcade.process_layer(tmx_map, "Platforms", 0.3))
+    renderer_image = render(arcade.TileLayerRenderer(tmx_map, "Platforms", 0.3))
+
+    assert sprites_image.any()
+    # Allow for a few pixels sampled differently at the tile edges
+    differences = np.abs(sprites_image - renderer_image).max(axis=2) > 8
+    assert differences.mean() < 0.01
+
+
+def test_renderer_needs_uniform_tiles():
+    tmx_map = arcade.read_tmx(MAP_NAME)
+    tmx_map.tile_size = arcade.tilemap.pytiled_parser.objects.Size(64, 64)
+    with pytest.raises(ValueError):
+        arcade.TileLayerRenderer(tmx_map, "Platforms")
@@ -0,0 +1,42 @@
+import arcade
+
+MAP_NAME = ":resources:tmx_maps/map_with_ladders.tmx"
+
+
+def sprite_positions(sprite_list):
+    return sorted((sprite.center_x, sprite.center_y, sprite.texture.name) for sprite in sprite_list)
+
+
+def test_streaming_loads_whole_layer():
+    tmx_map = arcade.read_tmx(MAP_NAME)
+    layer = arcade.StreamingTileLayer(tmx_map, "Platforms", chunk_size=4, load_radius=10000)
+    layer.update(0, 0)
+    layer.wait()
+
+    assert sprite_positions(layer.sprite_list) == sprite_positions(arcade.process_layer(tmx_map, "Platforms"))
+
+
+def test_streaming_loads_around_focus_point():
+    tmx_map = arcade.read_tmx(MAP_NAME)
+    # map_with_ladders is 20x17 tiles of 128 pixels
+    layer = arcade.StreamingTileLayer(tmx_map, "Platforms", chunk_size=4,
+                                      load_radius=600, hysteresis=300, threaded=False)
+
+    layer.update(0, 0)
+    near_origin = layer.loaded_chunks
+    assert (0, 4) in near_origin
+    assert (4, 0) not in near_origin
+    for sprite in layer.sprite_list:
+        assert sprite.center_x < 2048 and sprite.center_y < 1600
+
+    # Just past the load radius of chunk (0, 4), but within the hysteresis
+    layer.update(1200, 0)
+    assert (0, 4) in layer.loaded_chunks
+
+    layer.update(2560, 2176)
+    assert (0, 4) not in layer.loaded_chunks
+    assert (4, 0) in layer.loaded_chunks
+
+    # The spatial hash follows the loaded chunks
+    for sprite in layer.sprite_list:
+        assert sprite in arcade.get_sprites_at_point(sprite.position, layer.sprite_list)